@@ -7,6 +7,7 @@ in a folder with the following files:
     app.py      (the primary controller class)
     level.py    (the subcontroller for a single game level)
     models.py   (the model classes)
+    simulation.py (the headless simulation of a level)
     consts.py   (the application constants)
 
 In addition, you should have the following subfolders
@@ -21,9 +22,13 @@ Moving any of these folders or files will prevent the game from working properly
 Author: Walker M. White (wmw2)
 Date:   November 1, 2020
 """
+import sys
+import consts
+consts.readArguments(sys.argv)
+
 from consts import *
 from app import *
 
 # Application code
 if __name__ == '__main__':
-    Froggit(width=GAME_WIDTH,height=GAME_HEIGHT).run()
+    Froggit(width=GAME_WIDTH,height=GAME_HEIGHT,step=SIMULATION_STEP).run()
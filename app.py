@@ -12,9 +12,9 @@ unsure about where a new class should go, post a question on Piazza.
 from consts import *
 from game2d import *
 from level import *
-import introcs
-
-from kivy.logger import Logger
+from levelfile import readLevel
+from schema import validateLevel
+import os.path
 
 # PRIMARY RULE: Froggit can only access attributes in level.py via getters/setters
 # Froggit is NOT allowed to access anything in lanes.py or models.py.
@@ -69,6 +69,12 @@ class Froggit(GameApp):
     # LIST MORE ATTRIBUTES (AND THEIR INVARIANTS) HERE IF NECESSARY
     # Attribute _lastkeys: The number of keys pressed last frame
     # Invariant: _lastkeys: is an int >= 0
+    #
+    # Attribute _banners: The message banners made for this window size, by text
+    # Invariant: _banners is a dictionary from strings to GLabel objects
+    #
+    # Attribute _data: The level to play and its object data, read at start
+    # Invariant: _data is a pair (json,object) of dictionaries for a valid level
 
     # DO NOT MAKE A NEW INITIALIZER!
 
@@ -77,9 +83,14 @@ class Froggit(GameApp):
         """
         Initializes the application.
         """
+        # Decode the images of the level on a thread pool, and pack them into an atlas
+        self._data = self._readLevel()
+        self.load_atlas(levelImages(self._data[0]))
+
         self._state = STATE_INACTIVE
         self._level = None
         self._lastkeys = 0
+        self._banners = {}
         self._title = GLabel(text='FROGGIT',linecolor='dark green',
                             font_name=ALLOY_FONT,font_size=ALLOY_LARGE,
                             x=self.width/2,y=self.height/2)
@@ -107,9 +118,9 @@ class Froggit(GameApp):
 
         # draw objects
         if self._state == STATE_LOADING:
-            d = self.load_json(DEFAULT_LEVEL)
-            object = self.load_json(OBJECT_DATA)
+            (d,object) = self._data
             self._resizeWindow(d)
+            self._banners = {}
             self._level = Level(d,object)
             # print(self._state)
             # print(self._level)
@@ -120,20 +131,11 @@ class Froggit(GameApp):
 
         if self._state == STATE_PAUSED:
             # print(self._state)
-            h = self.height-GRID_SIZE
-            self._text = GLabel(text="Press 'C' to Continue",
-                        fillcolor='dark green',linecolor='white',
-                        font_name=ALLOY_FONT,font_size=ALLOY_SMALL,
-                        x=self.width/2,y=h/2,width=self.width,height=GRID_SIZE)
+            self._text = self._getBanner("Press 'C' to Continue")
 
         if self._state == STATE_CONTINUE:
-            # frog initial position
-            d = self.load_json(DEFAULT_LEVEL)
-            object = self.load_json(OBJECT_DATA)
-            x = d['start'][0]
-            y = d['start'][1]
             # reset frog to initial position
-            self._level.setFrog(x,y,object)
+            self._level.resetFrog()
             self._state = STATE_ACTIVE
 
     def draw(self):
@@ -145,7 +147,11 @@ class Froggit(GameApp):
             self._text.draw(self.view)
 
         if not self._level == None:
-            self._level.draw(self.view)
+            # only an active level is updated, so only it is between updates
+            if self._state == STATE_ACTIVE:
+                self._level.draw(self.view,self.interpolation)
+            else:
+                self._level.draw(self.view)
 
         if self._state == STATE_PAUSED:
             # print('draw')
@@ -191,23 +197,47 @@ class Froggit(GameApp):
         self._level.update(self.input,dt)
         if self._level.detectLives():
             self._state = STATE_COMPLETE
-            h = self.height-GRID_SIZE
-            self._text = GLabel(text="YOU DIED",
-                        fillcolor='dark green',linecolor='white',
-                        font_name=ALLOY_FONT,font_size=ALLOY_SMALL,
-                        x=self.width/2,y=h/2,width=self.width,
-                        height=GRID_SIZE)
+            self._text = self._getBanner("YOU DIED")
         elif self._level.getFrog() == None:
             if self._level.getExit():
                 self._state = STATE_COMPLETE
-                h = self.height-GRID_SIZE
-                self._text = GLabel(text="YOU WIN",fillcolor='dark green',
-                            linecolor='white',font_name=ALLOY_FONT,
-                            font_size=ALLOY_SMALL,x=self.width/2,y=h/2,
-                            width=self.width,height=GRID_SIZE)
+                self._text = self._getBanner("YOU WIN")
             else:
                 self._state = STATE_PAUSED
 
+    def _readLevel(self):
+        """
+        Returns: The pair (json,object) of dictionaries for the level DEFAULT_LEVEL
+
+        The level may be a JSON file or a compiled level (see levelfile.py).  Every
+        problem with a JSON level is reported now, not deep inside Level.
+        """
+        if DEFAULT_LEVEL.lower().endswith(LEVEL_SUFFIX):
+            return readLevel(os.path.join(self.json,DEFAULT_LEVEL))
+
+        d = self.load_json(DEFAULT_LEVEL)
+        object = self.load_json(OBJECT_DATA)
+        validateLevel(d,object)
+        return (d,object)
+
+    def _getBanner(self,text):
+        """
+        Returns: The banner across the middle of the level with the given message
+
+        A banner is only made once for each message (and window size).  After that,
+        the same banner is shown whenever the message is displayed.
+
+        Parameter text: The message to display
+        Precondition: text is a string
+        """
+        if not text in self._banners:
+            h = self.height-GRID_SIZE
+            self._banners[text] = GLabel(text=text,fillcolor='dark green',
+                                linecolor='white',font_name=ALLOY_FONT,
+                                font_size=ALLOY_SMALL,x=self.width/2,y=h/2,
+                                width=self.width,height=GRID_SIZE)
+        return self._banners[text]
+
     def _resizeWindow(self,d):
         """
         Resizes the window for each level.
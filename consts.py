@@ -9,8 +9,6 @@ access them.
 # YOUR NAME AND NETID HERE
 # DATE COMPLETED HERE
 """
-import introcs
-import sys
 
 ### WINDOW CONSTANTS (all coordinates are in pixels) ###
 
@@ -28,6 +26,8 @@ GRID_SIZE    = 64
 FROG_IMAGE  = 'frog1.png'
 # The number of seconds that frog movement takes
 FROG_SPEED  = 0.25
+# The sprite frame of a hop, over equal parts of the hop (the frog crouches, leaps, lands)
+FROG_HOP_FRAMES = (4,3,3,2,2,1,1,0)
 # The image file for a frog that made it to safety
 FROG_SAFE   = 'safe.png'
 # The image file for a frog life
@@ -86,6 +86,8 @@ CROAK_SOUND = 'croak.wav'
 SPLAT_SOUND = 'splat.wav'
 # The succes sound
 TRILL_SOUND = 'trill.wav'
+# The number of times each sound can play at once
+SOUND_VOICES = 3
 
 
 ### JSON FILES ###
@@ -94,36 +96,82 @@ TRILL_SOUND = 'trill.wav'
 DEFAULT_LEVEL  = 'easy2.json'
 # The object data (hitboxes) file
 OBJECT_DATA    = 'objects.json'
+# The suffix of a compiled level file (see levelfile.py)
+LEVEL_SUFFIX   = '.flv'
+# The lane types of a level.  A compiled level stores the index of each lane type in
+# this tuple, so new types may only be added at the end
+LANE_TYPES     = ('grass','road','water','hedge')
 
 
 ### USE COMMAND LINE ARGUMENTS TO CHANGE DEFAULT LEVEL FILE AND FROG SPEED
-"""
-sys.argv is a list of the command line arguments when you run python. These arguments are
-everything after the word python. So if you start the game typing
+def readArguments(args):
+    """
+    Changes DEFAULT_LEVEL and FROG_SPEED to the values in the command line arguments.
+
+    sys.argv is a list of the command line arguments when you run python. These
+    arguments are everything after the word python. So if you start the game typing
+
+        python froggit default.json 1
+
+    Python puts ['froggit', 'default.json', '1'] into sys.argv. The game (__main__.py)
+    calls this function with sys.argv to change the constant DEFAULT_LEVEL. This is the
+    level file to be used when you start the game.
+
+    The second argument is the FROG_SPEED, which is the amount of time between move
+    steps. A large value means a much slower moving frog.
+
+    Only the game reads its arguments this way.  The other scripts (levelfile.py,
+    playtest.py and solver.py) have arguments of their own, and importing this module
+    does not change any constants.  This function must be called before the modules
+    that use these constants are imported.
+
+    Parameter args: the command line arguments
+    Precondition: args is a list of strings (such as sys.argv)
+    """
+    global DEFAULT_LEVEL, FROG_SPEED
+    try:
+        file = args[1]
+        if file[-5:].lower() == '.json' or file[-4:].lower() == LEVEL_SUFFIX:
+            DEFAULT_LEVEL = file
+        else:
+            DEFAULT_LEVEL = file+'.json'
+    except:
+        pass # Use original value
+
+    try:
+        value = float(args[2])
+        FROG_SPEED = value
+    except:
+        pass # Use original value
 
-    python froggit default.json 1
 
-Python puts ['froggit', 'default.json', '1'] into sys.argv. Below, we take advantage of
-this fact to change the constant DEFAULT_LEVEL. This is the level file to be used when
-you start the game.
+### ADD MORE CONSTANTS (PROPERLY COMMENTED) AS NECESSARY ###
 
-The second argument is the FROG_SPEED, which is the amount of time between move steps.
-A large value means a much slower moving frog.
-"""
-try:
-    file = sys.argv[1]
-    if file[-5:].lower() == '.json':
-        DEFAULT_LEVEL = file
-    else:
-        DEFAULT_LEVEL = file+'.json'
-except:
-    pass # Use original value
-
-try:
-    value = float(sys.argv[2])
-    FROG_SPEED = value
-except:
-    pass # Use original value
 
+### SIMULATION CONSTANTS ###
 
-### ADD MORE CONSTANTS (PROPERLY COMMENTED) AS NECESSARY ###
+# The number of obstacles at which a lane keeps their positions in a NumPy array
+LANE_ARRAY_SIZE = 32
+
+# The fixed time step of the simulation (in seconds)
+SIMULATION_STEP = 1/120
+
+# The keys pressed by each action of a VecLevel (action 0 presses no key)
+VEC_ACTIONS = (None,'up','down','left','right')
+
+# The causes of death counted by a VecLevel (the columns of VecLevel.getDeaths)
+DEATH_ROAD      = 0
+DEATH_WATER     = 1
+DEATH_OFFSCREEN = 2
+
+# The longest time (in seconds) that a seeded VecLevel runs its lanes before play
+VEC_WARMUP = 10
+
+# The longest time (in seconds of wall clock) that the solver searches a level
+SOLVER_BUDGET = 300
+
+# The time (in seconds) between the moves that the solver tries
+SOLVER_TICK = 0.05
+
+# The distance (in pixels) within which the solver treats two frogs as in the same place
+SOLVER_PRECISION = 4
@@ -4,14 +4,49 @@ A module to support simple 2D game development.
 This module is a simple wrapper around Kivy interfaces to make 2D game development
 simpler for students in CS 1110.
 
+The classes are imported the first time they are used, not when this package is
+imported.  Hence a tool that only needs a few classes does not load the rest of Kivy,
+and the window and audio device are only opened once a :class:`GameApp` runs.
+
 Author: Walker M. White (wmw2)
 Date:   August 1, 2017 (Python 3 version)
 """
-from .gobject import GObject, GScene
-from .grectangle import GRectangle, GEllipse, GImage, GLabel
-from .gsprite import GSprite
-from .gtile import GTile
-from .gpath import GPath, GTriangle, GPolygon
-from .gview import GInput, GView
-from .sound import Sound, SoundLibrary
-from .app import GameApp
\ No newline at end of file
+import importlib
+
+# The module that defines each class of this package
+_MODULES = {
+    'GObject':'gobject', 'GScene':'gobject',
+    'GRectangle':'grectangle', 'GEllipse':'grectangle', 'GImage':'grectangle',
+    'GLabel':'grectangle',
+    'GSprite':'gsprite',
+    'GTile':'gtile',
+    'GBatch':'gbatch',
+    'GText':'gtext',
+    'GPath':'gpath', 'GTriangle':'gpath', 'GPolygon':'gpath',
+    'GInput':'gview', 'GView':'gview',
+    'Sound':'sound', 'SoundLibrary':'sound',
+    'GameApp':'app',
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name):
+    """
+    Returns: The class with the given name, importing its module if necessary
+
+    :param name: The class name
+    :type name:  ``str``
+    """
+    if not name in _MODULES:
+        raise AttributeError('module %s has no attribute %s' % (repr(__name__),repr(name)))
+    value = getattr(importlib.import_module('.'+_MODULES[name],__name__),name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """
+    Returns: The names in this package, including the classes not imported yet
+    """
+    return sorted(set(globals()) | set(__all__))
@@ -11,10 +11,9 @@ Date:   August 1, 2017 (Python 3 version)
 import kivy
 import kivy.app
 
-# Lower-level kivy modules to support animation
+# Lower-level kivy modules to support animation (the window is opened on first use)
 from kivy.config import Config
 from kivy.clock  import Clock
-from kivy.core.window import Window
 from kivy.logger import Logger
 
 import traceback
@@ -48,6 +47,39 @@ class GameApp(kivy.app.App):
     # Class attribute for tracking textures (to reduce memory footprint)
     TEXTURE_CACHE = {}
     
+    # Class attribute for tracking the frames of sprite sheets (to avoid slicing them twice)
+    REGION_CACHE = {}
+    
+    # Class attribute for tracking rendered text (to avoid rasterizing it twice)
+    TEXT_CACHE = {}
+    
+    # Class attribute for the most strings kept in the text cache
+    TEXT_LIMIT = 256
+    
+    # Class attribute for tracking loaded sounds (a list of voices for each file)
+    SOUND_CACHE = {}
+    
+    # Class attribute for the most voices that can play at the same time
+    VOICE_LIMIT = 16
+    
+    # Class attribute for the number of voices playing (kept up to date by each voice)
+    VOICE_COUNT = 0
+    
+    # Class attribute for tracking glyph atlases (one for each font, size and weight)
+    GLYPH_CACHE = {}
+    
+    # Class attribute for the characters in a glyph atlas
+    GLYPHS = ''.join(map(chr,range(32,127)))
+    
+    # Class attribute for tracking parsed JSON files (to avoid reading them twice)
+    JSON_CACHE = {}
+    
+    # Class attribute for the width and height limit of a texture atlas
+    ATLAS_SIZE = 2048
+    
+    # Class attribute for the most updates in one animation frame (with a fixed step)
+    STEP_LIMIT = 8
+    
     
     # MUTABLE ATTRIBUTES
     @property
@@ -71,6 +103,32 @@ class GameApp(kivy.app.App):
         self._fps = value
         Clock.schedule_interval(self._refresh,1.0/self._fps)
     
+    @property
+    def step(self):
+        """
+        The fixed time step of the game, in seconds
+        
+        If this value is None (the default), the method ``update`` is called once every
+        animation frame with the time since the last frame.  Otherwise, ``update`` is
+        always called with this time step, as many times as it takes to keep up with
+        the clock.  That may be several times in one animation frame or none at all,
+        but never more than ``STEP_LIMIT`` times.  This makes the game deterministic,
+        and a long pause can no longer move objects a large distance in one update.
+        
+        Use the attribute ``interpolation`` in ``draw`` to smooth out the motion 
+        between updates.
+        
+        **Invariant**: Must be None or an int or float > 0.
+        """
+        return self._step
+    
+    @step.setter
+    def step(self,value):
+        assert value is None or type(value) in [int,float], 'value %s is not a number' % repr(value)
+        assert value is None or value > 0, 'value %s is not positive' % repr(value)
+        self._step = value
+        self._accum = 0.0
+    
     @property
     def width(self):
         """
@@ -85,6 +143,7 @@ class GameApp(kivy.app.App):
         assert type(value) in [int,float], 'value %s is not a number' % repr(value)
         assert value > 0, 'value %s is not positive' % repr(value)
         self._gwidth = value
+        from kivy.core.window import Window
         Window.size = (round(self._gwidth), round(self._gheight))
     
     @property
@@ -101,10 +160,27 @@ class GameApp(kivy.app.App):
         assert type(value) in [int,float], 'value %s is not a number' % repr(value)
         assert value > 0, 'value %s is not positive' % repr(value)
         self._gheight = value
+        from kivy.core.window import Window
         Window.size = (round(self._gwidth), round(self._gheight))
     
     
     # IMMUTABLE PROPERTIES
+    @property
+    def interpolation(self):
+        """
+        The fraction of a time step that has passed since the last update.
+        
+        When ``step`` is not None, the game state is usually a little behind the clock
+        when it is drawn.  To draw smooth motion, draw each object this fraction of the
+        way from its position before the last update to its position after it.  If 
+        ``step`` is None, this value is always 1.
+        
+        **Invariant**: Must be a float in 0..1.
+        """
+        if self._step is None:
+            return 1.0
+        return self._accum/self._step
+    
     @property
     def view(self):
         """
@@ -235,6 +311,68 @@ class GameApp(kivy.app.App):
         
         return texture
     
+    @classmethod
+    def load_sound(cls,name,voices=1):
+        """
+        Returns: A list of at least ``voices`` playable sounds for the given file, or 
+        None if it cannot be loaded
+        
+        The ``name`` must refer to a file in the **Sounds** folder.  Each sound in the
+        list is a voice: a Kivy sound that can play the file on its own, so that the
+        file can be heard several times at once.  The voices are cached, and a file is
+        only decoded again if more voices are asked for than it has.  Hence a game can
+        make new :class:`Sound` objects (e.g. for every level) without decoding any
+        audio.
+        
+        :param name: The file name
+        :type name:  ``str``
+        
+        :param voices: The number of voices
+        :type voices:  ``int`` > 0
+        """
+        if not cls.is_sound(name):
+            Logger.info('GameApp: No sound file named %s.' % repr(name))
+            return None
+        
+        result = cls.SOUND_CACHE.setdefault(name,[])
+        if len(result) < voices:
+            from kivy.core.audio import SoundLoader
+            while len(result) < voices:
+                sound = SoundLoader.load(name)
+                if sound is None:
+                    Logger.info('GameApp: Sound %s is not properly formatted.' % repr(name))
+                    return result if result else None
+                sound.bind(state=cls._track_voice)
+                result.append(sound)
+        return result
+    
+    @classmethod
+    def count_voices(cls):
+        """
+        Returns: The number of voices (from :meth:`load_sound`) that are playing
+        
+        This is a running count, updated whenever a voice starts or stops (even when it 
+        stops at the end of the file).  So it takes the same time however many sounds
+        are loaded.
+        """
+        return cls.VOICE_COUNT
+    
+    @classmethod
+    def _track_voice(cls,sound,state):
+        """
+        Updates the running count of playing voices when ``sound`` changes state.
+        
+        Kivy only calls this method when the state actually changes, so every start is
+        matched by exactly one stop.
+        
+        :param sound: The voice that changed state
+        :type sound:  Kivy ``Sound``
+        
+        :param state: The new state of the voice
+        :type state:  one of 'play' or 'stop'
+        """
+        cls.VOICE_COUNT += 1 if state == 'play' else -1
+    
     @classmethod
     def unload_texture(cls,name):
         """
@@ -248,6 +386,7 @@ class GameApp(kivy.app.App):
         :type name:  ``str``
         """
         assert type(name) == str, '%s is not a valid texture name' % repr(name)
+        cls._forget_regions(name)
         if name in cls.TEXTURE_CACHE:
             texture = cls.TEXTURE_CACHE[name]
             del cls.TEXTURE_CACHE[name]
@@ -255,13 +394,304 @@ class GameApp(kivy.app.App):
         
         return None
     
+    @classmethod
+    def load_text(cls,text,font_name=None,font_size=15,bold=False,color=(1,1,1,1),halign='center',
+                  options=None):
+        """
+        Returns: The texture with the given text rendered in it, or None if the text is empty
+        
+        The text is rasterized by the Kivy text provider, with the text color baked in.
+        The texture is cached, so drawing the same text in the same font, size and color
+        again does not rasterize it again.  Only the ``TEXT_LIMIT`` most recently used
+        strings are kept in the cache.
+        
+        :param text: The text to render
+        :type text:  ``str``
+        
+        :param font_name: The .ttf file in the **Fonts** folder (None for the default font)
+        :type font_name:  ``str`` or ``None``
+        
+        :param font_size: The font size in points
+        :type font_size:  ``int`` or ``float`` > 0
+        
+        :param bold: Whether the text is bold (only for the default font)
+        :type bold:  ``bool``
+        
+        :param color: The text color
+        :type color:  4-element ``tuple`` of floats between 0 and 1
+        
+        :param halign: The alignment of the lines of the text
+        :type halign:  one of 'left', 'right', or 'center'
+        
+        :param options: Other options for the Kivy text renderer (e.g. ``italic`` or
+            ``markup``, see ``GLabel.TEXT_OPTIONS``)
+        :type options:  ``dict`` or ``None``
+        """
+        if text == '':
+            return None
+        
+        extra = ()
+        if options:
+            extra = tuple(sorted((k,tuple(v) if type(v) == list else v) for (k,v) in options.items()))
+        key = (text,font_name,font_size,bold,tuple(color),halign,extra)
+        if key in cls.TEXT_CACHE:
+            # Move the text to the end, as the most recently used
+            texture = cls.TEXT_CACHE.pop(key)
+            cls.TEXT_CACHE[key] = texture
+            return texture
+        
+        if options and options.get('markup'):
+            from kivy.core.text.markup import MarkupLabel as Label
+        else:
+            from kivy.core.text import Label
+        settings = dict(options) if options else {}
+        settings.pop('markup',None)
+        settings.update({'text':text,'font_size':font_size,'bold':bold,'color':tuple(color),
+                         'halign':halign})
+        if not font_name is None:
+            settings['font_name'] = font_name
+        label = Label(**settings)
+        label.refresh()
+        texture = label.texture
+        
+        while len(cls.TEXT_CACHE) >= cls.TEXT_LIMIT:
+            del cls.TEXT_CACHE[next(iter(cls.TEXT_CACHE))]
+        cls.TEXT_CACHE[key] = texture
+        return texture
+    
+    @classmethod
+    def load_glyphs(cls,font_name=None,font_size=15,bold=False):
+        """
+        Returns: The glyph atlas of the given font as a pair (texture, glyphs)
+        
+        Every character in ``GLYPHS`` is rasterized once (in white, so it can be tinted
+        by a color) and packed into a single texture.  The dictionary ``glyphs`` maps 
+        each character to a triple (width, height, coords), where width is the advance 
+        of the character, height is the line height of the font, and coords are the 
+        texture coordinates of the glyph as an 8-element tuple.  The atlas is cached, 
+        so each font, size and weight is only rasterized once.
+        
+        :param font_name: The .ttf file in the **Fonts** folder (None for the default font)
+        :type font_name:  ``str`` or ``None``
+        
+        :param font_size: The font size in points
+        :type font_size:  ``int`` or ``float`` > 0
+        
+        :param bold: Whether the text is bold (only for the default font)
+        :type bold:  ``bool``
+        """
+        key = (font_name,font_size,bold)
+        if key in cls.GLYPH_CACHE:
+            return cls.GLYPH_CACHE[key]
+        
+        from kivy.core.text import Label
+        from kivy.graphics.texture import Texture
+        options = {'font_size':font_size,'bold':bold,'color':(1,1,1,1)}
+        if not font_name is None:
+            options['font_name'] = font_name
+        
+        # Rasterize each glyph on its own (a blank glyph has no pixels)
+        images = []
+        for char in cls.GLYPHS:
+            label = Label(text=char,**options)
+            label.refresh()
+            (width,height) = label.size
+            pixels = None
+            if label.texture.width > 1 and label.texture.height > 1:
+                texture = label.texture
+                pixels = numpy.frombuffer(texture.pixels,dtype=numpy.uint8)
+                pixels = pixels.reshape(texture.height,texture.width,4)
+            images.append((char,width,height,pixels))
+        
+        # Pack the glyphs in rows, leaving a one pixel border around each one
+        lineh = max(1,max(item[2] for item in images))
+        slots = []
+        x = y = 0
+        for (char,width,height,pixels) in images:
+            if x+width+2 > cls.ATLAS_SIZE:
+                x = 0
+                y += lineh+2
+            slots.append((x+1,y+1))
+            x += width+2
+        
+        page = numpy.zeros((y+lineh+2,cls.ATLAS_SIZE,4),dtype=numpy.uint8)
+        for pos in range(len(images)):
+            pixels = images[pos][3]
+            if not pixels is None:
+                (x,y) = slots[pos]
+                (h,w) = pixels.shape[:2]
+                page[y:y+h,x:x+w] = pixels
+        
+        texture = Texture.create(size=(cls.ATLAS_SIZE,len(page)),colorfmt='rgba')
+        texture.blit_buffer(page.tobytes(),colorfmt='rgba',bufferfmt='ubyte')
+        texture.flip_vertical()
+        glyphs = {}
+        for pos in range(len(images)):
+            (char,width,height,pixels) = images[pos]
+            (x,y) = slots[pos]
+            region = texture.get_region(x,len(page)-y-lineh,max(width,1),lineh)
+            glyphs[char] = (width,lineh,tuple(region.tex_coords))
+        
+        cls.GLYPH_CACHE[key] = (texture,glyphs)
+        return cls.GLYPH_CACHE[key]
+    
+    @classmethod
+    def load_regions(cls,name,format):
+        """
+        Returns: The texture coordinates of each frame of a sprite sheet, or None if the
+        texture cannot be loaded
+        
+        The sheet is divided into a grid of frames with the given format (rows, columns),
+        and the frames are listed left-to-right, top-to-bottom.  The coordinates of a
+        frame are an 8-element tuple in the texture of the whole sheet (see
+        :meth:`load_texture`), as used by the ``tex_coords`` of a Kivy rectangle.  The
+        coordinates are cached, so every sprite with the same sheet and format shares
+        them.
+        
+        :param name: The file name
+        :type name:  ``str``
+        
+        :param format: The grid size of the sheet as (rows, columns)
+        :type format:  2-element ``tuple`` of ``int`` > 0
+        """
+        key = (name,tuple(format))
+        if key in cls.REGION_CACHE:
+            return cls.REGION_CACHE[key]
+        
+        texture = cls.load_texture(name)
+        if texture is None:
+            return None
+        
+        (rows,cols) = key[1]
+        width  = texture.width/cols
+        height = texture.height/rows
+        coords = []
+        ty = 0
+        for row in range(rows):
+            tx = 0
+            for col in range(cols):
+                region = texture.get_region(int(tx),texture.height-int(ty)-int(height),int(width),int(height))
+                coords.append(tuple(region.tex_coords))
+                tx += width
+            ty += height
+        
+        cls.REGION_CACHE[key] = tuple(coords)
+        return cls.REGION_CACHE[key]
+    
+    @classmethod
+    def decode_images(cls,names,workers=None):
+        """
+        Returns: A dictionary with the pixels of each of the given image files
+        
+        The pixels of an image are a numpy array as returned by :meth:`_decode_image`, 
+        or None if the file is not an image in the **Images** folder or cannot be 
+        decoded.  The files are read and decoded on a pool of threads, since decoding
+        a PNG does not hold the Python interpreter.  Nothing is uploaded to the GPU, 
+        so this method can be called before the window is ready (e.g. while a level
+        loads).
+        
+        :param names: The file names
+        :type names:  ``list`` of ``str``
+        
+        :param workers: The number of threads (None for one per core, up to 8)
+        :type workers:  ``int`` > 0 or ``None``
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        names = list(names)
+        if workers is None:
+            workers = min(8,os.cpu_count() or 1)
+        
+        def decode(name):
+            return cls._decode_image(name) if cls.is_image(name) else None
+        
+        if len(names) < 2 or workers < 2:
+            return {name:decode(name) for name in names}
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return dict(zip(names,pool.map(decode,names)))
+    
+    @classmethod
+    def load_atlas(cls,names=None):
+        """
+        Returns: The list of atlas textures that the images were packed into
+        
+        An atlas is a large texture containing several images, so that drawing them
+        does not require a texture switch.  Every packed image is put in the texture
+        cache as a region of its atlas.  Hence :meth:`load_texture` (and so every
+        :class:`GImage`, :class:`GSprite` and :class:`GTile`) will use the atlas 
+        once it is loaded.  Images that are larger than ``ATLAS_SIZE`` or have an 
+        unsupported pixel format are not packed, and are loaded on their own.
+        
+        The ``names`` must refer to files in the **Images** folder.  If it is None,
+        every file in that folder is packed.  The images are decoded on a pool of 
+        threads (see :meth:`decode_images`), and only the upload of the atlas runs on
+        the calling thread.
+        
+        :param names: The file names
+        :type names:  ``list`` of ``str`` or ``None``
+        """
+        from kivy.graphics.texture import Texture
+        if names is None:
+            names = sorted(os.listdir(cls.images))
+        
+        images = []
+        decoded = cls.decode_images(names)
+        for name in names:
+            pixels = decoded[name]
+            if not pixels is None and max(pixels.shape[:2])+2 <= cls.ATLAS_SIZE:
+                images.append((name,pixels))
+        images.sort(key=lambda item: -item[1].shape[0])
+        
+        # Pack the images on shelves, leaving a one pixel border around each one
+        pages = []
+        slots = []
+        x = y = shelf = 0
+        for (name,pixels) in images:
+            (height,width) = pixels.shape[:2]
+            if x+width+2 > cls.ATLAS_SIZE:
+                x = 0
+                y += shelf
+                shelf = 0
+            if y+height+2 > cls.ATLAS_SIZE:
+                pages.append((slots,y+shelf))
+                slots = []
+                x = y = shelf = 0
+            slots.append((name,pixels,x+1,y+1))
+            x += width+2
+            shelf = max(shelf,height+2)
+        if slots:
+            pages.append((slots,y+shelf))
+        
+        atlases = []
+        for (slots,height) in pages:
+            page = numpy.zeros((height,cls.ATLAS_SIZE,4),dtype=numpy.uint8)
+            for (name,pixels,x,y) in slots:
+                (h,w) = pixels.shape[:2]
+                page[y:y+h,x:x+w] = pixels
+                # Repeat the edges into the border so filtering does not bleed
+                page[y-1,x:x+w] = pixels[0]
+                page[y+h,x:x+w] = pixels[-1]
+                page[y-1:y+h+1,x-1] = page[y-1:y+h+1,x]
+                page[y-1:y+h+1,x+w] = page[y-1:y+h+1,x+w-1]
+            
+            texture = Texture.create(size=(cls.ATLAS_SIZE,height),colorfmt='rgba')
+            texture.blit_buffer(page.tobytes(),colorfmt='rgba',bufferfmt='ubyte')
+            texture.flip_vertical()
+            for (name,pixels,x,y) in slots:
+                (h,w) = pixels.shape[:2]
+                cls._forget_regions(name)
+                cls.TEXTURE_CACHE[name] = texture.get_region(x,height-y-h,w,h)
+            atlases.append(texture)
+        return atlases
+    
     @classmethod
     def load_json(cls,name):
         """
         Returns: The JSON for the given file name, or None if it cannot be loaded
         
         The ``name`` must refer to the file in the **JSON** folder.  If the file is
-        not there, it will return None.
+        not there, it will return None.  If the file has already been loaded, and it
+        has not been modified since, it will return the cached data.  This data is
+        shared by every caller, so it should not be modified.
         
         :param name: The file name
         :type name:  ``str``
@@ -270,8 +700,13 @@ class GameApp(kivy.app.App):
             Logger.info('GameApp: No json file named %s.' % repr(name))
             return None
         
+        path  = os.path.join(cls.json,name)
+        mtime = os.stat(path).st_mtime_ns
+        if name in cls.JSON_CACHE and cls.JSON_CACHE[name][0] == mtime:
+            return cls.JSON_CACHE[name][1]
+        
         data = None
-        with open(os.path.join(cls.json,name)) as f: 
+        with open(path) as f: 
             data = f.read()
         
         if not data is None:
@@ -283,6 +718,9 @@ class GameApp(kivy.app.App):
                 items = traceback.format_exception(exc_type, exc_value, exc_tb)
                 Logger.info(items[-1].strip())
                 data = None
+        
+        if not data is None:
+            cls.JSON_CACHE[name] = (mtime,data)
         return data
     
     # BUILT-IN METHODS
@@ -309,6 +747,7 @@ class GameApp(kivy.app.App):
         w = keywords.pop('width', 0.0)
         h = keywords.pop('height', 0.0)
         f = keywords.pop('fps', 60.0)
+        s = keywords.pop('step', None)
         
         assert type(w) in [int,float], 'width %s is not a number' % repr(w)
         assert type(h) in [int,float], 'height %s is not a number' % repr(h)
@@ -317,9 +756,11 @@ class GameApp(kivy.app.App):
         
         self._gwidth = w
         self._gheight = h
+        from kivy.core.window import Window
         Window.size = (self.width,self.height)
         
         self._fps = f
+        self.step = s
         
         x = keywords.pop('left', None)
         y = keywords.pop('top', None)
@@ -423,6 +864,59 @@ class GameApp(kivy.app.App):
     
     
     # HIDDEN METHODS
+    @classmethod
+    def _decode_image(cls,name):
+        """
+        Returns: The pixels of the given image file, or None if it cannot be decoded
+        
+        The pixels are a numpy array of shape (height,width,4) holding RGBA bytes,
+        with the top row of the image first.  The image is decoded, but it is not 
+        uploaded as a texture.
+        
+        :param name: The file name
+        :type name:  ``str``
+        """
+        try:
+            from kivy.core.image import Image
+            data = Image(name,keep_data=True).image._data[0]
+        except:
+            Logger.info('GameApp: Image %s is not properly formatted.' % repr(name))
+            return None
+        
+        if data.fmt in ['rgba','bgra']:
+            size = 4
+        elif data.fmt in ['rgb','bgr']:
+            size = 3
+        else:
+            return None
+        
+        width  = data.width
+        height = data.height
+        stride = data.rowlength if data.rowlength else width*size
+        pixels = numpy.frombuffer(data.data,dtype=numpy.uint8)[:stride*height]
+        pixels = pixels.reshape(height,stride)[:,:width*size].reshape(height,width,size)
+        if data.fmt[0] == 'b':
+            pixels = pixels[:,:,[2,1,0]+[3]*(size-3)]
+        if size == 3:
+            alpha  = numpy.full((height,width,1),255,dtype=numpy.uint8)
+            pixels = numpy.concatenate((pixels,alpha),axis=2)
+        if not data.flip_vertical:
+            pixels = pixels[::-1]
+        return pixels
+    
+    @classmethod
+    def _forget_regions(cls,name):
+        """
+        Removes the cached frames of the given sprite sheet, for every format.
+        
+        The frames must be sliced again whenever the texture of the sheet changes.
+        
+        :param name: The file name
+        :type name:  ``str``
+        """
+        for key in [key for key in cls.REGION_CACHE if key[0] == name]:
+            del cls.REGION_CACHE[key]
+    
     def _bootstrap(self,dt):
         """
         Bootstraps the clock scheduler for the game..
@@ -447,9 +941,17 @@ class GameApp(kivy.app.App):
         :type dt:  ``int`` or ``float``
         """
         self.view.clear()
-        self.update(dt)
+        if self._step is None:
+            self.update(dt)
+            self.input.refresh()
+        else:
+            self._accum = min(self._accum+dt,self._step*self.STEP_LIMIT)
+            while self._accum >= self._step:
+                self.update(self._step)
+                self.input.refresh()
+                self._accum -= self._step
         self.draw()
-        self.input.refresh()
+        self.view._flush()
     
     def _setpaths(self):
         """
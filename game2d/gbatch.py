@@ -0,0 +1,179 @@
+"""
+A module to support batched images.
+
+A batch is a collection of images that are drawn together.  A list of GImage objects
+gives every image its own transforms and rectangle, which is a lot of graphics commands
+when there are hundreds of them.  A batch draws all of its images with a single mesh
+(one for each texture), and moving the images only rewrites the vertices of that mesh.
+It works best with the texture atlas made by :meth:`GameApp.load_atlas`, since all of
+the images in an atlas share a texture.
+"""
+from kivy.graphics import *
+from kivy.graphics.instructions import *
+from .gobject import GObject
+from .app import GameApp
+import numpy
+
+
+class GBatch(GObject):
+    """
+    An class representing a batch of images drawn as one mesh.
+
+    Each image in the batch has a source file, an angle and a position.  The positions
+    are relative to the center (x,y) of the batch, and images are drawn at the size of
+    their texture.  Only the positions can change after the batch is created.
+
+    A batch does not have a meaningful width, height or hitbox.  It is for drawing
+    only, and collisions should be checked on the objects that the images represent.
+    """
+
+    # MUTABLE PROPERTIES
+    @property
+    def positions(self):
+        """
+        The centers of the images in this batch.
+
+        **invariant**: Value is a sequence of ``count`` (x,y) pairs of numbers.
+        """
+        return tuple(map(tuple,self._positions.tolist()))
+
+    @positions.setter
+    def positions(self,value):
+        value = numpy.array(value,dtype=float).reshape(-1,2)
+        assert len(value) == self.count, '%s does not have %s positions' % (repr(value),repr(self.count))
+        self._positions = value
+        if self._defined:
+            self._move()
+
+    # IMMUTABLE PROPERTIES
+    @property
+    def count(self):
+        """
+        The number of images in this batch
+
+        **invariant**. Value is an int >= 0.
+        """
+        return len(self._sources)
+
+    @property
+    def sources(self):
+        """
+        The source files of the images in this batch.
+
+        **invariant**. Value is a tuple of strings refering to valid files.
+        """
+        return self._sources
+
+    @property
+    def angles(self):
+        """
+        The angles of the images in this batch.
+
+        Each angle is measured in degrees counter-clockwise about the image center.
+
+        **invariant**. Value is a tuple of ``count`` numbers.
+        """
+        return self._angles
+
+    # BUILT-IN METHODS
+    def __init__(self,**keywords):
+        """
+        Creates a new batch of images.
+
+        To use the constructor for this class, you should provide it with a list of
+        keyword arguments that initialize various attributes. For example, to draw
+        two cars, the second one facing left, use the constructor::
+
+            GBatch(sources=['car1.png','car2.png'],angles=[0,180],positions=[(0,0),(200,0)])
+
+        This class supports the same keywords as :class:`GObject`, plus ``sources``,
+        ``angles`` and ``positions``.  The keyword ``sources`` is required.  If
+        ``angles`` or ``positions`` is missing, every image is unrotated or centered
+        on (x,y), respectively.
+
+        :param keywords: dictionary of keyword arguments
+        :type keywords:  keys are attribute names, including 'sources'
+        """
+        self._defined = False
+        if not 'sources' in keywords:
+            raise ValueError("The 'sources' argument must be specified.")
+        sources = tuple(keywords['sources'])
+        assert all(map(GameApp.is_image,sources)), '%s contains an invalid image file' % repr(sources)
+        self._sources = sources
+
+        angles = tuple(keywords['angles']) if 'angles' in keywords else (0,)*self.count
+        assert len(angles) == self.count, '%s does not have %s angles' % (repr(angles),repr(self.count))
+        assert all(map(lambda x : type(x) in [int,float], angles)), '%s has non-numerical elements' % repr(angles)
+        self._angles = angles
+
+        self._groups = []
+        self.positions = keywords['positions'] if 'positions' in keywords else [(0,0)]*self.count
+        GObject.__init__(self,**keywords)
+        self._reset()
+        self._defined = True
+
+    # HIDDEN METHODS
+    def _move(self):
+        """
+        Moves the vertices of the meshes to the current positions.
+        """
+        for (mesh,index,corners,vertices) in self._groups:
+            vertices[:,:,:2] = corners+self._positions[index,None,:]
+            mesh.vertices = vertices.reshape(-1)
+
+    def _reset(self):
+        """
+        Resets the drawing cache.
+        """
+        GObject._reset(self)
+        if not self._fillcolor is None:
+            self._cache.add(self._fillcolor)
+        else:
+            self._cache.add(Color(1,1,1))
+
+        # Images with the same texture (e.g. an atlas) go in the same mesh
+        groups = {}
+        for pos in range(self.count):
+            texture = GameApp.load_texture(self._sources[pos])
+            if texture is None:
+                print('Failed to load',repr(self._sources[pos]))
+            else:
+                groups.setdefault(texture.id,[]).append((pos,texture))
+
+        self._groups = []
+        for images in groups.values():
+            # Mesh indices are unsigned shorts, so a mesh has at most 16384 quads
+            for start in range(0,len(images),16384):
+                chunk = images[start:start+16384]
+                index = numpy.array([pos for (pos,texture) in chunk])
+                size  = len(index)
+
+                # The corners, in the order of the texture coordinates
+                corners = numpy.empty((size,4,2))
+                coords  = numpy.empty((size,4,2))
+                for ii in range(size):
+                    (pos,texture) = chunk[ii]
+                    w = texture.width/2.0
+                    h = texture.height/2.0
+                    corners[ii] = ((-w,-h),(w,-h),(w,h),(-w,h))
+                    coords[ii]  = numpy.reshape(texture.tex_coords,(4,2))
+
+                radians = numpy.radians(numpy.array(self._angles,dtype=float)[index])
+                cos = numpy.cos(radians)[:,None]
+                sin = numpy.sin(radians)[:,None]
+                rotated = numpy.empty_like(corners)
+                rotated[:,:,0] = corners[:,:,0]*cos-corners[:,:,1]*sin
+                rotated[:,:,1] = corners[:,:,0]*sin+corners[:,:,1]*cos
+
+                vertices = numpy.zeros((size,4,4),dtype=numpy.float32)
+                vertices[:,:,2:] = coords
+                indices = numpy.arange(size,dtype=numpy.uint16)[:,None]*4
+                indices = (indices+numpy.array([0,1,2,2,3,0],dtype=numpy.uint16)).reshape(-1)
+
+                mesh = Mesh(vertices=vertices.reshape(-1),indices=indices,
+                            mode='triangles',texture=chunk[0][1])
+                self._cache.add(mesh)
+                self._groups.append((mesh,index,rotated,vertices))
+
+        self._move()
+        self._cache.add(PopMatrix())
@@ -106,6 +106,7 @@ class GObject(object):
         assert type(value) in [int,float], '%s is not a number' % repr(value)
         self._trans.x = float(value)
         self._mtrue = False
+        self._btrue = False
 
     @property
     def y(self):
@@ -121,6 +122,7 @@ class GObject(object):
         assert type(value) in [int,float], '%s is not a number' % repr(value)
         self._trans.y = float(value)
         self._mtrue = False
+        self._btrue = False
 
     @property
     def width(self):
@@ -138,6 +140,7 @@ class GObject(object):
         assert type(value) in [int,float], '%s is not a number' % repr(value)
         assert value > 0, '%s is not positive' % repr(value)
         self._width = float(value)
+        self._btrue = False
         if self._defined:
             self._reset()
 
@@ -157,6 +160,7 @@ class GObject(object):
         assert type(value) in [int,float], '%s is not a number' % repr(value)
         assert value > 0, '%s is not positive' % repr(value)
         self._height = float(value)
+        self._btrue = False
         if self._defined:
             self._reset()
 
@@ -184,6 +188,7 @@ class GObject(object):
 
     @hitbox.setter
     def hitbox(self,value):
+        self._btrue = False
         if value is None:
             self._hitbox = None
             return
@@ -225,6 +230,7 @@ class GObject(object):
             self._scale.x = float(value[0])
             self._scale.y = float(value[1])
         self._mtrue = False
+        self._btrue = False
 
     @property
     def angle(self):
@@ -243,6 +249,7 @@ class GObject(object):
         assert type(value) in [int,float], '%s is not a number' % repr(value)
         diff = np.allclose([self._rotate.angle],[value])
         self._rotate.angle = float(value)
+        self._btrue = False
         if not diff:
             self._mtrue = False
 
@@ -355,21 +362,9 @@ class GObject(object):
 
         **invariant**: Value must be an ``int`` or ``float``.
         """
-        # Optimize for 90 degree turns
-        if (self._rotate.angle % 360) == 0.0:
-            return self.x-self.width/2.0+self._hitbox[0]
-        elif (self._rotate.angle % 360) == 180:
-            return self.x-self.width/2.0+self._hitbox[2]
-        elif (self._rotate.angle % 360) == 90.0:
-            return self.x-self.height/2.0+self._hitbox[3]
-        elif (self._rotate.angle % 360) == 270:
-            return self.x-self.height/2.0+self._hitbox[1]
-
-        p0 = tuple(self.matrix._transform(-self.width/2.0+self._hitbox[0], -self.height/2.0+self._hitbox[3]))[0]
-        p1 = tuple(self.matrix._transform( self.width/2.0+self._hitbox[2], -self.height/2.0+self._hitbox[3]))[0]
-        p2 = tuple(self.matrix._transform( self.width/2.0+self._hitbox[2],  self.height/2.0+self._hitbox[1]))[0]
-        p3 = tuple(self.matrix._transform(-self.width/2.0+self._hitbox[0],  self.height/2.0+self._hitbox[1]))[0]
-        return min(p0,p1,p2,p3)
+        if not self._btrue:
+            self._build_bounds()
+        return self._edges[0]
 
     @left.setter
     def left(self,value):
@@ -392,21 +387,9 @@ class GObject(object):
 
         **invariant**: Value must be an ``int`` or ``float``.
         """
-        # Optimize for 90 degree turns
-        if (self._rotate.angle % 360) == 0.0:
-            return self.x+self.width/2.0-self._hitbox[2]
-        elif (self._rotate.angle % 360) == 180:
-            return self.x+self.width/2.0-self._hitbox[0]
-        elif (self._rotate.angle % 360) == 90.0:
-            return self.x+self.height/2.0-self._hitbox[1]
-        elif (self._rotate.angle % 360) == 270:
-            return self.x+self.height/2.0-self._hitbox[3]
-
-        p0 = tuple(self.matrix._transform(-self.width/2.0+self._hitbox[0], -self.height/2.0+self._hitbox[3]))[0]
-        p1 = tuple(self.matrix._transform( self.width/2.0+self._hitbox[2], -self.height/2.0+self._hitbox[3]))[0]
-        p2 = tuple(self.matrix._transform( self.width/2.0+self._hitbox[2],  self.height/2.0+self._hitbox[1]))[0]
-        p3 = tuple(self.matrix._transform(-self.width/2.0+self._hitbox[0],  self.height/2.0+self._hitbox[1]))[0]
-        return max(p0,p1,p2,p3)
+        if not self._btrue:
+            self._build_bounds()
+        return self._edges[2]
 
     @right.setter
     def right(self,value):
@@ -429,21 +412,9 @@ class GObject(object):
 
         **invariant**: Value must be an ``int`` or ``float``.
         """
-        # Optimize for 90 degree turns
-        if (self._rotate.angle % 360) == 0.0:
-            return self.y+self.height/2.0-self._hitbox[1]
-        elif (self._rotate.angle % 360) == 180:
-            return self.y+self.height/2.0-self._hitbox[3]
-        elif (self._rotate.angle % 360) == 90.0:
-            return self.y+self.width/2.0-self._hitbox[0]
-        elif (self._rotate.angle % 360) == 270:
-            return self.y+self.width/2.0-self._hitbox[2]
-
-        p0 = tuple(self.matrix._transform(-self.width/2.0+self._hitbox[0], -self.height/2.0+self._hitbox[3]))[1]
-        p1 = tuple(self.matrix._transform( self.width/2.0+self._hitbox[2], -self.height/2.0+self._hitbox[3]))[1]
-        p2 = tuple(self.matrix._transform( self.width/2.0+self._hitbox[2],  self.height/2.0+self._hitbox[1]))[1]
-        p3 = tuple(self.matrix._transform(-self.width/2.0+self._hitbox[0],  self.height/2.0+self._hitbox[1]))[1]
-        return max(p0,p1,p2,p3)
+        if not self._btrue:
+            self._build_bounds()
+        return self._edges[1]
 
     @top.setter
     def top(self,value):
@@ -466,22 +437,9 @@ class GObject(object):
 
         **invariant**: Value must be an ``int`` or ``float``.
         """
-        # Optimize for 90 degree turns
-        if (self._rotate.angle % 360) == 0.0:
-            return self.y-self.height/2.0+self._hitbox[3]
-        elif (self._rotate.angle % 360) == 180:
-            return self.y-self.height/2.0+self._hitbox[1]
-        elif (self._rotate.angle % 360) == 90.0:
-            return self.y-self.width/2.0+self._hitbox[2]
-        elif (self._rotate.angle % 360) == 270:
-            return self.y-self.width/2.0+self._hitbox[0]
-
-        p0 = tuple(self.matrix._transform(-self.width/2.0+self._hitbox[0], -self.height/2.0+self._hitbox[3]))[1]
-        p1 = tuple(self.matrix._transform( self.width/2.0+self._hitbox[2], -self.height/2.0+self._hitbox[3]))[1]
-        p2 = tuple(self.matrix._transform( self.width/2.0+self._hitbox[2],  self.height/2.0+self._hitbox[1]))[1]
-        p3 = tuple(self.matrix._transform(-self.width/2.0+self._hitbox[0],  self.height/2.0+self._hitbox[1]))[1]
-        return min(p0,p1,p2,p3)
-
+        if not self._btrue:
+            self._build_bounds()
+        return self._edges[3]
 
     @bottom.setter
     def bottom(self,value):
@@ -546,6 +504,7 @@ class GObject(object):
 
         # Create the Kivy transforms for position and size
         self._mtrue  = False
+        self._btrue  = False
         self._trans  = Translate(0,0,0)
         self._rotate = Rotate(angle=0,axis=(0,0,1))
         self._scale  = Scale(1,1,1)
@@ -626,9 +585,9 @@ class GObject(object):
         h2 = (0,0,0,0) if obj._hitbox is None else obj._hitbox
 
         # Optimize for 90 degree turns
-        if (self.angle % 360) in [0,90,180,270] and (obj.angle % 360) in [0,90,180,270]:
-            (l0,t0,r0,b0) = obj._bbox()
-            (l1,t1,r1,b1) = self._bbox()
+        (l0,t0,r0,b0) = obj._bbox()
+        (l1,t1,r1,b1) = self._bbox()
+        if self._square and obj._square:
             isx = l1 <= l0 <= r1 or l0 <= l1 <= r0
             isy = b1 <= b0 <= t1 or b0 <= b1 <= t0
             return isx and isy
@@ -677,8 +636,8 @@ class GObject(object):
         assert is_num_tuple(point,2), "%s is not a valid point" % repr(point)
 
         # Optimize for 90 degree turns
-        if (self._rotate.angle % 360) in [0,90,180,270]:
-            (l,t,r,b) = self._bbox()
+        (l,t,r,b) = self._bbox()
+        if self._square:
             return l <= point[0] <= r and b <= point[1] <= t
 
         # Transform this to the right space.
@@ -730,6 +689,7 @@ class GObject(object):
         """
         Resets the drawing cache.
         """
+        self._btrue = False
         self._cache = InstructionGroup()
         self._cache.add(PushMatrix())
         self._cache.add(self._trans)
@@ -750,44 +710,36 @@ class GObject(object):
         self._invrse.scale(1.0/self._scale.x,1.0/self._scale.y)
         self._mtrue = True
 
-    def _bbox(self):
+    def _build_bounds(self):
         """
-        Computes the bounding box of this rotated object
+        Builds the bounding box and edges after a settings change.
 
-        The bounding box is returned as a tuple (l,t,r,b). This function allows for
-        fast(er) collisions when the object is rotated in 90 degree increments.
-
-        :return: The bounding box for the shape
-        :rtype:  ``tuple`` of four ``float`` values
+        Like the transform matrices, the bounding box is only recomputed when the
+        position, size, angle, scale or hitbox changes.  The edges (used by the
+        properties ``left``, ``top``, ``right`` and ``bottom``) are cached separately
+        from the bounding box, as the two do not agree for 90 and 270 degree turns.
         """
-        oangle = self.angle % 360
+        oangle = self._rotate.angle % 360
         hit = (0,0,0,0) if self._hitbox is None else self._hitbox
+        x = self.x
+        y = self.y
         w = self.width/2
         h = self.height/2
+        self._square = oangle in [0,90,180,270]
         if oangle == 0:
-            l = self.x + hit[0] - w
-            r = self.x - hit[2] + w
-            t = self.y - hit[1] + h
-            b = self.y + hit[3] - h
+            self._bcache = (x + hit[0] - w, y - hit[1] + h, x - hit[2] + w, y + hit[3] - h)
+            self._edges  = (x-w+hit[0], y+h-hit[1], x+w-hit[2], y-h+hit[3])
         elif oangle == 90:
-            t = self.y + hit[2] - w
-            b = self.y - hit[0] + w
-            r = self.x - hit[3] + h
-            l = self.x + hit[1] - h
+            self._bcache = (x + hit[1] - h, y + hit[2] - w, x - hit[3] + h, y - hit[0] + w)
+            self._edges  = (x-h+hit[3], y+w-hit[0], x+h-hit[1], y-w+hit[2])
         elif oangle == 180:
-            l = self.x + hit[2] - w
-            r = self.x - hit[0] + w
-            t = self.y - hit[3] + h
-            b = self.y + hit[1] - h
+            self._bcache = (x + hit[2] - w, y - hit[3] + h, x - hit[0] + w, y + hit[1] - h)
+            self._edges  = (x-w+hit[2], y+h-hit[3], x+w-hit[0], y-h+hit[1])
         elif oangle == 270:
-            t = self.y + hit[0] - w
-            b = self.y - hit[2] + w
-            r = self.x - hit[1] + h
-            l = self.x + hit[3] - h
+            self._bcache = (x + hit[3] - h, y + hit[0] - w, x - hit[1] + h, y - hit[2] + w)
+            self._edges  = (x-h+hit[1], y+w-hit[2], x+h-hit[3], y-w+hit[0])
         else:
             comp = self.matrix
-            w = self.width/2.0
-            h = self.height/2.0
             p0 = tuple(comp._transform(-w+hit[0], h-hit[1]))
             p1 = tuple(comp._transform( w-hit[2], h-hit[1]))
             p2 = tuple(comp._transform( w-hit[2],-h+hit[3]))
@@ -797,8 +749,30 @@ class GObject(object):
             r = max(p0[0],p1[0],p2[0],p3[0])
             b = min(p0[1],p1[1],p2[1],p3[1])
             t = max(p0[1],p1[1],p2[1],p3[1])
+            self._bcache = (l,t,r,b)
 
-        return (l,t,r,b)
+            p0 = tuple(comp._transform(-w+hit[0], -h+hit[3]))
+            p1 = tuple(comp._transform( w+hit[2], -h+hit[3]))
+            p2 = tuple(comp._transform( w+hit[2],  h+hit[1]))
+            p3 = tuple(comp._transform(-w+hit[0],  h+hit[1]))
+            self._edges = (min(p0[0],p1[0],p2[0],p3[0]), max(p0[1],p1[1],p2[1],p3[1]),
+                           max(p0[0],p1[0],p2[0],p3[0]), min(p0[1],p1[1],p2[1],p3[1]))
+        self._btrue = True
+
+    def _bbox(self):
+        """
+        Computes the bounding box of this rotated object
+
+        The bounding box is returned as a tuple (l,t,r,b). This function allows for
+        fast(er) collisions when the object is rotated in 90 degree increments.  The
+        box is cached until the object is moved, resized, rotated or rescaled.
+
+        :return: The bounding box for the shape
+        :rtype:  ``tuple`` of four ``float`` values
+        """
+        if not self._btrue:
+            self._build_bounds()
+        return self._bcache
 
 
 #mark -
@@ -932,6 +906,16 @@ class GScene(GObject):
 
 
     # HIDDEN METHODS
+    def _build_bounds(self):
+        """
+        Builds the bounding box and edges of this scene.
+
+        The size of a scene depends on its children, which may move without telling
+        the scene.  So the bounding box of a scene is never cached.
+        """
+        GObject._build_bounds(self)
+        self._btrue = False
+
     def _reset(self):
         """
         Resets the drawing cache
@@ -10,8 +10,6 @@ Date:   August 1, 2017 (Python 3 version)
 """
 from kivy.graphics import *
 from kivy.graphics.instructions import *
-from kivy.uix.label import Label
-from kivy.uix.image import Image
 from .gobject import GObject
 from .app import GameApp
 
@@ -300,7 +298,18 @@ class GLabel(GRectangle):
     to the font by filename, including the .ttf. If you give no name, it will use the 
     default Kivy font.  The `bold` attribute only works for the default Kivy font; for 
     other fonts you will need the .ttf file for the bold version of that font.  See the
-    provided `ComicSans.ttf` and `ComicSansBold.ttf` for an example."""
+    provided `ComicSans.ttf` and `ComicSansBold.ttf` for an example.
+    
+    Other options of the Kivy text renderer (e.g. `italic`, `markup`, `line_height` or 
+    `padding`) may be given as keywords to the constructor.  The keywords allowed are 
+    those in `GLabel.TEXT_OPTIONS`.  See the attribute `options`."""
+    
+    # Class attribute for the keywords passed on to the Kivy text renderer
+    TEXT_OPTIONS = ('italic','underline','strikethrough','markup','line_height','padding',
+                    'padding_x','padding_y','text_size','shorten','shorten_from','max_lines',
+                    'strip','split_str','font_family','font_context','font_features',
+                    'font_hinting','font_kerning','font_blended','outline_width',
+                    'outline_color','base_direction','text_language','unicode_errors')
     
     # MUTABLE PROPERTIES
     @property
@@ -315,23 +324,25 @@ class GLabel(GRectangle):
     def font_size(self,value):
         assert type(value) in [int,float], 'value %s is not a number' % repr(value)
         self._fsize = value
-        self._label.font_size = value
-        self._label.texture_update()
+        if self._defined:
+            self._reset()
     
     @property
     def font_name(self):
         """
         The file name for the .ttf file to use as a font
         
-        **Invariant**: Must be a string referring to a .ttf file in folder Fonts"""
-        return self._label.font_name
+        **Invariant**: Must be a string referring to a .ttf file in folder Fonts, or
+        None for the default Kivy font"""
+        return self._fname
     
     @font_name.setter
     def font_name(self,value):
         from .app import GameApp
         assert GameApp.is_font(value), 'value %s is not a font name' % repr(value)
-        self._label.font_name = value
-        self._label.texture_update()
+        self._fname = value
+        if self._defined:
+            self._reset()
     
     @property
     def bold(self):
@@ -343,13 +354,14 @@ class GLabel(GRectangle):
         `ComicSans.ttf` and `ComicSansBold.ttf` for an example.
         
         **Invariant**: Must be a boolean"""
-        return self._label.bold
+        return self._bold
 
     @bold.setter
     def bold(self,value):
         assert type(value) == bool, repr(value)+' is not a bool'
-        self._label.bold = value
-        self._label.texture_update()
+        self._bold = value
+        if self._defined:
+            self._reset()
 
     @property
     def text(self):
@@ -361,13 +373,16 @@ class GLabel(GRectangle):
         this label will grow to ensure that the text will fit in the rectangle.
         
         **Invariant**: Must be a string"""
-        return self._label.text
+        return self._text
     
     @text.setter
     def text(self,value):
         assert type(value) == str, 'value %s is not a string' % repr(value)
-        self._label.text = value
-        self._label.texture_update()
+        if self._defined and value == self._text:
+            return
+        self._text = value
+        if self._defined:
+            self._reset()
     
     @property
     def halign(self):
@@ -389,7 +404,6 @@ class GLabel(GRectangle):
     def halign(self,value):
         assert value in ('left','right','center'), 'value %s is not a valid horizontal alignment' % repr(value)
         self._halign = value
-        self._label.halign = value
         if self._defined:
             self._reset()
     
@@ -413,11 +427,25 @@ class GLabel(GRectangle):
     def valign(self,value):
         assert value in ('top','middle','bottom'), 'value %s is not a valid vertical alignment' % repr(value)
         self._valign = value
-        self._label.valign = value
         if self._defined:
             self._reset()
     
     
+    # IMMUTABLE PROPERTIES
+    @property
+    def options(self):
+        """
+        The other options for rendering the text, as a dictionary.
+        
+        These are the keywords of the constructor in `GLabel.TEXT_OPTIONS` (e.g. 
+        `italic` or `markup`).  They are passed on to the Kivy text renderer, and are 
+        part of the key of the text cache (see :meth:`GameApp.load_text`).  The 
+        dictionary is a copy, so changing it does not change this label.
+        
+        **Immutable**: These options cannot be changed after the label is created."""
+        return dict(self._options)
+    
+    
     # REDEFINED PROPERTIES
     @property
     def x(self):
@@ -432,6 +460,7 @@ class GLabel(GRectangle):
         assert type(value) in [int,float], 'value %s is not a number' % repr(value)
         self._trans.x = float(value)
         self._mtrue = False
+        self._btrue = False
         self._hanchor = 'center'
         self._ha = value
     
@@ -448,6 +477,7 @@ class GLabel(GRectangle):
         assert type(value) in [int,float], 'value %s is not a number' % repr(value)
         self._trans.y = float(value)
         self._mtrue = False
+        self._btrue = False
         self._vanchor = 'center'
         self._hv = value
     
@@ -592,20 +622,24 @@ class GLabel(GRectangle):
             GLabel(text='Hello')
         
         This class supports the all same keywords as :class:`GRectangle`, as well as 
-        additional attributes for the text properties (e.g. font size and name).
+        additional attributes for the text properties (e.g. font size and name).  The
+        keywords in `GLabel.TEXT_OPTIONS` are passed on to the Kivy text renderer.
         """
         self._defined = False
         self._hanchor = 'center'
         self._vanchor = 'center'
-        
-        sanitized = {}
-        excludes  = ['linewidth','linecolor','fillcolor','halign','valign','left','bottom']
+        self._texture = None
+        self._options = {}
         for key in keywords:
-            if not key in excludes:
-                sanitized[key] = keywords[key]
+            if key in GLabel.TEXT_OPTIONS:
+                self._options[key] = keywords[key]
         
-        self._label = Label(**sanitized)
-        self._label.size_hint = (None,None)
+        self.text = keywords['text'] if 'text' in keywords else ''
+        self.font_size = keywords['font_size'] if 'font_size' in keywords else 15
+        self._fname = None
+        if 'font_name' in keywords:
+            self.font_name = keywords['font_name']
+        self.bold = keywords['bold'] if 'bold' in keywords else False
         
         self.linewidth = keywords['linewidth'] if 'linewidth' in keywords else 0.0
         self.halign = keywords['halign'] if 'halign' in keywords else 'center'
@@ -616,7 +650,6 @@ class GLabel(GRectangle):
             self.linecolor = (0,0,0,1)
         self._reset()
         self._defined = True
-        self._label.bind(texture_size=self._callback)
     
     def __str__(self):
         """
@@ -631,27 +664,22 @@ class GLabel(GRectangle):
                 % (s,repr(self.text),repr(self.x),repr(self.y),repr(self.angle))
     
     # HIDDEN METHODS
-    def _callback(self,instance=None,value=None):
-        """
-        A workaround to deal with parameter requirements for callbacks
-        """
-        if self._defined:
-            self._reset()
-    
     def _reset(self):
         """
         Resets the drawing cache.
+        
+        The text is rendered by :meth:`GameApp.load_text`, so labels with the same text,
+        font and color share one texture.
         """
-        # Set up the label at the center.
-        self._label.size = self._label.texture_size
-        self._label.center = (0,0)
-        if self.linecolor:
-            self._label.color = self.linecolor
+        color = tuple(self.linecolor) if self.linecolor else (1,1,1,1)
+        self._texture = GameApp.load_text(self._text,self._fname,self._fsize,self._bold,
+                                          color,self._halign,self._options)
+        (tw,th) = (0,0) if self._texture is None else self._texture.size
         
         # Resize the outside if necessary
         self._defined = False
-        self._width  = max(self.width, self._label.width)
-        self._height = max(self.height,self._label.height)
+        self._width  = max(self.width, tw)
+        self._height = max(self.height,th)
         self._defined = True
         
         # Reset the absolute anchor
@@ -666,17 +694,19 @@ class GLabel(GRectangle):
         elif self._vanchor == 'bottom':
             self._trans.y = self._hv+self.height/2.0
         
-        # Reset the label anchor.
+        # Reset the text anchor.
+        tx = -tw/2.0
         if self.halign == 'left':
-            self._label.x = -self.width/2.0
+            tx = -self.width/2.0
         elif self.halign == 'right':
-            self._label.right = self.width/2.0
+            tx = self.width/2.0-tw
         
-        # Reset the label anchor.
+        # Reset the text anchor.
+        ty = -th/2.0
         if self.valign == 'top':
-            self._label.top = self.height/2.0
+            ty = self.height/2.0-th
         elif self.valign == 'bottom':
-            self._label.bottom = -self.height/2.0
+            ty = -self.height/2.0
         
         GObject._reset(self)
         x = -self.width/2.0
@@ -687,7 +717,9 @@ class GLabel(GRectangle):
             self._cache.add(self._fillcolor)
             self._cache.add(fill)
         
-        self._cache.add(self._label.canvas)
+        if not self._texture is None:
+            self._cache.add(Color(1,1,1))
+            self._cache.add(Rectangle(pos=(tx,ty),size=(tw,th),texture=self._texture))
         
         if self._linewidth > 0:
             line = Line(rectangle=(x,y,self.width,self.height),joint='miter',close=True,width=self.linewidth)
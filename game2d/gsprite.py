@@ -25,7 +25,10 @@ class GSprite(GRectangle):
     
     The image is broken up in to a sequence of frames.  These frames are arranged in a
     2d grid and are arranged left-to-right, top-to-bottom.  By specifying the frame,
-    you can control what image is displayed inside of this rectangle.
+    you can control what image is displayed inside of this rectangle.  Every frame is
+    drawn from the same texture (the whole filmstrip), so changing the frame only 
+    changes the texture coordinates of the rectangle.  Setting the frame to its
+    current value does nothing.
     
     If the attributes ``width`` and ``height`` do not agree with the actual size of a
     single frame, the image is scaled to fit.Furthermore, if you define ``fillcolor``, 
@@ -101,14 +104,17 @@ class GSprite(GRectangle):
     
     @frame.setter
     def frame(self,value):
+        if value == self._frame and type(value) == int:
+            return
         assert type(value) == int, '%s is not an int' % repr(value)
         assert value >= 0 and value < self.count, '%s is out of range' % repr(value)
         self._frame = value
-        if not self.hitboxes is None:
-            self.hitbox = self.hitboxes[value]
-        if self._bounds:
-            self._texture = self._images[self._frame]
-            self._bounds.texture = self._texture
+        if not self._hitboxes is None:
+            # The hitboxes were checked when they were set
+            self._hitbox = self._hitboxes[value]
+            self._btrue = False
+        if self._bounds and self._coords[value]:
+            self._bounds.tex_coords = self._coords[value]
     
     @property
     def hitboxes(self):
@@ -131,6 +137,7 @@ class GSprite(GRectangle):
         if value is None:
             self._hitboxes = None
             self._hitbox   = None
+            self._btrue    = False
             return
         
         try:
@@ -168,7 +175,7 @@ class GSprite(GRectangle):
         self._frame  = 0
         self.source = keywords['source'] if 'source' in keywords else None
         self.format = keywords['format'] if 'format' in keywords else (1,1)
-        self._images = [None]*self.count
+        self._coords = [None]*self.count
         self._bounds = None
         self._texture = None
         GRectangle.__init__(self,**keywords)
@@ -190,20 +197,17 @@ class GSprite(GRectangle):
                 self.width  = width
                 self.height = height
             
-            ty = 0
-            for row in range(self._format[0]):
-                tx = 0
-                for col in range(self._format[1]):
-                    self._images[row*self._format[1]+col] = texture.get_region(int(tx),texture.height-int(ty)-int(height),int(width),int(height))
-                    tx += width
-                ty += width
+            # Every sprite with this sheet and format shares these coordinates
+            self._coords = GameApp.load_regions(self.source,self._format)
         else:
             print('Failed to load',repr(self.source))
         
         x = -self.width/2.0
         y = -self.height/2.0
-        self._texture = self._images[self._frame]
+        self._texture = texture
         self._bounds = Rectangle(pos=(x,y), size=(self.width, self.height),texture=self._texture)
+        if self._coords[self._frame]:
+            self._bounds.tex_coords = self._coords[self._frame]
         if not self._fillcolor is None:
             self._cache.add(self._fillcolor)
         else:
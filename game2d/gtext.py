@@ -0,0 +1,217 @@
+"""
+A module to support fast-changing text.
+
+A :class:`GLabel` renders its whole string as a texture, so every change to the text
+rasterizes it again.  That is fine for a title, but not for a score or a timer that
+changes every frame.  A text object draws its string as one quad per character from a
+glyph atlas (see :meth:`GameApp.load_glyphs`).  The font is only rasterized once, and
+changing the text only rewrites the vertices of a single mesh.
+
+Only the characters in ``GameApp.GLYPHS`` (printable ASCII) can be drawn.  Any other
+character is drawn as a question mark.
+"""
+from kivy.graphics import *
+from kivy.graphics.instructions import *
+from .gobject import GObject
+from .app import GameApp
+import numpy
+
+
+class GText(GObject):
+    """
+    An class representing a line (or lines) of text drawn from a glyph atlas.
+
+    The text color is ``linecolor``, and the text has no background or border.  The
+    position (x,y) is the anchor of the text, which is horizontally aligned to it
+    according to ``halign``, and vertically centered on it.  The ``width`` and
+    ``height`` of a text object are the size of its text, and change with the text.
+
+    Characters are not kerned, so the text may be spaced a little differently than
+    the same text in a :class:`GLabel`.  Since x is not always the center of the
+    text, a text object is for drawing only, and should not be used for collisions.
+    """
+
+    # MUTABLE PROPERTIES
+    @property
+    def text(self):
+        """
+        The text of this object.
+
+        The text is broken up into multiple lines at the escape character `'\\n'`.
+
+        **Invariant**: Must be a string
+        """
+        return self._text
+
+    @text.setter
+    def text(self,value):
+        assert type(value) == str, 'value %s is not a string' % repr(value)
+        if value == self._text:
+            return
+        self._text = value
+        if self._defined:
+            self._layout()
+
+    @property
+    def halign(self):
+        """
+        The horizontal alignment of the text to the anchor x.
+
+        If it is 'left', the text starts at x.  If it is 'right', the text ends at x.
+        Otherwise the text is centered on x.  Multiple lines are aligned to each other
+        in the same way.
+
+        **Invariant**: Must be one of 'left', 'right', or 'center'
+        """
+        return self._halign
+
+    @halign.setter
+    def halign(self,value):
+        assert value in ('left','right','center'), 'value %s is not a valid horizontal alignment' % repr(value)
+        self._halign = value
+        if self._defined:
+            self._layout()
+
+    # IMMUTABLE PROPERTIES
+    @property
+    def font_name(self):
+        """
+        The file name for the .ttf file of the font (None for the default Kivy font)
+
+        **Invariant**: Must be a string referring to a .ttf file in folder Fonts, or
+        None
+        """
+        return self._fname
+
+    @property
+    def font_size(self):
+        """
+        The size of the text font in points.
+
+        **Invariant**: Must be a positive number (int or float)
+        """
+        return self._fsize
+
+    @property
+    def bold(self):
+        """
+        A boolean indicating whether or not the text is bold (default font only).
+
+        **Invariant**: Must be a boolean
+        """
+        return self._bold
+
+
+    # BUILT-IN METHODS
+    def __init__(self,**keywords):
+        """
+        Creates a new text object.
+
+        To use the constructor for this class, you should provide it with a list of
+        keyword arguments that initialize various attributes.  For example, to draw a
+        score in the top left corner, use the constructor call::
+
+            GText(text='SCORE: 0',font_name='RetroGame.ttf',font_size=24,halign='left',x=10,y=700)
+
+        This class supports the same keywords as :class:`GObject`, plus ``text``,
+        ``font_name``, ``font_size``, ``bold`` and ``halign``.  The font cannot be
+        changed after the object is created.  The ``width`` and ``height`` keywords
+        are ignored, since they come from the text.
+
+        :param keywords: dictionary of keyword arguments
+        :type keywords:  keys are attribute names
+        """
+        self._defined = False
+        self._text = None
+        self.text = keywords['text'] if 'text' in keywords else ''
+        self.halign = keywords['halign'] if 'halign' in keywords else 'center'
+
+        self._fname = keywords['font_name'] if 'font_name' in keywords else None
+        assert self._fname is None or GameApp.is_font(self._fname), 'value %s is not a font name' % repr(self._fname)
+        self._fsize = keywords['font_size'] if 'font_size' in keywords else 15
+        assert type(self._fsize) in [int,float] and self._fsize > 0, 'value %s is not a font size' % repr(self._fsize)
+        self._bold  = keywords['bold'] if 'bold' in keywords else False
+        assert type(self._bold) == bool, repr(self._bold)+' is not a bool'
+        (self._atlas,self._glyphs) = GameApp.load_glyphs(self._fname,self._fsize,self._bold)
+        self._mesh = None
+
+        sanitized = {}
+        for key in keywords:
+            if not key in ('width','height'):
+                sanitized[key] = keywords[key]
+        GObject.__init__(self,**sanitized)
+        if not self.linecolor:
+            self.linecolor = (0,0,0,1)
+        self._reset()
+        self._defined = True
+
+    def __str__(self):
+        """
+        :return: A readable string representation of this object.
+        :rtype:  ``str``
+        """
+        if self.name is None:
+            s = '['
+        else:
+            s = '[name=%s,' % self.name
+        return '%s,text=%s,anchor=(%s,%s),angle=%s]' \
+                % (s,repr(self.text),repr(self.x),repr(self.y),repr(self.angle))
+
+
+    # HIDDEN METHODS
+    def _layout(self):
+        """
+        Rewrites the vertices of the mesh for the current text.
+
+        This also sets the width and height of this object to the size of the text.
+        """
+        glyphs = self._glyphs
+        lines  = self._text.split('\n')
+        lineh  = glyphs[' '][1]
+
+        quads = []
+        widths = []
+        for line in lines:
+            chars = [glyphs[c] if c in glyphs else glyphs['?'] for c in line]
+            widths.append(sum(glyph[0] for glyph in chars))
+            quads.append(chars)
+
+        size = sum(map(len,quads))
+        vertices = numpy.zeros((size,4,4),dtype=numpy.float32)
+        top = len(lines)*lineh/2.0
+        pos = 0
+        for row in range(len(lines)):
+            if self._halign == 'left':
+                x = 0.0
+            elif self._halign == 'right':
+                x = -widths[row]
+            else:
+                x = -widths[row]/2.0
+            y = top-(row+1)*lineh
+            for (width,height,coords) in quads[row]:
+                vertices[pos,:,0] = (x,x+width,x+width,x)
+                vertices[pos,:,1] = (y,y,y+height,y+height)
+                vertices[pos,:,2:] = numpy.reshape(coords,(4,2))
+                x += width
+                pos += 1
+
+        indices = numpy.arange(size,dtype=numpy.uint16)[:,None]*4
+        indices = (indices+numpy.array([0,1,2,2,3,0],dtype=numpy.uint16)).reshape(-1)
+        self._mesh.vertices = vertices.reshape(-1)
+        self._mesh.indices  = indices
+
+        # The size of the text, with no reset of the drawing cache
+        self._width  = float(max(widths))
+        self._height = float(len(lines)*lineh)
+        self._btrue  = False
+
+    def _reset(self):
+        """
+        Resets the drawing cache.
+        """
+        GObject._reset(self)
+        self._cache.add(self._linecolor)
+        self._mesh = Mesh(mode='triangles',texture=self._atlas)
+        self._cache.add(self._mesh)
+        self._layout()
+        self._cache.add(PopMatrix())
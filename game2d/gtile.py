@@ -118,6 +118,10 @@ class GTile(GObject):
         rng_x = size_x+1 if rem_x > 0 else size_x
         rng_y = size_y+1 if rem_y > 0 else size_y
         
+        # The texture may be a region of an atlas
+        (u0,v0) = self._texture.uvpos
+        (du,dv) = self._texture.uvsize
+        
         vert = []
         indx = []
         pos = 0
@@ -125,10 +129,10 @@ class GTile(GObject):
             for jj in range(rng_y):
                 ni = 1 if ii < size_x else rem_x/grid_x
                 nj = 1 if jj < size_y else rem_y/grid_y
-                vert.extend([x+ii*grid_x,      y+jj*grid_y,         0, 1])
-                vert.extend([x+(ii+ni)*grid_x, y+jj*grid_y,        ni, 1])
-                vert.extend([x+(ii+ni)*grid_x, y+(jj+nj)*grid_y,   ni, 1-nj])
-                vert.extend([x+ii*grid_x,      y+(jj+nj)*grid_y,    0, 1-nj])
+                vert.extend([x+ii*grid_x,      y+jj*grid_y,      u0,       v0])
+                vert.extend([x+(ii+ni)*grid_x, y+jj*grid_y,      u0+ni*du, v0])
+                vert.extend([x+(ii+ni)*grid_x, y+(jj+nj)*grid_y, u0+ni*du, v0+nj*dv])
+                vert.extend([x+ii*grid_x,      y+(jj+nj)*grid_y, u0,       v0+nj*dv])
                 indx.extend([pos,pos+1,pos+2,pos+2,pos+3,pos])
                 pos += 4
         
@@ -411,6 +411,11 @@ class GView(FloatLayout):
     :class:`GObject` instances to the :meth:`draw` method.  You must do this every
     animation frame, as the game is constantly clearing the window.
 
+    The view is retained between frames.  The objects drawn in a frame are compared
+    to the objects drawn in the previous one, and the canvas is only changed where an
+    object was added or removed.  Objects that are drawn every frame stay on the canvas
+    and move by updating their transforms in place.
+
     **You should never construct an object of this class**.  Creating a new instance
     of this class will not properly display it on the screen.  Instead, you should
     only use the one provided in the `view` attribute of :class:`GameApp`.
@@ -432,7 +437,9 @@ class GView(FloatLayout):
         self.bind(pos=self._reset)
         self.bind(size=self._reset)
         self._reset()
-        self._contents = set()
+        self._contents = []
+        self._drawn = []
+        self._members = set()
 
 
     # PUBLIC METHODS
@@ -446,21 +453,52 @@ class GView(FloatLayout):
         :param cmd: the command to draw
         :type cmd:  A Kivy graphics command
         """
-        if not cmd in self._contents:
-            self._frame.add(cmd)
-            self._contents.add(cmd)
+        if not cmd in self._members:
+            self._drawn.append(cmd)
+            self._members.add(cmd)
 
     def clear(self):
         """
         Clears the contents of the view.
 
         This method is called for you automatically at the start of the animation
-        frame.  That way, you are not drawing images on top of one another.
+        frame.  That way, you are not drawing images on top of one another.  The
+        canvas itself is not cleared until the end of the frame, and only the
+        objects that were not drawn again are removed.
         """
-        self._frame.clear()
-        self._contents.clear()
+        self._drawn = []
+        self._members.clear()
 
     # HIDDEN METHODS
+    def _flush(self):
+        """
+        Updates the canvas to match the objects drawn this animation frame.
+
+        Only the commands between the longest unchanged prefix and suffix of the
+        previous frame are removed and re-inserted, so a frame that draws the same
+        objects in the same order does not touch the canvas at all.
+        """
+        old = self._contents
+        new = self._drawn
+        if len(old) == len(new) and all(a is b for (a,b) in zip(old,new)):
+            return
+
+        start = 0
+        size  = min(len(old),len(new))
+        while start < size and old[start] is new[start]:
+            start += 1
+        end = 0
+        while end < size-start and old[-1-end] is new[-1-end]:
+            end += 1
+
+        for cmd in old[start:len(old)-end]:
+            self._frame.remove(cmd)
+        pos = start
+        for cmd in new[start:len(new)-end]:
+            self._frame.insert(pos,cmd)
+            pos += 1
+        self._contents = new
+
     def _reset(self,obj=None,value=None):
         """
         Resets the view canvas in response to a resizing event
@@ -6,7 +6,6 @@ This classes wrap the Kivy audio interface, making it simpler for students to us
 Author: Walker M. White (wmw2)
 Date:   August 1, 2017 (Python 3 version)
 """
-from kivy.core.audio import SoundLoader
 from .app import GameApp
 
 
@@ -19,9 +18,20 @@ class Sound(object):
     platforms. In order for Kivy to find a WAV or MP3 file, you should put it in the
     **Sounds** directory.  Sounds in that folder can be referenced directly by name.
     
-    When a sound is played, it cannot be played again until it finishes, or is stopped.  
-    This means that if you want multiple, simultaneous sound effects from the same WAV 
-    file.you will need to create multiple Sound objects.
+    A sound has one or more voices, and each voice can play the file once at a time.
+    Playing a sound uses a voice that is not playing, so a sound with several voices
+    can overlap itself (e.g. a croak for every quick hop).  If every voice is playing,
+    the voice that started first is restarted.  No more than ``GameApp.VOICE_LIMIT``
+    voices (over all sounds) play at once; past that limit, a sound only restarts its
+    own voices.
+    
+    The voices of a file are loaded once and shared through ``GameApp.SOUND_CACHE`` by 
+    every sound for that file (see :meth:`GameApp.load_sound`), so making a sound again
+    does not decode the file again.  As a result, two sounds for the same file play the
+    same Kivy sound objects: setting the ``volume`` of one changes the other, and 
+    stopping one stops the other.  The order in which the voices were started is kept 
+    by each sound, not by the voices, so two sounds for the same file may restart a 
+    voice that the other one has just started.
     """
     # This class is a simply replacement for the built-in Kivy Sound class.  It is a
     # little better with error handling, since GStreamer appears to be quite unreliable.
@@ -36,13 +46,14 @@ class Sound(object):
         
         **Invariant**: Must float in the range 0..1.
         """
-        return self._sound.volume
+        return self._voices[0].volume
     
     @volume.setter
     def volume(self,value):
         assert type(value) in [int, float] and value >= 0 and value <= 1, \
             'value %s is not a valid volume' % repr(value)
-        self._sound.volume = value
+        for sound in self._voices:
+            sound.volume = value
     
     # IMMUTABLE PROPERTIES
     @property
@@ -56,52 +67,88 @@ class Sound(object):
         """ 
         return self._source
     
+    @property
+    def voices(self):
+        """
+        The number of voices of this sound.
+        
+        **Immutable**: This value cannot be changed after the sound is loaded.
+        
+        **Invariant**: Must be an int > 0.
+        """ 
+        return len(self._voices)
+    
     @property
     def playing(self):
         """
-        Whether or not the sound is currently playing.
+        Whether or not the sound is currently playing (in any voice).
         
         **Immutable**: This value cannot be changed.  You should use the :meth:`play` 
         and :meth:`stop` methods to alter its value.
         
         **Invariant**: Must be a boolean.
         """ 
-        return self._sound.state == 'play'
+        for sound in self._voices:
+            if sound.state == 'play':
+                return True
+        return False
     
-    def __init__(self,source):
+    def __init__(self,source,voices=1):
         """
         Creates a new sound from a file.
         
         :param source: The string providing the name of a sound file
         :type source:  ``str``
+        
+        :param voices: The number of times the sound can play at once
+        :type voices:  ``int`` > 0
         """
-        from .app import GameApp
         assert GameApp.is_sound(source), 'source %s is not a sound file' % repr(source)
+        assert type(voices) == int and voices > 0, 'voices %s is not a positive int' % repr(voices)
         self._source = source
-        self._sound  = SoundLoader.load(source)
-        self._sound.load()
-        if self._sound is None:
+        loaded = GameApp.load_sound(source,voices)
+        if loaded is None:
             raise IOError('Module game2d cannot read the file %s' % repr(source))
+        self._voices = loaded[:voices]
+        self._order  = list(range(len(self._voices)))
     
     def play(self,loop=False):
         """
         Plays this sound.
         
-        The sound will play until completion, or interrupted by the user.
+        The sound will play until completion, or interrupted by the user.  This method
+        never waits for a voice, and never loads the sound file.
         
         :param loop: Whether or not to loop the sound
         :type loop:  ``bool``
         """
-        self._sound.loop = loop
-        self._sound.play()
+        # The voices are in the order they were last started, oldest first
+        voice = None
+        if GameApp.count_voices() < GameApp.VOICE_LIMIT:
+            for pos in self._order:
+                if self._voices[pos].state != 'play':
+                    voice = pos
+                    break
+        if voice is None:
+            voice = self._order[0]
+            if self._voices[voice].state != 'play':
+                # Every voice is free, but the limit has been reached
+                return
+            self._voices[voice].stop()
+        
+        self._order.remove(voice)
+        self._order.append(voice)
+        self._voices[voice].loop = loop
+        self._voices[voice].play()
 
     def stop(self):
         """
         Stops this sound.
         
-        This will stop the sound immediately, even if it is looping.
+        This will stop the sound immediately (in every voice), even if it is looping.
         """
-        self._sound.stop()
+        for sound in self._voices:
+            sound.stop()
 
 
 # #mark -
@@ -119,13 +166,20 @@ class SoundLibrary(object):
     To play the sound, we access it as follows::
         
         soundlib['soundname'].play()
+    
+    Every sound in the library has the same number of voices (see :class:`Sound`).
     """
     
-    def __init__(self):
+    def __init__(self,voices=1):
         """
         Creates a new, empty sound library.
+        
+        :param voices: The number of voices of each sound
+        :type voices:  ``int`` > 0
         """
+        assert type(voices) == int and voices > 0, 'voices %s is not a positive int' % repr(voices)
         self._data = {}
+        self._voices = voices
     
     def __len__(self):
         """
@@ -156,7 +210,7 @@ class SoundLibrary(object):
         :param filename: The name of the file containing the sound source
         :type filename:  ``str``
         """
-        self._data[key] = Sound(filename)
+        self._data[key] = Sound(filename,self._voices)
     
     def __delitem__(self, key):
         """
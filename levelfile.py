@@ -0,0 +1,286 @@
+"""
+Compiled level files for Froggit
+
+A level is written by hand as a JSON file, and needs objects.json for the hitboxes of its
+obstacles and of the frog.  This module compiles the two into a single binary file (with
+the suffix LEVEL_SUFFIX) that has everything needed to play the level:
+
+    the size, start and offscreen buffer of the level
+    the type, speed and obstacles (type and position) of every lane
+    the hitbox and image size (in pixels) of every obstacle type in the level
+    the format and hitboxes of the sprites (the frog and the skulls)
+    the occupancy grid of every hedge (see hedgeCells in simulation.py)
+
+Loading a compiled level does not parse any JSON, look up any hitboxes, read any image
+headers or build any hedge grids.  The function readLevel returns the level and object
+dictionaries that SimLevel and Level expect, so a compiled level is played exactly like
+the JSON level it came from.
+
+All numbers are stored little-endian.  Positions, speeds, sizes and hitboxes are stored
+as doubles, and read back as ints when they are whole numbers.
+
+To compile levels from the command line, run
+
+    python levelfile.py JSON/easy1.json JSON/easy2.json
+
+which writes JSON/easy1.flv and JSON/easy2.flv.
+
+# Michelle Ren Zhang [mr897]
+# 12.21.20
+"""
+from consts import *
+from simulation import *
+from schema import *
+import json
+import os.path
+import struct
+import sys
+
+# The first bytes of a compiled level
+LEVEL_MAGIC = b'FRGL'
+
+# The version of the compiled level format
+LEVEL_VERSION = 1
+
+
+def compileLevel(json,object):
+    """
+    Returns: the compiled form (a bytes object) of a level
+
+    The level and object are checked (see schema.py) before the level is compiled, and
+    a LevelError is raised if they have any problems.
+
+    Parameter json: the level to compile
+    Precondition: json is a dictionary for a valid level JSON
+
+    Parameter object: JSON file that contains additional information about
+    image files
+    Precondition: object is a dictionary (not for a level file)
+    """
+    validateLevel(json,object)
+    names = []
+    for data in json['lanes']:
+        for item in data.get('objects',[]):
+            if not item['type'] in names:
+                names.append(item['type'])
+
+    result = [struct.pack('<4sH',LEVEL_MAGIC,LEVEL_VERSION)]
+    result.append(struct.pack('<6d',json.get('version',1.0),json['size'][0],json['size'][1],
+                              json['start'][0],json['start'][1],json['offscreen']))
+
+    # The sprites, with the size of the frog sprite sheet
+    size = imageSize(FROG_SPRITE+'.png')
+    result.append(struct.pack('<2dH',size[0],size[1],len(object['sprites'])))
+    for name in object['sprites']:
+        sprite = object['sprites'][name]
+        hitboxes = sprite.get('hitboxes',[])
+        result.append(_packString(name))
+        result.append(struct.pack('<3H',sprite['format'][0],sprite['format'][1],len(hitboxes)))
+        for hitbox in hitboxes:
+            result.append(struct.pack('<4d',*hitbox))
+
+    # The obstacle types, referred to by index in the lanes
+    result.append(struct.pack('<H',len(names)))
+    for name in names:
+        size = imageSize(name+'.png')
+        result.append(_packString(name))
+        result.append(struct.pack('<6d',size[0],size[1],*object['images'][name]['hitbox']))
+
+    result.append(struct.pack('<H',len(json['lanes'])))
+    for i in range(len(json['lanes'])):
+        data = json['lanes'][i]
+        items = data.get('objects',[])
+        result.append(struct.pack('<2BdH',LANE_TYPES.index(data['type']),'speed' in data,
+                                  data.get('speed',0),len(items)))
+        for item in items:
+            result.append(struct.pack('<Hd',names.index(item['type']),item['position']))
+
+        if data['type'] == 'hedge':
+            lane = SimHedge(json,i,json['size'][0],object)
+            cells = lane.getCells()
+            obstacles = lane.getObstacles()
+            result.append(struct.pack('<H',len(cells)))
+            for cell in cells:
+                index = [obstacles.index(obs) for obs in cell]
+                result.append(struct.pack('<%dH' % (len(index)+1),len(index),*index))
+
+    return b''.join(result)
+
+
+def readLevel(path):
+    """
+    Returns: the pair (json,object) of dictionaries for a compiled level
+
+    The dictionary json is the level, and object has the hitboxes of the obstacles and
+    sprites in the level (in the format of objects.json).  Each hedge lane in json also
+    has the key 'cells' with its occupancy grid, which SimHedge uses instead of building
+    the grid again.  The image sizes in the level are cached for imageSize.
+
+    Parameter path: the compiled level file
+    Precondition: path is a string naming a compiled level file
+    """
+    with open(path,'rb') as file:
+        data = file.read()
+    reader = _Reader(data)
+
+    (magic,version) = reader.unpack('<4sH')
+    if magic != LEVEL_MAGIC:
+        raise ValueError('%s is not a compiled level' % repr(path))
+    if version != LEVEL_VERSION:
+        raise ValueError('%s has version %s, not %s' % (repr(path),version,LEVEL_VERSION))
+
+    header = list(map(_number,reader.unpack('<6d')))
+    level = {'version':header[0],'size':[header[1],header[2]],
+             'start':[header[3],header[4]],'offscreen':header[5],'lanes':[]}
+
+    object = {'images':{},'sprites':{}}
+    (width,height,count) = reader.unpack('<2dH')
+    cacheImageSize(FROG_SPRITE+'.png',(int(width),int(height)))
+    for pos in range(count):
+        name = reader.string()
+        (rows,cols,size) = reader.unpack('<3H')
+        sprite = {'format':[rows,cols]}
+        if size > 0:
+            sprite['hitboxes'] = [list(map(_number,reader.unpack('<4d'))) for hit in range(size)]
+        object['sprites'][name] = sprite
+
+    names = []
+    for pos in range(reader.unpack('<H')[0]):
+        name = reader.string()
+        values = reader.unpack('<6d')
+        cacheImageSize(name+'.png',(int(values[0]),int(values[1])))
+        object['images'][name] = {'hitbox':list(map(_number,values[2:]))}
+        names.append(name)
+
+    for pos in range(reader.unpack('<H')[0]):
+        (kind,moving,speed,count) = reader.unpack('<2BdH')
+        lane = {'type':LANE_TYPES[kind]}
+        if moving:
+            lane['speed'] = _number(speed)
+        if count > 0:
+            lane['objects'] = []
+            for item in range(count):
+                (name,position) = reader.unpack('<Hd')
+                lane['objects'].append({'type':names[name],'position':_number(position)})
+        if lane['type'] == 'hedge':
+            lane['cells'] = []
+            for cell in range(reader.unpack('<H')[0]):
+                size = reader.unpack('<H')[0]
+                lane['cells'].append(list(reader.unpack('<%dH' % size)))
+        level['lanes'].append(lane)
+
+    return (level,object)
+
+
+def writeLevel(path,json,object):
+    """
+    Compiles a level and writes it to a file.
+
+    Parameter path: the file to write
+    Precondition: path is a string
+
+    Parameter json: the level to compile
+    Precondition: json is a dictionary for a valid level JSON
+
+    Parameter object: JSON file that contains additional information about
+    image files
+    Precondition: object is a dictionary (not for a level file)
+    """
+    data = compileLevel(json,object)
+    with open(path,'wb') as file:
+        file.write(data)
+
+
+# HELPER FUNCTIONS AND CLASSES
+def _packString(text):
+    """
+    Returns: the bytes of a string, prefixed by its length
+
+    Parameter text: the string to pack
+    Precondition: text is a string with at most 255 bytes in UTF-8
+    """
+    data = text.encode('utf-8')
+    return struct.pack('<B',len(data))+data
+
+
+def _number(value):
+    """
+    Returns: value as an int if it is a whole number, and as a float otherwise
+
+    Parameter value: the number read from a compiled level
+    Precondition: value is a float
+    """
+    return int(value) if value.is_integer() else value
+
+
+class _Reader(object):
+    """
+    A class to read the values of a compiled level in order.
+    """
+    # Attribute _data: the contents of the file
+    # Invariant: _data is a bytes object
+    #
+    # Attribute _pos: the position of the next value
+    # Invariant: _pos is an int in 0..len(_data)
+
+    def __init__(self,data):
+        """
+        Initializes a reader at the start of data.
+
+        Parameter data: the contents of the file
+        Precondition: data is a bytes object
+        """
+        self._data = data
+        self._pos = 0
+
+    def unpack(self,format):
+        """
+        Returns: the next values, as a tuple
+
+        Parameter format: the struct format of the values
+        Precondition: format is a string
+        """
+        result = struct.unpack_from(format,self._data,self._pos)
+        self._pos += struct.calcsize(format)
+        return result
+
+    def string(self):
+        """
+        Returns: the next string
+        """
+        size = self.unpack('<B')[0]
+        result = self._data[self._pos:self._pos+size].decode('utf-8')
+        self._pos += size
+        return result
+
+
+def main():
+    """
+    Compiles the level files named on the command line.
+
+    Each level is written next to its JSON file, with the suffix LEVEL_SUFFIX.  The
+    file objects.json is read from the same folder as each level.
+    """
+    if len(sys.argv) < 2:
+        print('Usage: python levelfile.py LEVEL.json [LEVEL.json ...]')
+        return
+
+    for name in sys.argv[1:]:
+        folder = os.path.dirname(name)
+        with open(os.path.join(folder,OBJECT_DATA)) as file:
+            object = json.load(file)
+        with open(name) as file:
+            level = json.load(file)
+        path = os.path.splitext(name)[0]+LEVEL_SUFFIX
+        try:
+            writeLevel(path,level,object)
+            print('Compiled %s to %s' % (name,path))
+        except LevelError as e:
+            print('Could not compile %s:' % name)
+            for problem in e.problems:
+                print('    '+problem)
+
+
+# Application code
+if __name__ == '__main__':
+    main()
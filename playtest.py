@@ -0,0 +1,234 @@
+"""
+Bulk playtesting script for Froggit
+
+This script plays every level in a folder of level files (JSON or compiled, see
+levelfile.py) without a window, and reports how each level went.  It is meant for
+checking many levels at once (e.g. every level of a release) rather than playing them
+by hand.  Run it as
+
+    python playtest.py JSON random
+
+where JSON is the folder with the level files and random is the policy.  The policy is
+either 'random' (every action is chosen at random) or the name of a script file.  A
+script lists one move per line: 'up', 'down', 'left', 'right', or 'wait' followed by a
+number of seconds.  Every new frog starts the script from the top, and makes the next
+move as soon as it is not hopping.  Blank lines and lines starting with # are ignored.
+
+Each level is played as one VecLevel with many copies (see simulation.py), and the
+levels are spread over a pool of processes, one per core by default.  Use the option
+--help to see the other options.
+
+For each level, the script reports the games won, the mean game time of a win (the
+time to take every exit), the deaths by road, water and offscreen, and the number of
+simulation steps per second (over all of the copies).
+
+# Michelle Ren Zhang [mr897]
+# 12.21.20
+"""
+from consts import *
+from simulation import *
+from levelfile import readLevel
+from schema import *
+import argparse
+import json
+import multiprocessing
+import os.path
+import time
+
+# The names of the moves in a policy script
+SCRIPT_MOVES = ('wait','up','down','left','right')
+
+
+def readScript(name):
+    """
+    Returns: the moves of a policy script as a list of (action,seconds) pairs
+
+    The action is an index into VEC_ACTIONS, and is 0 for a wait.  The seconds are 0
+    for every move that is not a wait.  A ValueError is raised if the script has no
+    moves, since a frog would have nothing to do.
+
+    Parameter name: the script file
+    Precondition: name is a string naming a policy script
+    """
+    result = []
+    with open(name) as file:
+        for line in file:
+            words = line.split()
+            if len(words) == 0 or words[0].startswith('#'):
+                continue
+            assert words[0] in SCRIPT_MOVES, '%s is not a move' % repr(words[0])
+            if words[0] == 'wait':
+                assert len(words) == 2, 'wait needs a number of seconds'
+                result.append((0,float(words[1])))
+            else:
+                assert len(words) == 1, '%s has extra words' % repr(line.strip())
+                result.append((SCRIPT_MOVES.index(words[0]),0.0))
+    if len(result) == 0:
+        raise ValueError('%s has no moves' % repr(name))
+    return result
+
+
+def playLevel(task):
+    """
+    Returns: a dictionary with the results of playing a level
+
+    The dictionary has the keys 'name', 'games', 'wins', 'time', 'deaths', 'steps'
+    and 'rate' (steps per second).  If the level cannot be played, it only has the
+    keys 'name' and 'error', and also 'problems' if the level is invalid (see
+    schema.py).
+
+    This function runs in a worker process, so it takes all of its arguments as one
+    tuple.
+
+    Parameter task: the tuple (path,object,policy,games,seconds,seed)
+    Precondition: path is a level file, object is the dictionary of objects.json,
+    policy is 'random' or a list of script moves (see readScript), games is an
+    int > 0, seconds is a number > 0 and seed is an int
+    """
+    (path,object,policy,games,seconds,seed) = task
+    name = os.path.basename(path)
+    try:
+        if path.lower().endswith(LEVEL_SUFFIX):
+            (data,object) = readLevel(path)
+        else:
+            with open(path) as file:
+                data = json.load(file)
+            problems = checkLevel(data,object)
+            if problems:
+                return {'name':name,'error':'invalid level','problems':problems}
+        level = VecLevel(data,object,games,seed)
+    except Exception as e:
+        return {'name':name,'error':'%s: %s' % (type(e).__name__,e)}
+
+    random = numpy.random.default_rng(seed)
+    script = None if policy == 'random' else numpy.array(policy).reshape(-1,2)
+    line = numpy.zeros(games,dtype=int)
+    until = numpy.zeros(games)
+    done = level.getDone()
+    wintime = numpy.zeros(games)
+
+    steps = 0
+    start = time.perf_counter()
+    limit = int(seconds/SIMULATION_STEP)
+    for step in range(limit):
+        if script is None:
+            actions = random.integers(0,len(VEC_ACTIONS),size=games)
+        else:
+            actions = _scriptActions(level,script,line,until)
+        alive = level.getAlive()
+        steps += int((~done).sum())
+        level.step(actions,SIMULATION_STEP)
+
+        # A new frog starts the script from the top
+        lost = alive & ~level.getAlive()
+        line[lost] = 0
+        until[lost] = 0
+
+        finish = level.getDone() & ~done
+        wintime[finish] = level.getTime()[finish]
+        done = level.getDone()
+        if done.all():
+            break
+    elapsed = time.perf_counter()-start
+
+    wins = level.getWins()
+    return {'name':name,'games':games,'wins':int(wins.sum()),
+            'time':float(wintime[wins].mean()) if wins.any() else None,
+            'deaths':level.getDeaths().sum(axis=0).tolist(),'steps':steps,
+            'rate':steps/elapsed if elapsed > 0 else 0.0}
+
+
+def _scriptActions(level,script,line,until):
+    """
+    Returns: the action of every copy of the level for a policy script
+
+    This function advances the current line of each copy whose frog is not hopping
+    (and is not waiting).  A wait makes no move, and the next line is read once the
+    wait is over.
+
+    Parameter level: the level being played
+    Precondition: level is a VecLevel
+
+    Parameter script: the moves of the script
+    Precondition: script is an array of shape (moves,2) from readScript
+
+    Parameter line: the next line of the script for each copy (modified)
+    Precondition: line is an int array with one entry per copy
+
+    Parameter until: the time that the wait of each copy ends (modified)
+    Precondition: until is a float array with one entry per copy
+    """
+    actions = numpy.zeros(len(line),dtype=int)
+    now = level.getTime()
+    ready = level.getIdle() & (now >= until) & (line < len(script))
+    move = script[numpy.minimum(line,len(script)-1)]
+
+    wait = ready & (move[:,0] == 0)
+    until[wait] = now[wait]+move[wait,1]
+    actions[ready] = move[ready,0].astype(int)
+    line[ready] += 1
+    return actions
+
+
+def printResults(results):
+    """
+    Prints a table with the results of playing each level.
+
+    Parameter results: the results of the levels
+    Precondition: results is a list of dictionaries from playLevel
+    """
+    print('%-20s %7s %7s %8s %6s %6s %9s %12s' %
+          ('level','games','wins','time','road','water','offscreen','steps/sec'))
+    for result in results:
+        if 'error' in result:
+            print('%-20s %s' % (result['name'],result['error']))
+            for problem in result.get('problems',[]):
+                print('    '+problem)
+            continue
+        exit = '-' if result['time'] is None else '%.1f' % result['time']
+        (road,water,offscreen) = result['deaths']
+        print('%-20s %7d %7d %8s %6d %6d %9d %12.0f' %
+              (result['name'],result['games'],result['wins'],exit,road,water,offscreen,result['rate']))
+
+
+def main():
+    """
+    Plays every level in a folder and prints the results.
+    """
+    parser = argparse.ArgumentParser(description='Plays every Froggit level in a folder.')
+    parser.add_argument('folder',help='the folder with the level files')
+    parser.add_argument('policy',help="'random' or a policy script")
+    parser.add_argument('--games',type=int,default=64,help='the games per level')
+    parser.add_argument('--seconds',type=float,default=300,
+                        help='the longest time (in game seconds) that a game is played')
+    parser.add_argument('--workers',type=int,default=None,help='the number of processes')
+    parser.add_argument('--seed',type=int,default=0,help='the random seed')
+    args = parser.parse_args()
+
+    try:
+        policy = args.policy if args.policy == 'random' else readScript(args.policy)
+    except ValueError as e:
+        parser.error(str(e))
+    with open(os.path.join(args.folder,OBJECT_DATA)) as file:
+        object = json.load(file)
+    problems = checkObjects(object)
+    if problems:
+        raise LevelError(problems)
+
+    tasks = []
+    for name in sorted(os.listdir(args.folder)):
+        suffix = os.path.splitext(name)[1].lower()
+        if suffix in ('.json',LEVEL_SUFFIX) and name != OBJECT_DATA:
+            path = os.path.join(args.folder,name)
+            tasks.append((path,object,policy,args.games,args.seconds,args.seed))
+
+    start = time.perf_counter()
+    with multiprocessing.Pool(args.workers) as pool:
+        results = pool.map(playLevel,tasks)
+    printResults(results)
+    print('Played %d levels in %.1f seconds' % (len(tasks),time.perf_counter()-start))
+
+
+# Application code
+if __name__ == '__main__':
+    main()
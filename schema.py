@@ -0,0 +1,453 @@
+"""
+Level validation for Froggit
+
+This module checks that a level and objects.json have the format that the game expects,
+before anything is built from them.  A broken level would otherwise fail deep inside
+SimLevel (e.g. with a KeyError), or be drawn wrong without any error at all.
+
+The checks are strict.  Each dictionary may only have the keys of its format, every
+number must be in range, and the lanes of a level must agree with its size.  Every
+problem is reported, not just the first one, and each problem starts with the JSON path
+of the value that caused it, as in
+
+    $.lanes[3].objects[0].type: 'car9' is not an image in objects.json
+
+The functions checkLevel and checkObjects visit each value of their dictionary once,
+so they are fast enough to check large batches of generated levels.
+
+# Michelle Ren Zhang [mr897]
+# 12.21.20
+"""
+from consts import *
+import math
+
+# The lane types whose obstacles move (and so may have a speed)
+MOVING_LANES = ('road','water')
+
+# The obstacles that may only be in a hedge (and are the only ones allowed there)
+HEDGE_OBJECTS = ('exit','open')
+
+# The sprites that the game needs in objects.json
+REQUIRED_SPRITES = ('frog','skulls')
+
+# The sprites whose hitboxes the game reads (the others may leave them out)
+HITBOX_SPRITES = ('frog',)
+
+
+class LevelError(ValueError):
+    """
+    An exception for a level (or objects.json) that does not have the right format.
+
+    Attribute problems: the problems found, each starting with its JSON path
+    Invariant: problems is a non-empty list of strings
+    """
+
+    def __init__(self,problems):
+        """
+        Initializes the error with the given problems.
+
+        Parameter problems: the problems found
+        Precondition: problems is a non-empty list of strings
+        """
+        super().__init__('\n'.join(problems))
+        self.problems = problems
+
+
+def validateLevel(json,object):
+    """
+    Checks a level and objects.json, and raises a LevelError if they have problems.
+
+    Parameter json: the level to check
+    Precondition: json is the value read from a level file (of any type)
+
+    Parameter object: JSON file that contains additional information about
+    image files
+    Precondition: object is the value read from objects.json (of any type)
+    """
+    problems = checkObjects(object)
+    problems.extend(checkLevel(json,object if not problems else None))
+    if problems:
+        raise LevelError(problems)
+
+
+def checkLevel(json,object=None):
+    """
+    Returns: the list of problems with a level (empty if there are none)
+
+    If object is not None, the obstacles of the level must also be images in it.
+
+    Parameter json: the level to check
+    Precondition: json is the value read from a level file (of any type)
+
+    Parameter object: the image information for the obstacles
+    Precondition: object is None or a valid dictionary for objects.json
+    """
+    problems = []
+    if not _isDict(json,'$',problems):
+        return problems
+    _checkKeys(json,'$',('size','start','offscreen','lanes'),('version',),problems)
+
+    if 'version' in json:
+        _isNumber(json['version'],'$.version',problems)
+
+    size = None
+    if 'size' in json and _isPair(json['size'],'$.size',problems):
+        wide = _isPositive(json['size'][0],'$.size[0]',problems)
+        high = _isPositive(json['size'][1],'$.size[1]',problems)
+        if wide and high:
+            size = json['size']
+
+    if 'start' in json and _isPair(json['start'],'$.start',problems):
+        for pos in range(2):
+            value = json['start'][pos]
+            path = '$.start[%d]' % pos
+            if _isNumber(value,path,problems) and not size is None:
+                if not 0 <= value < size[pos]:
+                    problems.append('%s: %s is outside of the level (size %s)' %
+                                    (path,repr(value),repr(size[pos])))
+
+    offscreen = None
+    if 'offscreen' in json and _isNumber(json['offscreen'],'$.offscreen',problems):
+        if json['offscreen'] < 0:
+            problems.append('$.offscreen: %s is negative' % repr(json['offscreen']))
+        else:
+            offscreen = json['offscreen']
+
+    if 'lanes' in json and _isList(json['lanes'],'$.lanes',problems):
+        lanes = json['lanes']
+        if not size is None and len(lanes) != size[1]:
+            problems.append('$.lanes: there are %d lanes, but the level is %s high' %
+                            (len(lanes),repr(size[1])))
+        width = None if size is None else size[0]
+        for i in range(len(lanes)):
+            _checkLane(lanes[i],'$.lanes[%d]' % i,width,offscreen,object,problems)
+    return problems
+
+
+def checkObjects(object):
+    """
+    Returns: the list of problems with objects.json (empty if there are none)
+
+    Parameter object: the image information to check
+    Precondition: object is the value read from objects.json (of any type)
+    """
+    problems = []
+    if not _isDict(object,'$',problems):
+        return problems
+    _checkKeys(object,'$',('images','sprites'),(),problems)
+
+    if 'images' in object and _isDict(object['images'],'$.images',problems):
+        for name in object['images']:
+            path = '$.images.%s' % name
+            image = object['images'][name]
+            if _isDict(image,path,problems):
+                _checkKeys(image,path,('file','size','hitbox'),(),problems)
+                _checkImage(image,path,problems)
+                if 'hitbox' in image:
+                    _isHitbox(image['hitbox'],path+'.hitbox',problems)
+
+    if 'sprites' in object and _isDict(object['sprites'],'$.sprites',problems):
+        for name in REQUIRED_SPRITES:
+            if not name in object['sprites']:
+                problems.append('$.sprites: missing sprite %s' % repr(name))
+        for name in object['sprites']:
+            path = '$.sprites.%s' % name
+            sprite = object['sprites'][name]
+            if _isDict(sprite,path,problems):
+                if name in HITBOX_SPRITES:
+                    _checkKeys(sprite,path,('file','size','format','hitboxes'),(),problems)
+                else:
+                    _checkKeys(sprite,path,('file','size','format'),('hitboxes',),problems)
+                _checkImage(sprite,path,problems)
+                _checkSprite(sprite,path,problems)
+    return problems
+
+
+# HELPER FUNCTIONS
+def _checkLane(lane,path,width,offscreen,object,problems):
+    """
+    Adds the problems with a lane to problems.
+
+    Parameter lane: the lane to check
+    Precondition: lane is a value from the list of lanes (of any type)
+
+    Parameter path: the JSON path of the lane
+    Precondition: path is a string
+
+    Parameter width: the width of the level
+    Precondition: width is a number > 0, or None if the size is invalid
+
+    Parameter offscreen: the offscreen buffer of the level
+    Precondition: offscreen is a number >= 0, or None if it is invalid
+
+    Parameter object: the image information for the obstacles
+    Precondition: object is None or a valid dictionary for objects.json
+
+    Parameter problems: the problems found so far
+    Precondition: problems is a list of strings
+    """
+    if not _isDict(lane,path,problems):
+        return
+    _checkKeys(lane,path,('type',),('speed','objects'),problems)
+
+    kind = None
+    if 'type' in lane:
+        if lane['type'] in LANE_TYPES:
+            kind = lane['type']
+        else:
+            problems.append('%s.type: %s is not one of %s' % (path,repr(lane['type']),
+                                                              ', '.join(LANE_TYPES)))
+
+    if 'speed' in lane and _isNumber(lane['speed'],path+'.speed',problems):
+        if not kind is None and not kind in MOVING_LANES:
+            problems.append('%s.speed: a %s lane cannot have a speed' % (path,kind))
+
+    if not 'objects' in lane or not _isList(lane['objects'],path+'.objects',problems):
+        return
+    objects = lane['objects']
+    if kind == 'grass' and len(objects) > 0:
+        problems.append('%s.objects: a grass lane cannot have objects' % path)
+
+    for pos in range(len(objects)):
+        item = objects[pos]
+        where = '%s.objects[%d]' % (path,pos)
+        if not _isDict(item,where,problems):
+            continue
+        _checkKeys(item,where,('type','position'),(),problems)
+
+        if 'type' in item:
+            name = item['type']
+            if type(name) != str:
+                problems.append('%s.type: %s is not a string' % (where,repr(name)))
+            elif not object is None and not name in object['images']:
+                problems.append('%s.type: %s is not an image in %s' % (where,repr(name),OBJECT_DATA))
+            elif kind == 'hedge' and not name in HEDGE_OBJECTS:
+                problems.append('%s.type: a hedge can only have %s' % (where,' or '.join(HEDGE_OBJECTS)))
+            elif kind != 'hedge' and name in HEDGE_OBJECTS:
+                problems.append('%s.type: %s can only be in a hedge' % (where,repr(name)))
+
+        if 'position' in item and _isNumber(item['position'],where+'.position',problems):
+            if not width is None and not offscreen is None:
+                value = item['position']
+                if not -offscreen <= value <= width+offscreen:
+                    problems.append('%s.position: %s is outside of the level and its offscreen buffer' %
+                                    (where,repr(value)))
+
+
+def _checkImage(image,path,problems):
+    """
+    Adds the problems with the file and size of an image (or sprite) to problems.
+
+    Parameter image: the image to check
+    Precondition: image is a dictionary
+
+    Parameter path: the JSON path of the image
+    Precondition: path is a string
+
+    Parameter problems: the problems found so far
+    Precondition: problems is a list of strings
+    """
+    if 'file' in image and type(image['file']) != str:
+        problems.append('%s.file: %s is not a string' % (path,repr(image['file'])))
+    if 'size' in image and _isPair(image['size'],path+'.size',problems):
+        _isPositive(image['size'][0],path+'.size[0]',problems)
+        _isPositive(image['size'][1],path+'.size[1]',problems)
+
+
+def _checkSprite(sprite,path,problems):
+    """
+    Adds the problems with the format and hitboxes of a sprite to problems.
+
+    A sprite with hitboxes must have one for every frame of its format.
+
+    Parameter sprite: the sprite to check
+    Precondition: sprite is a dictionary
+
+    Parameter path: the JSON path of the sprite
+    Precondition: path is a string
+
+    Parameter problems: the problems found so far
+    Precondition: problems is a list of strings
+    """
+    frames = None
+    if 'format' in sprite and _isPair(sprite['format'],path+'.format',problems):
+        valid = True
+        for pos in range(2):
+            value = sprite['format'][pos]
+            if type(value) != int or value <= 0:
+                problems.append('%s.format[%d]: %s is not a positive int' % (path,pos,repr(value)))
+                valid = False
+        if valid:
+            frames = sprite['format'][0]*sprite['format'][1]
+
+    if 'hitboxes' in sprite and _isList(sprite['hitboxes'],path+'.hitboxes',problems):
+        hitboxes = sprite['hitboxes']
+        if not frames is None and len(hitboxes) != frames:
+            problems.append('%s.hitboxes: there are %d hitboxes, but %d frames' %
+                            (path,len(hitboxes),frames))
+        for pos in range(len(hitboxes)):
+            _isHitbox(hitboxes[pos],'%s.hitboxes[%d]' % (path,pos),problems)
+
+
+def _checkKeys(value,path,required,optional,problems):
+    """
+    Adds a problem to problems for every missing key and every unknown key of value.
+
+    Parameter value: the dictionary to check
+    Precondition: value is a dictionary
+
+    Parameter path: the JSON path of value
+    Precondition: path is a string
+
+    Parameter required: the keys that value must have
+    Precondition: required is a tuple of strings
+
+    Parameter optional: the other keys that value may have
+    Precondition: optional is a tuple of strings
+    """
+    for key in required:
+        if not key in value:
+            problems.append('%s: missing key %s' % (path,repr(key)))
+    for key in value:
+        if not key in required and not key in optional:
+            problems.append('%s.%s: unknown key' % (path,key))
+
+
+def _isDict(value,path,problems):
+    """
+    Returns: True if value is a dictionary (and adds a problem to problems if not)
+
+    Parameter value: the value to check
+    Precondition: value is any value read from JSON
+
+    Parameter path: the JSON path of value
+    Precondition: path is a string
+
+    Parameter problems: the problems found so far
+    Precondition: problems is a list of strings
+    """
+    if type(value) == dict:
+        return True
+    problems.append('%s: %s is not an object' % (path,_describe(value)))
+    return False
+
+
+def _isList(value,path,problems):
+    """
+    Returns: True if value is a list (and adds a problem to problems if not)
+
+    Parameter value: the value to check
+    Precondition: value is any value read from JSON
+
+    Parameter path: the JSON path of value
+    Precondition: path is a string
+
+    Parameter problems: the problems found so far
+    Precondition: problems is a list of strings
+    """
+    if type(value) == list:
+        return True
+    problems.append('%s: %s is not a list' % (path,_describe(value)))
+    return False
+
+
+def _isPair(value,path,problems):
+    """
+    Returns: True if value is a list of two items (and adds a problem to problems if not)
+
+    Parameter value: the value to check
+    Precondition: value is any value read from JSON
+
+    Parameter path: the JSON path of value
+    Precondition: path is a string
+
+    Parameter problems: the problems found so far
+    Precondition: problems is a list of strings
+    """
+    if type(value) == list and len(value) == 2:
+        return True
+    problems.append('%s: %s is not a list of 2 numbers' % (path,_describe(value)))
+    return False
+
+
+def _isNumber(value,path,problems):
+    """
+    Returns: True if value is a finite number (and adds a problem to problems if not)
+
+    Parameter value: the value to check
+    Precondition: value is any value read from JSON
+
+    Parameter path: the JSON path of value
+    Precondition: path is a string
+
+    Parameter problems: the problems found so far
+    Precondition: problems is a list of strings
+    """
+    if (type(value) == int or type(value) == float) and math.isfinite(value):
+        return True
+    problems.append('%s: %s is not a number' % (path,_describe(value)))
+    return False
+
+
+def _isPositive(value,path,problems):
+    """
+    Returns: True if value is a number > 0 (and adds a problem to problems if not)
+
+    Parameter value: the value to check
+    Precondition: value is any value read from JSON
+
+    Parameter path: the JSON path of value
+    Precondition: path is a string
+
+    Parameter problems: the problems found so far
+    Precondition: problems is a list of strings
+    """
+    if not _isNumber(value,path,problems):
+        return False
+    if value <= 0:
+        problems.append('%s: %s is not positive' % (path,repr(value)))
+        return False
+    return True
+
+
+def _isHitbox(value,path,problems):
+    """
+    Returns: True if value is a hitbox (and adds problems to problems if not)
+
+    A hitbox is a list of 4 numbers >= 0.
+
+    Parameter value: the value to check
+    Precondition: value is any value read from JSON
+
+    Parameter path: the JSON path of value
+    Precondition: path is a string
+
+    Parameter problems: the problems found so far
+    Precondition: problems is a list of strings
+    """
+    if type(value) != list or len(value) != 4:
+        problems.append('%s: %s is not a list of 4 numbers' % (path,_describe(value)))
+        return False
+    valid = True
+    for pos in range(4):
+        where = '%s[%d]' % (path,pos)
+        if not _isNumber(value[pos],where,problems):
+            valid = False
+        elif value[pos] < 0:
+            problems.append('%s: %s is negative' % (where,repr(value[pos])))
+            valid = False
+    return valid
+
+
+def _describe(value):
+    """
+    Returns: a short description of a value for a problem
+
+    Parameter value: the value to describe
+    Precondition: value is any value read from JSON
+    """
+    if type(value) == dict:
+        return 'an object'
+    elif type(value) == list:
+        return 'a list of %d items' % len(value)
+    return repr(value)
@@ -0,0 +1,2719 @@
+"""
+Headless simulation module for Froggit
+
+This module contains a render-free model of a single Froggit level.  The positions,
+speeds, hitboxes and exit state of the frog and of every lane are kept in plain Python
+data, and the method update in SimLevel steps the game with exactly the same rules that
+the Level subcontroller uses.  Nothing in this module imports Kivy, so a level can be
+played (e.g. by an automated playtester) without a window, a GL context or an audio
+device.
+
+The classes in level.py, lanes.py and models.py are views of the classes in this module.
+They build the GTile, GImage and GSprite objects for a level, and read the positions of
+the frog and the obstacles from the simulation whenever they are drawn.
+
+Since there is no audio device, the simulation does not play sounds.  Instead, it records
+the name of each sound effect (CROAK_SOUND, SPLAT_SOUND or TRILL_SOUND) that the game
+would play.  The Level subcontroller plays these after every update.
+
+The class VecLevel plays many copies of a level at once (e.g. to train or evaluate a
+policy).  It keeps the state of every copy in NumPy arrays and applies the rules of
+SimLevel to all of the copies in each step.
+
+# Michelle Ren Zhang [mr897]
+# 12.21.20
+"""
+from consts import *
+import copy
+import os.path
+import struct
+
+# NumPy is only needed for lanes with at least LANE_ARRAY_SIZE obstacles
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# The folder with the image files (needed for the size of images and sprites)
+IMAGE_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)),'Images')
+
+# The sizes of the image files that have been read so far
+_IMAGE_SIZES = {}
+
+# The margin (in pixels) that keeps the rounding of hitbox edges out of the grid checks
+_STAY_MARGIN = 1e-6
+
+# The margin (in updates) that keeps the rounding of a time from losing an update
+_STEP_MARGIN = 1e-6
+
+
+def imageSize(name):
+    """
+    Returns: The size (width,height) of the PNG file name in the Images folder
+
+    Obstacles and sprites take their size from their image file, just as a GImage or
+    GSprite takes its size from its texture.  This function reads that size from the
+    PNG header without decoding the image.  Sizes are cached after the first read.
+
+    Parameter name: The image file name
+    Precondition: name is a string naming a PNG file in the Images folder
+    """
+    if name in _IMAGE_SIZES:
+        return _IMAGE_SIZES[name]
+
+    with open(os.path.join(IMAGE_FOLDER,name),'rb') as f:
+        header = f.read(24)
+    assert header[:8] == b'\x89PNG\r\n\x1a\n', '%s is not a PNG file' % repr(name)
+    size = struct.unpack('>II',header[16:24])
+    _IMAGE_SIZES[name] = size
+    return size
+
+
+def cacheImageSize(name,size):
+    """
+    Caches the size of an image file for imageSize, so its header is never read.
+
+    A compiled level (see levelfile.py) stores the sizes of its images.  An image that
+    is already cached keeps its size.
+
+    Parameter name: The image file name
+    Precondition: name is a string naming a PNG file in the Images folder
+
+    Parameter size: The size (width,height) of the image
+    Precondition: size is a pair of ints >= 0
+    """
+    if not name in _IMAGE_SIZES:
+        _IMAGE_SIZES[name] = tuple(size)
+
+
+def levelImages(json):
+    """
+    Returns: The sorted list of image files that a level draws
+
+    These are the tiles of the lanes, the obstacles, the frog and skull sprite sheets,
+    the frog head (for the lives) and the safe frog (for a taken exit).  The game can
+    decode all of these before the level is made (see GameApp.load_atlas).
+
+    Parameter json: the level
+    Precondition: json is a dictionary for a valid level JSON
+    """
+    names = {FROG_SPRITE+'.png',DEATH_SPRITE+'.png',FROG_HEAD,FROG_SAFE}
+    for data in json['lanes']:
+        names.add(data['type']+'.png')
+        for item in data.get('objects',[]):
+            names.add(item['type']+'.png')
+    return sorted(names)
+
+def hedgeCells(obstacles,width):
+    """
+    Returns: the occupancy grid of a hedge, as a list of lists of obstacle indices
+
+    The grid has one cell for each column of the level, plus one for a point on the
+    right edge.  Cell c lists (in order) the index of every obstacle whose hitbox
+    reaches into column c, so that only those obstacles can contain a point in that
+    column.
+
+    Parameter obstacles: the obstacles of the hedge
+    Precondition: obstacles is a list of SimObject objects that do not move
+
+    Parameter width: the level width in grid squares
+    Precondition: width is a number > 0 (int or float)
+    """
+    cells = [[] for column in range(int(width)+1)]
+    for pos in range(len(obstacles)):
+        (l,t,r,b) = obstacles[pos].bbox()
+        first = max(0,int(l // GRID_SIZE))
+        last = min(len(cells)-1,int(r // GRID_SIZE))
+        for column in range(first,last+1):
+            cells[column].append(pos)
+    return cells
+
+
+class SimInput(object):
+    """
+    A class representing scripted keyboard input for a headless level.
+
+    This class supports the part of the GInput interface that SimLevel uses, so that
+    a level can be driven by a script or a policy instead of a keyboard.  To press a
+    key, add its name (e.g. 'up') to the attribute keys.
+
+    Attribute keys: The names of the keys currently held down
+    Invariant: keys is a set of strings
+    """
+
+    @property
+    def key_count(self):
+        """
+        The number of keys currently held down.
+        """
+        return len(self.keys)
+
+    def __init__(self,keys=()):
+        """
+        Initializes the input with the given keys held down.
+
+        Parameter keys: The keys to hold down
+        Precondition: keys is an iterable of strings
+        """
+        self.keys = set(keys)
+
+    def is_key_down(self,key):
+        """
+        Returns: True if the key is currently held down
+
+        Parameter key: The key name
+        Precondition: key is a string
+        """
+        return key in self.keys
+
+    def press(self,*keys):
+        """
+        Replaces the keys held down with the given keys.
+
+        Parameter keys: The keys to hold down (none to release every key)
+        Precondition: keys are all strings
+        """
+        self.keys = set(keys)
+
+
+class SimObject(object):
+    """
+    A class representing an axis-aligned box with a hitbox.
+
+    This is the plain-data version of GObject.  The attributes x and y are the center
+    of the box, and the hitbox is a tuple of offsets (left, top, right, bottom) that
+    pull the edges of the box in towards the center.  The angle rotates the hitbox
+    with the object; it must be a multiple of 90 degrees.
+
+    Collisions use exactly the same edge computations as GObject, so that a headless
+    game agrees with the one on screen.
+
+    Attribute x: The horizontal coordinate of the center
+    Invariant: x is a float
+
+    Attribute y: The vertical coordinate of the center
+    Invariant: y is a float
+
+    Attribute width: The width of the box
+    Invariant: width is a number >= 0
+
+    Attribute height: The height of the box
+    Invariant: height is a number >= 0
+
+    Attribute angle: The angle of rotation in degrees
+    Invariant: angle is a number and a multiple of 90
+
+    Attribute hitbox: The hitbox offsets
+    Invariant: hitbox is a 4-element tuple of numbers
+
+    Attribute source: The image file for this object
+    Invariant: source is a string (or None if there is no image)
+    """
+
+    def __init__(self,x,y,width,height,hitbox=None,angle=0,source=None):
+        """
+        Initializes a box with the given position, size and hitbox.
+
+        Parameter x: The horizontal coordinate of the center
+        Precondition: x is a number (int or float)
+
+        Parameter y: The vertical coordinate of the center
+        Precondition: y is a number (int or float)
+
+        Parameter width: The width of the box
+        Precondition: width is a number >= 0
+
+        Parameter height: The height of the box
+        Precondition: height is a number >= 0
+
+        Parameter hitbox: The hitbox offsets
+        Precondition: hitbox is None or a 4-element list or tuple of numbers
+
+        Parameter angle: The angle of rotation in degrees
+        Precondition: angle is a number and a multiple of 90
+
+        Parameter source: The image file for this object
+        Precondition: source is a string or None
+        """
+        assert angle % 90 == 0, '%s is not a multiple of 90' % repr(angle)
+        self.x = float(x)
+        self.y = float(y)
+        self.width = width
+        self.height = height
+        self.angle = float(angle)
+        self.hitbox = (0,0,0,0) if hitbox is None else tuple(hitbox)
+        self.source = source
+
+    def bbox(self):
+        """
+        Returns: The bounding box of the hitbox as a tuple (l,t,r,b)
+
+        This is the same computation as GObject._bbox for objects rotated in 90
+        degree increments.
+        """
+        oangle = self.angle % 360
+        hit = self.hitbox
+        w = self.width/2
+        h = self.height/2
+        if oangle == 0:
+            l = self.x + hit[0] - w
+            r = self.x - hit[2] + w
+            t = self.y - hit[1] + h
+            b = self.y + hit[3] - h
+        elif oangle == 90:
+            t = self.y + hit[2] - w
+            b = self.y - hit[0] + w
+            r = self.x - hit[3] + h
+            l = self.x + hit[1] - h
+        elif oangle == 180:
+            l = self.x + hit[2] - w
+            r = self.x - hit[0] + w
+            t = self.y - hit[3] + h
+            b = self.y + hit[1] - h
+        else:
+            t = self.y + hit[0] - w
+            b = self.y - hit[2] + w
+            r = self.x - hit[1] + h
+            l = self.x + hit[3] - h
+        return (l,t,r,b)
+
+    def contains(self,point):
+        """
+        Returns: True if the hitbox contains the point
+
+        Parameter point: The point to check
+        Precondition: point is a pair of numbers
+        """
+        (l,t,r,b) = self.bbox()
+        return l <= point[0] <= r and b <= point[1] <= t
+
+    def collides(self,obj):
+        """
+        Returns: True if the hitbox of this object overlaps the hitbox of obj
+
+        Parameter obj: The object to check for collision
+        Precondition: obj is a SimObject
+        """
+        (l0,t0,r0,b0) = obj.bbox()
+        (l1,t1,r1,b1) = self.bbox()
+        isx = l1 <= l0 <= r1 or l0 <= l1 <= r0
+        isy = b1 <= b0 <= t1 or b0 <= b1 <= t0
+        return isx and isy
+
+
+class Tween(object):
+    """
+    A class representing an animation of one attribute of one object.
+
+    A tween replaces a generator-based animation coroutine with plain data.  It moves
+    an attribute of its target from a start value to an end value over a number of
+    seconds, and steps the frame of the target through a table of frames (e.g.
+    FROG_HOP_FRAMES) over equal parts of that time.  The target must have an int
+    attribute frame if there is a table of frames.
+
+    Tweens are advanced by a TweenGroup, which updates every tween it has in one call,
+    so many objects can be animated at once without a coroutine for each of them.
+
+    Attribute target: The object being animated
+    Invariant: target is an object
+
+    Attribute attribute: The name of the attribute being animated
+    Invariant: attribute is a string naming a number attribute of target
+    """
+    # LIST ALL HIDDEN ATTRIBUTES HERE
+    # Attribute _start: the value of the attribute when the tween starts
+    # Invariant: _start is a number
+    #
+    # Attribute _end: the value of the attribute when the tween is done
+    # Invariant: _end is a number
+    #
+    # Attribute _change: the change in the attribute over the tween
+    # Invariant: _change is a number != 0
+    #
+    # Attribute _rate: the change in the attribute per second
+    # Invariant: _rate is a number != 0
+    #
+    # Attribute _value: the value of the attribute so far
+    # Invariant: _value is a number between _start and _end
+    #
+    # Attribute _frames: the frame for each equal part of the tween
+    # Invariant: _frames is a tuple of ints (or None to leave the frame alone)
+    #
+    # Attribute _done: whether the tween has reached its end
+    # Invariant: _done is a bool
+
+    def __init__(self,target,attribute,change,duration,frames=None):
+        """
+        Initializes a tween that changes an attribute by change over duration seconds.
+
+        The tween starts from the current value of the attribute.
+
+        Parameter target: The object to animate
+        Precondition: target is an object
+
+        Parameter attribute: The name of the attribute to animate
+        Precondition: attribute is a string naming a number attribute of target
+
+        Parameter change: The change in the attribute over the tween
+        Precondition: change is a number != 0
+
+        Parameter duration: The number of seconds that the tween takes
+        Precondition: duration is a number > 0
+
+        Parameter frames: The frame for each equal part of the tween
+        Precondition: frames is a nonempty list or tuple of ints, or None
+        """
+        assert change != 0, 'a tween must change its attribute'
+        assert duration > 0, '%s is not a positive duration' % repr(duration)
+        self.target = target
+        self.attribute = attribute
+        self._start = getattr(target,attribute)
+        self._end = self._start+change
+        self._change = change
+        self._rate = (self._end-self._start)/duration
+        self._value = self._start
+        self._frames = None if frames is None else tuple(frames)
+        self._done = False
+
+    def isDone(self):
+        """
+        Returns: True if the tween has reached its end
+        """
+        return self._done
+
+    def update(self,dt):
+        """
+        Advances the tween by dt seconds.
+
+        The attribute (and the frame) of the target are set for the new time.  Once
+        the tween reaches its end, the attribute is set to the end value exactly.
+
+        Parameter dt: The time in seconds since last update
+        Precondition: dt is a number (int or float)
+        """
+        self._value = self._value+self._rate*dt
+        if abs(self._value-self._start) >= abs(self._change):
+            self._value = self._end
+            self._done = True
+
+        setattr(self.target,self.attribute,self._value)
+        if not self._frames is None:
+            frac = (self._value-self._start)/(self._end-self._start)
+            size = len(self._frames)
+            self.target.frame = self._frames[min(int(frac*size),size-1)]
+
+
+class TweenGroup(object):
+    """
+    A class representing the tweens running at the same time.
+
+    The method update advances every tween in the group, and drops the tweens that
+    are done.  An object can be animated by several tweens at once (e.g. one for its
+    position and one for its color).
+    """
+    # LIST ALL HIDDEN ATTRIBUTES HERE
+    # Attribute _tweens: the tweens that are not done, in the order they were added
+    # Invariant: _tweens is a list of Tween objects
+
+    def __init__(self):
+        """
+        Initializes an empty group of tweens.
+        """
+        self._tweens = []
+
+    def __len__(self):
+        """
+        Returns: the number of tweens that are not done
+        """
+        return len(self._tweens)
+
+    def add(self,tween):
+        """
+        Adds a tween to this group.
+
+        The tween does not move its target until the next update.
+
+        Parameter tween: The tween to add
+        Precondition: tween is a Tween object that is not done
+        """
+        self._tweens.append(tween)
+
+    def isBusy(self,target=None):
+        """
+        Returns: True if a tween in this group animates target
+
+        Parameter target: The object to check
+        Precondition: target is an object, or None to check for any tween
+        """
+        if target is None:
+            return len(self._tweens) > 0
+        for tween in self._tweens:
+            if tween.target is target:
+                return True
+        return False
+
+    def update(self,dt):
+        """
+        Advances every tween in this group by dt seconds.
+
+        Tweens that reach their end are removed from the group.
+
+        Parameter dt: The time in seconds since last update
+        Precondition: dt is a number (int or float)
+        """
+        for tween in self._tweens:
+            tween.update(dt)
+        self._tweens = [tween for tween in self._tweens if not tween.isDone()]
+
+    def clear(self):
+        """
+        Removes every tween from this group, leaving the targets where they are.
+        """
+        self._tweens = []
+
+
+class SimFrog(SimObject):
+    """
+    A class representing the simulated frog.
+
+    The frog is a filmstrip with one hitbox per animation frame, so the hitbox changes
+    whenever the frame changes.  This class also makes the tween for hopping that
+    used to be a coroutine in the Frog sprite.
+
+    Attribute frame: The current animation frame
+    Invariant: frame is an int in 0..count-1, and hitbox is the frame-th hitbox
+    """
+    # LIST ALL HIDDEN ATTRIBUTES HERE
+    # Attribute _hitboxes: The hitbox for each animation frame
+    # Invariant: _hitboxes is a tuple of 4-element tuples
+    #
+    # Attribute _format: The grid size of the sprite sheet as (rows, columns)
+    # Invariant: _format is a 2-element tuple of ints > 0
+
+    @property
+    def frame(self):
+        """
+        The current animation frame (setting it also changes the hitbox)
+        """
+        return self._frame
+
+    @frame.setter
+    def frame(self,value):
+        assert type(value) == int, '%s is not an int' % repr(value)
+        assert 0 <= value < len(self._hitboxes), '%s is out of range' % repr(value)
+        self._frame = value
+        self.hitbox = self._hitboxes[value]
+
+    # GETTERS AND SETTERS
+    def getX(self):
+        """
+        Returns: the x-coordinate of the frog's current position.
+        """
+        return self.x
+
+    def setX(self,value):
+        """
+        Sets the x-coordinate of the frog position to value.
+
+        Parameter value: the frog new position's x-coordinate
+        Precondition: value is a valid number within the game window
+        (float or int)
+        """
+        self.x = value
+
+    def getY(self):
+        """
+        Returns: the y-coordinate of the frog's current position.
+        """
+        return self.y
+
+    def setY(self,value):
+        """
+        Sets the y-coordinate of the frog position to value.
+
+        Parameter value: the frog new position's y-coordinate
+        Precondition: value is a valid number within the game window
+        (float or int)
+        """
+        self.y = value
+
+    def setAngle(self,value):
+        """
+        Sets the frog's angle.
+
+        The frog heading's angles are defined in the file consts.py. FROG_NORTH
+        is 180, FROG_WEST is -90, FROG_EAST is 90 and FROG_SOUTH is 0.
+
+        Parameter value: the frog's new angle
+        Precondition: value is an int or a float
+        """
+        self.angle = value
+
+    def getFormat(self):
+        """
+        Returns: the grid size (rows, columns) of the frog sprite sheet.
+        """
+        return self._format
+
+    # INITIALIZER TO SET FROG POSITION
+    def __init__(self,x,y,object):
+        """
+        Initializes the frog at the given grid position.
+
+        Parameter x: the column of the frog's starting square
+        Precondition: x is a number (int or float)
+
+        Parameter y: the row of the frog's starting square
+        Precondition: y is a number (int or float)
+
+        Parameter object: JSON file that contains additional information about
+        image files
+        Precondition: object is a dictionary (not for a level file)
+        """
+        source = FROG_SPRITE + '.png'
+        self._format = tuple(object['sprites']['frog']['format'])
+        self._hitboxes = tuple(map(tuple,object['sprites']['frog']['hitboxes']))
+        size = imageSize(source)
+        super().__init__((x+0.5)*GRID_SIZE,(y+0.5)*GRID_SIZE,
+                        size[0]/self._format[1],size[1]/self._format[0],
+                        angle=FROG_NORTH,source=source)
+        self.frame = 0
+
+    # ANIMATION TWEENS
+    def hop(self,direction):
+        """
+        Returns: a tween that hops the frog one grid square over FROG_SPEED seconds.
+
+        The frog moves at a constant speed, and its frame follows FROG_HOP_FRAMES.
+        The tween does nothing until it is added to a TweenGroup.
+
+        Parameter direction: The direction to move.
+        Precondition: direction is a string and one of 'up', 'down', 'left' or
+        'right'.
+        """
+        assert direction in ('up','down','left','right'), '%s is not a direction' % repr(direction)
+        attribute = 'y' if direction in ('up','down') else 'x'
+        change = GRID_SIZE if direction in ('up','right') else -GRID_SIZE
+        return Tween(self,attribute,change,FROG_SPEED,frames=FROG_HOP_FRAMES)
+
+
+class SpatialHash(object):
+    """
+    A class representing a uniform grid of GRID_SIZE cells over a level.
+
+    Each obstacle of a level is in the cells of its lane's row that its hitbox reaches
+    horizontally.  A query for a point or a box then only looks at the obstacles in
+    the cells that the point or box touches, instead of every obstacle in the level.
+    Cells are only stored while they have obstacles, so there is no limit on the
+    columns (obstacles may be offscreen).
+
+    The lanes keep the grid up to date.  When an obstacle moves, its lane computes the
+    columns that its hitbox now reaches, and the grid only changes if those columns
+    are different (which happens about once every GRID_SIZE pixels).
+    """
+    # LIST ALL HIDDEN ATTRIBUTES HERE
+    # Attribute _cells: the obstacles in each cell
+    # Invariant: _cells is a dictionary from (column,row) to a non-empty dictionary
+    # whose keys are the obstacles in that cell (the values are all None)
+    #
+    # Attribute _where: the cells of each obstacle
+    # Invariant: _where is a dictionary from each obstacle in the grid to a tuple
+    # (row,first,last) of its row and the first and last column of its cells
+
+    @staticmethod
+    def columns(left,right):
+        """
+        Returns: the first and last column of the cells that [left,right] reaches
+
+        Parameter left: the left end of the interval
+        Precondition: left is a number (int or float)
+
+        Parameter right: the right end of the interval
+        Precondition: right is a number >= left
+        """
+        return (int(left // GRID_SIZE),int(right // GRID_SIZE))
+
+    def __init__(self):
+        """
+        Initializes an empty grid.
+        """
+        self._cells = {}
+        self._where = {}
+
+    def place(self,obj,row,first,last):
+        """
+        Puts obj in the cells of the given row from column first to column last.
+
+        If obj is already in exactly those cells, this method does nothing.
+
+        Parameter obj: the obstacle to place
+        Precondition: obj is a SimObject
+
+        Parameter row: the row of the obstacle's lane
+        Precondition: row is an int
+
+        Parameter first: the first column of the obstacle's cells
+        Precondition: first is an int
+
+        Parameter last: the last column of the obstacle's cells
+        Precondition: last is an int >= first
+        """
+        where = (row,first,last)
+        old = self._where.get(obj)
+        if old == where:
+            return
+        if not old is None:
+            self._clear(obj,old)
+        for column in range(first,last+1):
+            key = (column,row)
+            if key in self._cells:
+                self._cells[key][obj] = None
+            else:
+                self._cells[key] = {obj:None}
+        self._where[obj] = where
+
+    def remove(self,obj):
+        """
+        Removes obj from the grid (if it is in the grid).
+
+        Parameter obj: the obstacle to remove
+        Precondition: obj is a SimObject
+        """
+        if obj in self._where:
+            self._clear(obj,self._where.pop(obj))
+
+    def getCell(self,column,row):
+        """
+        Returns: the obstacles whose hitbox reaches the cell (column,row)
+
+        Parameter column: the column of the cell
+        Precondition: column is an int
+
+        Parameter row: the row of the cell
+        Precondition: row is an int
+        """
+        if (column,row) in self._cells:
+            return list(self._cells[(column,row)])
+        return []
+
+    def query(self,row,left,right):
+        """
+        Returns: the obstacles of the given row that might overlap [left,right]
+
+        The result has every obstacle of the row whose hitbox overlaps the interval
+        horizontally, and possibly some others in the same cells.  Each obstacle is
+        in the result only once.
+
+        Parameter row: the row to search
+        Precondition: row is an int
+
+        Parameter left: the left end of the interval
+        Precondition: left is a number (int or float)
+
+        Parameter right: the right end of the interval
+        Precondition: right is a number >= left
+        """
+        (first,last) = SpatialHash.columns(left,right)
+        if first == last:
+            if (first,row) in self._cells:
+                return list(self._cells[(first,row)])
+            return []
+
+        result = {}
+        for column in range(first,last+1):
+            if (column,row) in self._cells:
+                result.update(self._cells[(column,row)])
+        return list(result)
+
+    def queryBox(self,box):
+        """
+        Returns: the obstacles in every row that might overlap the box
+
+        Parameter box: the box as a tuple (l,t,r,b), e.g. from SimObject.bbox
+        Precondition: box is a 4-element tuple of numbers with l <= r and b <= t
+        """
+        (l,t,r,b) = box
+        result = {}
+        for row in range(int(b // GRID_SIZE),int(t // GRID_SIZE)+1):
+            result.update(dict.fromkeys(self.query(row,l,r)))
+        return list(result)
+
+    # HELPER METHODS
+    def _clear(self,obj,where):
+        """
+        Removes obj from the cells given by where.
+
+        Parameter obj: the obstacle to remove
+        Precondition: obj is a SimObject
+
+        Parameter where: the cells of obj
+        Precondition: where is a tuple (row,first,last) from _where
+        """
+        (row,first,last) = where
+        for column in range(first,last+1):
+            cell = self._cells[(column,row)]
+            del cell[obj]
+            if not cell:
+                del self._cells[(column,row)]
+
+
+class SimLane(object):
+    """
+    Parent class for a simulated lane.
+
+    A lane is GRID_SIZE high and the width of the level wide.  It has a background
+    box (the tile) and a list of obstacles, all of which move at the lane speed and
+    wrap around once they are offscreen by more than the offscreen buffer.
+
+    The obstacles of every lane are in a SpatialHash (shared by all of the lanes of a
+    level), so that the obstacles overlapping an interval of the lane are found from
+    the cells of the interval instead of testing every obstacle.  The lane updates the
+    grid (only for the obstacles that changed cells) before it is used.
+
+    A moving lane with at least LANE_ARRAY_SIZE obstacles (if NumPy is installed) is
+    array-backed.  It keeps the x coordinates of its obstacles in a single array and
+    moves and wraps them all in one vectorized step.  The obstacles themselves are
+    only updated from the array when they are needed (for a collision or a draw).
+    """
+    # LIST ALL HIDDEN ATTRIBUTES HERE
+    # Attribute _type: the lane type from the level file
+    # Invariant: _type is one of 'grass', 'road', 'water' or 'hedge'
+    #
+    # Attribute _row: the row of this lane (0 is the bottom of the level)
+    # Invariant: _row is an int >= 0
+    #
+    # Attribute _tile: the background box of the lane
+    # Invariant: _tile is a SimObject
+    #
+    # Attribute _objs: contains all obstacles in a lane
+    # Invariant: _objs is a list of SimObject objects
+    #
+    # Attribute _grid: the spatial hash with the obstacles of this lane
+    # Invariant: _grid is a SpatialHash with every obstacle of _objs in row _row
+    #
+    # Attribute _edges: the hitbox offsets of each obstacle, used to find its edges
+    # Invariant: _edges is a list of tuples (left,right,half) for the obstacles in
+    # _objs, where the hitbox of obstacle obs spans x from (obs.x+left)-half to
+    # (obs.x-right)+half (the same computation as SimObject.bbox)
+    #
+    # Attribute _stay: the interval of x coordinates that keeps each obstacle in the
+    # same cells of the grid
+    # Invariant: _stay is a list of (low,high) tuples for the obstacles in _objs.
+    # While low < obs.x < high, the obstacle does not need to be placed again.
+    #
+    # Attribute _first, _last: the first and last column of the cells of each obstacle
+    # in an array-backed lane
+    # Invariant: _first and _last are NumPy int arrays with the columns of _objs[i]
+    # in the grid, or None if the lane is not array-backed
+    #
+    # Attribute _xs: the x coordinates of the obstacles in an array-backed lane
+    # Invariant: _xs is a NumPy array with _xs[i] the position of _objs[i], or None if
+    # the lane is not array-backed
+    #
+    # Attribute _stale: whether the obstacles are behind the positions in _xs
+    # Invariant: _stale is a bool (always False if _xs is None)
+    #
+    # Attribute _moved: whether the obstacles have moved since the grid was updated
+    # Invariant: _moved is a bool (the grid is up to date if it is False)
+    #
+    # Attribute _speed: speed in which the obstacles move (in pixels per second)
+    # Invariant: _speed is a number (int or float), 0 if the lane has no speed
+    #
+    # Attribute _buffer: distance in grids that the objects are allowed to go
+    # offscreen
+    # Invariant: _buffer is a number (int or float)
+    #
+    # Attribute _width: the width of the level in grid squares
+    # Invariant: _width is a number > 0
+
+    # GETTERS AND SETTERS
+    def getType(self):
+        """
+        Returns: the lane type ('grass', 'road', 'water' or 'hedge').
+        """
+        return self._type
+
+    def getRow(self):
+        """
+        Returns: the row of this lane.
+        """
+        return self._row
+
+    def getTile(self):
+        """
+        Returns: the background box of this lane.
+        """
+        return self._tile
+
+    def getSpeed(self):
+        """
+        Returns: speed at which the obstacles are moving.
+        """
+        return self._speed
+
+    def getObstacles(self):
+        """
+        Returns: the list of obstacles in this lane.
+        """
+        if self._stale:
+            self._sync()
+        return self._objs
+
+    # INITIALIZER TO SET LANE POSITION, BACKGROUND, AND OBJECTS
+    def __init__(self,json,i,w,object,grid=None):
+        """
+        Initializes the lane and its obstacles from the level file.
+
+        Parameter json: level that is currently being played
+        Precondition: json is a dictionary for a valid level JSON
+
+        Parameter i: the index of this lane in the level file
+        Precondition: i is an int>=0
+
+        Paramter w: the level width in grid squares
+        Precondition: w is a number>0 (int or float)
+
+        Parameter object: JSON file that contains additional information about
+        image files
+        Precondition: object is a dictionary (not for a level file)
+
+        Parameter grid: the spatial hash of the level
+        Precondition: grid is a SpatialHash, or None for the lane to have its own
+        """
+        data = json['lanes'][i]
+        self._type = data['type']
+        self._row = i
+        self._width = w
+        self._speed = data['speed'] if 'speed' in data else 0
+        self._buffer = json['offscreen']
+        self._tile = SimObject(w*GRID_SIZE/2,(i+0.5)*GRID_SIZE,w*GRID_SIZE,GRID_SIZE,
+                               source=self._type+'.png')
+
+        self._objs = []
+        angle = 180 if self._speed < 0 else 0
+        if 'objects' in data:
+            for item in data['objects']:
+                name = item['type']
+                source = name + '.png'
+                size = imageSize(source)
+                obstacle = SimObject((item['position']+0.5)*GRID_SIZE,self._tile.y,
+                                     size[0],size[1],hitbox=object['images'][name]['hitbox'],
+                                     angle=angle,source=source)
+                self._objs.append(obstacle)
+
+        # The obstacles face left or right, so only the hitbox offsets along x differ
+        self._edges = []
+        for obs in self._objs:
+            hit = obs.hitbox
+            if angle == 180:
+                self._edges.append((hit[2],hit[0],obs.width/2))
+            else:
+                self._edges.append((hit[0],hit[2],obs.width/2))
+
+        self._grid = SpatialHash() if grid is None else grid
+        self._stay = [None]*len(self._objs)
+        for pos in range(len(self._objs)):
+            self._place(pos)
+
+        self._xs = None
+        self._first = None
+        self._last = None
+        self._stale = False
+        self._moved = False
+        if numpy is not None and self._speed != 0 and len(self._objs) >= LANE_ARRAY_SIZE:
+            self._xs = numpy.array([obs.x for obs in self._objs],dtype=float)
+            edges = numpy.array(self._edges,dtype=float).reshape(-1,3)
+            (self._left,self._right,self._half) = edges.T
+            (self._first,self._last) = self._columns(self._xs)
+
+    # ADDITIONAL METHODS (COLLISIONS, MOVEMENT, ETC)
+    def update(self,dt):
+        """
+        Updates the movement of the obstacles in a lane.
+
+        This method updates the horizontal coordinate of the obstacles in order
+        to make them move. All obstacles in a lane move at the speed of the lane.
+        When the obstacles go offscreen, this method also wraps them back around
+        the other side.
+
+        Parameter dt: The time since the last animation frame.
+        Precondition: dt is a int or float.
+        """
+        width = self._width*GRID_SIZE
+        speed = self._speed*dt
+        buffer_right = width + (self._buffer*GRID_SIZE)
+        buffer_left = 0 - (self._buffer*GRID_SIZE)
+
+        if not self._xs is None:
+            self._updateArray(speed,buffer_left,buffer_right)
+            return
+
+        for obs in self._objs:
+            obs.x = obs.x + speed
+            if speed>0: # moves left to right -->
+                if obs.x >= buffer_right:
+                    d = buffer_right-obs.x
+                    obs.x = buffer_left + d
+            elif speed<0: # moves right to left <--
+                if obs.x <= buffer_left:
+                    d = obs.x-buffer_left
+                    obs.x = buffer_right - d
+        self._moved = speed != 0
+
+    def updateGrid(self):
+        """
+        Moves the obstacles of this lane to their current cells in the spatial hash.
+
+        The grid is only updated when it is used, so a lane that moves many times
+        between collision checks updates it once.  Only the obstacles that have left
+        their cells are moved.
+        """
+        if self._stale:
+            self._sync()
+        if not self._moved:
+            return
+
+        if self._xs is None:
+            for pos in range(len(self._objs)):
+                stay = self._stay[pos]
+                if not stay[0] < self._objs[pos].x < stay[1]:
+                    self._place(pos)
+        else:
+            (first,last) = self._columns(self._xs)
+            for pos in numpy.flatnonzero((first != self._first) | (last != self._last)).tolist():
+                self._grid.place(self._objs[pos],self._row,int(first[pos]),int(last[pos]))
+            self._first = first
+            self._last = last
+        self._moved = False
+
+    def overlapping(self,left,right):
+        """
+        Returns: The obstacles whose hitboxes overlap the interval [left,right]
+        horizontally
+
+        Parameter left: the left end of the interval
+        Precondition: left is a number (int or float)
+
+        Parameter right: the right end of the interval
+        Precondition: right is a number >= left
+        """
+        self.updateGrid()
+        result = []
+        for obs in self._grid.query(self._row,left,right):
+            (l,t,r,b) = obs.bbox()
+            if l <= right and left <= r:
+                result.append(obs)
+        return result
+
+    def collision(self,frog):
+        """
+        Returns: True if the frog overlaps the background of this lane.
+
+        Parameter frog: the frog that is playing the game
+        Precondition: frog is a SimFrog object
+        """
+        return self._tile.collides(frog)
+
+    # PREDICTION METHODS (FOR HINTS AND AI PLAYERS)
+    def predict(self,time,step=SIMULATION_STEP):
+        """
+        Returns: the x coordinates that the obstacles will have in time seconds
+
+        An obstacle that wraps does not land exactly on the other buffer edge; it lands
+        as far past it as it overshot, and that overshoot depends on the time step.  If
+        step is not None, the lane is assumed to be updated every step seconds (as in a
+        fixed-step game).  The updates are counted, and their moves are added up with
+        the same rounding as the method update, so every obstacle wraps on the same
+        update as it would if the lane were stepped.  That matters, since obstacles
+        often reach the buffer edge exactly on an update.  If step is None, the lane
+        moves continuously and an obstacle wraps exactly at the buffer edge.
+
+        Parameter time: the time from now in seconds
+        Precondition: time is a number >= 0
+
+        Parameter step: the time between updates of the lane
+        Precondition: step is None or a number > 0
+        """
+        result = []
+        for obs in self.getObstacles():
+            if step is None or self._speed == 0:
+                segment = self._path(obs.x,time,step)[-1]
+                result.append(segment[2]+self._speed*(time-segment[0]))
+            else:
+                result.append(self._stepPath(obs.x,time,step)[1])
+        return result
+
+    def occupied(self,column,horizon,step=SIMULATION_STEP):
+        """
+        Returns: the times in the next horizon seconds that an obstacle is in a column
+
+        The result is a sorted list of disjoint intervals (start,end), in seconds from
+        now.  The column is occupied while the hitbox of an obstacle overlaps the
+        square of the column horizontally.  Wrapping is predicted as in the method
+        predict.  An interval that lasts past the horizon ends at the horizon.
+
+        Parameter column: the column of the square
+        Precondition: column is an int
+
+        Parameter horizon: how far ahead to look, in seconds
+        Precondition: horizon is a number >= 0
+
+        Parameter step: the time between updates of the lane
+        Precondition: step is None or a number > 0
+        """
+        cleft = column*GRID_SIZE
+        cright = (column+1)*GRID_SIZE
+        times = []
+        for pos in range(len(self.getObstacles())):
+            (left,right,half) = self._edges[pos]
+            # The hitbox overlaps the column while lowest <= x <= highest
+            lowest = cleft+right-half
+            highest = cright-left+half
+            for (start,end,x) in self._path(self._objs[pos].x,horizon,step):
+                if self._speed == 0:
+                    span = (start,end) if lowest <= x <= highest else None
+                else:
+                    enter = start+((lowest if self._speed > 0 else highest)-x)/self._speed
+                    leave = start+((highest if self._speed > 0 else lowest)-x)/self._speed
+                    span = (max(start,enter),min(end,leave))
+                if not span is None and span[0] <= span[1]:
+                    times.append(span)
+
+        times.sort()
+        result = []
+        for span in times:
+            if result and span[0] <= result[-1][1]:
+                result[-1] = (result[-1][0],max(result[-1][1],span[1]))
+            else:
+                result.append(span)
+        return result
+
+    def nextFree(self,column,horizon,step=SIMULATION_STEP):
+        """
+        Returns: the next time that a column is free, as a pair (start,duration)
+
+        The start is in seconds from now (0 if the column is free now).  The duration
+        is how long the column stays free, up to the horizon.  The result is None if
+        the column is occupied for the whole horizon.
+
+        Parameter column: the column of the square
+        Precondition: column is an int
+
+        Parameter horizon: how far ahead to look, in seconds
+        Precondition: horizon is a number >= 0
+
+        Parameter step: the time between updates of the lane
+        Precondition: step is None or a number > 0
+        """
+        start = 0
+        for (begin,end) in self.occupied(column,horizon,step):
+            if start < begin:
+                return (start,begin-start)
+            start = end
+        if start < horizon:
+            return (start,horizon-start)
+        return None
+
+    def nextOccupied(self,column,horizon,step=SIMULATION_STEP):
+        """
+        Returns: the next time that a column is occupied, as a pair (start,duration)
+
+        The start is in seconds from now (0 if the column is occupied now).  The
+        duration is how long the column stays occupied, up to the horizon.  The result
+        is None if the column is free for the whole horizon.
+
+        Parameter column: the column of the square
+        Precondition: column is an int
+
+        Parameter horizon: how far ahead to look, in seconds
+        Precondition: horizon is a number >= 0
+
+        Parameter step: the time between updates of the lane
+        Precondition: step is None or a number > 0
+        """
+        times = self.occupied(column,horizon,step)
+        if times:
+            return (times[0][0],times[0][1]-times[0][0])
+        return None
+
+    def occupants(self,column,time,step=SIMULATION_STEP):
+        """
+        Returns: the obstacles that will be in a column in time seconds
+
+        Parameter column: the column of the square
+        Precondition: column is an int
+
+        Parameter time: the time from now in seconds
+        Precondition: time is a number >= 0
+
+        Parameter step: the time between updates of the lane
+        Precondition: step is None or a number > 0
+        """
+        cleft = column*GRID_SIZE
+        cright = (column+1)*GRID_SIZE
+        result = []
+        xs = self.predict(time,step)
+        for pos in range(len(xs)):
+            (left,right,half) = self._edges[pos]
+            if (xs[pos]+left)-half <= cright and cleft <= (xs[pos]-right)+half:
+                result.append(self._objs[pos])
+        return result
+
+
+    # HELPER METHODS
+    def _updateArray(self,speed,buffer_left,buffer_right):
+        """
+        Moves and wraps the obstacles of an array-backed lane in one step.
+
+        This is the same computation as the loop in update, applied to the whole
+        array of positions at once.
+
+        Parameter speed: the distance to move each obstacle
+        Precondition: speed is a number (int or float)
+
+        Parameter buffer_left: the left wrapping point
+        Precondition: buffer_left is a number (int or float)
+
+        Parameter buffer_right: the right wrapping point
+        Precondition: buffer_right is a number > buffer_left
+        """
+        xs = self._xs
+        xs += speed
+        self._stale = True
+
+        # Wrapping is rare, so only build the mask when something is offscreen
+        if speed>0 and xs.max() >= buffer_right:
+            wrap = xs >= buffer_right
+            xs[wrap] = buffer_left + (buffer_right-xs[wrap])
+        elif speed<0 and xs.min() <= buffer_left:
+            wrap = xs <= buffer_left
+            xs[wrap] = buffer_right - (xs[wrap]-buffer_left)
+        self._moved = True
+
+    def _sync(self):
+        """
+        Copies the positions of an array-backed lane to its obstacles.
+        """
+        for obs, x in zip(self._objs,self._xs.tolist()):
+            obs.x = x
+        self._stale = False
+
+    def _path(self,x,horizon,step):
+        """
+        Returns: the path of an obstacle over the next horizon seconds
+
+        The path is a list of segments (start,end,x), one for each time the obstacle
+        wraps.  Between the times start and end, the obstacle is at x plus the lane
+        speed times the time since start.  The last segment ends at the horizon.
+
+        If step is not None, the path follows the updates of the lane one at a time, as
+        the method update would, so that the obstacle wraps on the same update (see
+        predict).  This takes time proportional to the number of updates.
+
+        Parameter x: the current position of the obstacle
+        Precondition: x is a number (int or float)
+
+        Parameter horizon: how far ahead to look, in seconds
+        Precondition: horizon is a number >= 0
+
+        Parameter step: the time between updates of the lane
+        Precondition: step is None or a number > 0
+        """
+        if self._speed == 0:
+            return [(0,horizon,x)]
+
+        if not step is None:
+            return self._stepPath(x,horizon,step)[0]
+
+        buffer_right = self._width*GRID_SIZE + (self._buffer*GRID_SIZE)
+        buffer_left = 0 - (self._buffer*GRID_SIZE)
+        edge = buffer_right if self._speed > 0 else buffer_left
+        result = []
+        start = 0
+        while True:
+            # The time until the obstacle reaches the edge
+            wait = max(0,(edge-x)/self._speed)
+            if start+wait > horizon:
+                result.append((start,horizon,x))
+                return result
+            result.append((start,start+wait,x))
+            end = x+self._speed*wait
+            if self._speed > 0:
+                x = buffer_left + (buffer_right-end)
+            else:
+                x = buffer_right - (end-buffer_left)
+            start = start+wait
+
+    def _stepPath(self,x,horizon,step):
+        """
+        Returns: the pair (path,x) for an obstacle over the next horizon seconds
+
+        This is _path for a lane (with a speed) updated every step seconds.  The value
+        path is the list of segments, and x is the position of the obstacle after the
+        last update in the horizon.  The updates are counted with an int, and each one
+        moves and wraps the obstacle with exactly the same arithmetic as the method
+        update, so x is exactly the position the lane would have.  Adding up the moves
+        (rather than multiplying the speed by the time) matters, since the rounding of
+        the sum decides the update on which an obstacle that reaches the edge exactly
+        is wrapped.
+
+        Parameter x: the current position of the obstacle
+        Precondition: x is a number (int or float)
+
+        Parameter horizon: how far ahead to look, in seconds
+        Precondition: horizon is a number >= 0
+
+        Parameter step: the time between updates of the lane
+        Precondition: step is a number > 0
+        """
+        width = self._width*GRID_SIZE
+        buffer_right = width + (self._buffer*GRID_SIZE)
+        buffer_left = 0 - (self._buffer*GRID_SIZE)
+        speed = self._speed*step
+        updates = int(horizon/step+_STEP_MARGIN)
+        result = []
+        first = 0
+        start = x
+        for count in range(1,updates+1):
+            x = x + speed
+            if speed>0 and x >= buffer_right:
+                d = buffer_right-x
+                x = buffer_left + d
+            elif speed<0 and x <= buffer_left:
+                d = x-buffer_left
+                x = buffer_right - d
+            else:
+                continue
+            result.append((first*step,count*step,start))
+            first = count
+            start = x
+        result.append((first*step,horizon,start))
+        return (result,x)
+
+    def _place(self,pos):
+        """
+        Puts an obstacle in the cells of the grid that its hitbox reaches.
+
+        Parameter pos: the position of the obstacle in _objs
+        Precondition: pos is an int in 0..len(_objs)-1
+        """
+        obs = self._objs[pos]
+        (left,right,half) = self._edges[pos]
+        (first,last) = SpatialHash.columns((obs.x+left)-half,(obs.x-right)+half)
+        self._grid.place(obs,self._row,first,last)
+
+        # The edges are computed with rounding, so the interval is a little smaller
+        low = max(first*GRID_SIZE-left+half,last*GRID_SIZE+right-half)
+        high = min((first+1)*GRID_SIZE-left+half,(last+1)*GRID_SIZE+right-half)
+        self._stay[pos] = (low+_STAY_MARGIN,high-_STAY_MARGIN)
+
+    def _columns(self,xs):
+        """
+        Returns: the first and last columns of the cells of the obstacles, as two arrays
+
+        This is the same computation as _place, for all of the obstacles of an
+        array-backed lane at once.
+
+        Parameter xs: the x coordinates of the obstacles
+        Precondition: xs is a NumPy array with one entry for each obstacle in _objs
+        """
+        first = ((xs+self._left)-self._half) // GRID_SIZE
+        last = ((xs-self._right)+self._half) // GRID_SIZE
+        return (first.astype(int),last.astype(int))
+
+
+class SimGrass(SimLane):
+    """
+    A class representing a simulated 'safe' grass area.
+    """
+    pass
+
+
+class SimRoad(SimLane):
+    """
+    A class representing a simulated roadway with cars.
+    """
+
+    def squash(self,frog):
+        """
+        Returns: True if the frog has collided with a car.
+
+        Parameter frog: the frog that is playing the game
+        Precondition: frog is a SimFrog object
+        """
+        (l,t,r,b) = frog.bbox()
+        for obs in self.overlapping(l,r):
+            if obs.collides(frog):
+                return True
+        return False
+
+
+class SimWater(SimLane):
+    """
+    A class representing a simulated waterway with logs.
+
+    The frog will die in water unless its center is contained inside of a log.
+    """
+
+    def safe(self,frog):
+        """
+        Returns: True if the frog is safe (on a log)
+
+        Parameter frog: the frog that is playing the game
+        Precondition: frog is a SimFrog object
+        """
+        point = (frog.x,frog.y)
+        for obs in self.overlapping(frog.x,frog.x):
+            if obs.contains(point):
+                return True
+        return False
+
+
+class SimHedge(SimLane):
+    """
+    A class representing the simulated exit hedge.
+
+    The obstacles in a hedge are exits and openings (source 'open.png').  The frog
+    can pass through openings freely.  An exit is the win condition: when the frog
+    reaches it, the exit is taken and can never be used again.
+
+    The obstacles of a hedge never move, so the hedge keeps a grid with one cell for
+    each column of the level.  A cell lists the obstacles whose hitbox reaches into
+    that column, and a point is only checked against the obstacles of its cell.
+    """
+    # LIST ALL HIDDEN ATTRIBUTES HERE
+    # Attribute _exitlist: list that stores occupied exits
+    # Invariant: _exitlist is a list of SimObject objects in _objs
+    #
+    # Attribute _cells: the obstacles in each column of the hedge
+    # Invariant: _cells is a list of width+1 lists (the last one for the right edge),
+    # and _cells[c] has the obstacles of _objs (in order) whose hitbox reaches column c
+
+    def getTaken(self):
+        """
+        Returns: the list of occupied exits, in the order they were taken.
+        """
+        return self._exitlist
+
+    def __init__(self,json,i,w,object,grid=None):
+        """
+        Initializes the hedge with no occupied exits.
+
+        Parameter json: level that is currently being played
+        Precondition: json is a dictionary for a valid level JSON
+
+        Parameter i: the index of this lane in the level file
+        Precondition: i is an int>=0
+
+        Paramter w: the level width in grid squares
+        Precondition: w is a number>0 (int or float)
+
+        Parameter object: JSON file that contains additional information about
+        image files
+        Precondition: object is a dictionary (not for a level file)
+
+        Parameter grid: the spatial hash of the level
+        Precondition: grid is a SpatialHash, or None for the hedge to have its own
+        """
+        super().__init__(json,i,w,object,grid)
+        self._exitlist = []
+
+        # A compiled level (see levelfile.py) has the grid already
+        data = json['lanes'][i]
+        if 'cells' in data:
+            self._cells = [[self._objs[pos] for pos in cell] for cell in data['cells']]
+        else:
+            self._cells = [[self._objs[pos] for pos in cell] for cell in hedgeCells(self._objs,w)]
+
+    def getCells(self):
+        """
+        Returns: the obstacles in each column of this hedge (see hedgeCells).
+        """
+        return self._cells
+
+    def update(self,frog):
+        """
+        Marks the exit that contains the frog as occupied.
+
+        Parameter frog: the frog that is playing the game
+        Precondition: frog is a SimFrog object
+        """
+        point = (frog.x,frog.y)
+        for obs in self._cell(point):
+            if obs.source != 'open.png':
+                if obs.contains(point) and obs not in self._exitlist:
+                    self._exitlist.append(obs)
+
+    def containment(self,frog):
+        """
+        Returns: True if the frog's center is contained in an exit or opening.
+
+        Parameter frog: the frog that is playing the game
+        Precondition: frog is a SimFrog object
+        """
+        point = (frog.x,frog.y)
+        for obs in self._cell(point):
+            if obs.contains(point):
+                return True
+        return False
+
+    def block(self,frog):
+        """
+        Returns: True if the exit containing the frog is taken, False if it is
+        free, or None if the frog is not in an exit.
+
+        Parameter frog: the frog that is playing the game
+        Precondition: frog is a SimFrog object
+        """
+        point = (frog.x,frog.y)
+        for obs in self._cell(point):
+            if obs.source != 'open.png':
+                if obs.contains(point):
+                    return obs in self._exitlist
+        return None
+
+    def all_used(self):
+        """
+        Returns: True if all exits are occupied.
+        """
+        num_obs = 0
+        for obs in self._objs:
+            if obs.source != 'open.png':
+                num_obs = num_obs + 1
+        return len(self._exitlist) == num_obs
+
+    def opening(self,frog):
+        """
+        Returns: True if the frog is contained in an opening.
+
+        Parameter frog: the frog that is playing the game
+        Precondition: frog is a SimFrog object
+        """
+        point = (frog.x,frog.y)
+        for obs in self._cell(point):
+            if obs.contains(point):
+                if obs.source == 'open.png':
+                    return True
+        return False
+
+    # HELPER METHODS
+    def _cell(self,point):
+        """
+        Returns: the obstacles that could contain the point (those in its column)
+
+        Parameter point: The point to check
+        Precondition: point is a pair of numbers
+        """
+        column = int(point[0] // GRID_SIZE)
+        if 0 <= column < len(self._cells):
+            return self._cells[column]
+        return []
+
+
+class SimLevel(object):
+    """
+    This class simulates a single level of Froggit.
+
+    It has the same rules as the Level subcontroller, which is a view of this class.
+    The frog moves with the arrow keys, dies when hit by a car, when it falls in the
+    water, or when a log carries it offscreen, and is saved when it reaches a free
+    exit.  The level is won once every exit is taken, and lost once every life is gone.
+    """
+    # LIST ALL HIDDEN ATTRIBUTES HERE
+    # Attribute _width: Width of the level in grid squares
+    # Invariant: _width is an int or float > 0
+    #
+    # Attribute _height: Height of the level in grid squares
+    # Invariant: _height is an int or float > 0
+    #
+    # Attribute _lanes: the lanes of the level, indexed by row (0 is the bottom)
+    # Invariant: _lanes is a list of SimLane objects, and _lanes[i].getRow() == i
+    #
+    # Attribute _frog: frog to play the game
+    # Invariant: _frog is a SimFrog object (or None)
+    #
+    # Attribute _lives: the number of lives left
+    # Invariant: _lives is an int in 0..FROG_LIVES
+    #
+    # Attribute _exit: Checks if all exits are occupied
+    # Invariant: _exit is a boolean that is True if all exits are occupied,
+    # False otherwise
+    #
+    # Attribute _tweens: The animations in progress (the hop of the frog)
+    # Invariant: _tweens is a TweenGroup object
+    #
+    # Attribute _sounds: The sound effects played since the last call to popSounds
+    # Invariant: _sounds is a list of sound file names
+    #
+    # Attribute _start: the grid square where a new frog is placed
+    # Invariant: _start is a (column,row) tuple of numbers from the level JSON
+    #
+    # Attribute _object: information about the image files, used to make new frogs
+    # Invariant: _object is a dictionary (not for a level file)
+    #
+    # Attribute _grid: the spatial hash with the obstacles of every lane
+    # Invariant: _grid is a SpatialHash shared by the lanes in _lanes
+
+    # GETTERS AND SETTERS
+    def getWidth(self):
+        """
+        Returns: the width of the level in grid squares.
+        """
+        return self._width
+
+    def getHeight(self):
+        """
+        Returns: the height of the level in grid squares.
+        """
+        return self._height
+
+    def getLanes(self):
+        """
+        Returns: the lanes of this level, from bottom to top.
+        """
+        return self._lanes
+
+    def getFrog(self):
+        """
+        Returns: the frog (or None if there is no frog in play).
+        """
+        return self._frog
+
+    def getGrid(self):
+        """
+        Returns: the spatial hash with the obstacles of every lane.
+
+        The grid is brought up to date with the current obstacle positions first.
+        """
+        for lane in self._lanes:
+            lane.updateGrid()
+        return self._grid
+
+    def getOccupants(self,column,row,time=0):
+        """
+        Returns: the obstacles whose hitbox reaches the grid square (column,row)
+
+        If time is not 0, the result is the obstacles that will be in the square in
+        time seconds (see SimLane.predict).
+
+        Parameter column: the column of the square
+        Precondition: column is an int
+
+        Parameter row: the row of the square
+        Precondition: row is an int
+
+        Parameter time: the time from now in seconds
+        Precondition: time is a number >= 0
+        """
+        if time == 0:
+            return self.getGrid().getCell(column,row)
+        if 0 <= row < len(self._lanes):
+            return self._lanes[row].occupants(column,time)
+        return []
+
+    def setFrog(self,x,y,object):
+        """
+        Places a new frog at the given grid position.
+
+        Parameter x: the column of the frog's square
+        Precondition: x is a number (int or float)
+
+        Parameter y: the row of the frog's square
+        Precondition: y is a number (int or float)
+
+        Parameter object: JSON file that contains additional information about
+        image files
+        Precondition: object is a dictionary (not for a level file)
+        """
+        self._frog = SimFrog(x,y,object)
+
+    def resetFrog(self):
+        """
+        Places a new frog at the start of the level.
+
+        The frog uses the start position and image information that this level was
+        created with, so the level JSON does not need to be read again.
+        """
+        self.setFrog(self._start[0],self._start[1],self._object)
+
+    def getLives(self):
+        """
+        Returns: the number of lives left.
+        """
+        return self._lives
+
+    def getExit(self):
+        """
+        Returns: True if all exits are occupied, False otherwise
+        """
+        return self._exit
+
+    def isBusy(self):
+        """
+        Returns: True if an animation (the hop of the frog) is in progress
+
+        The frog does not respond to the keys while the level is busy.
+        """
+        return self._tweens.isBusy()
+
+    def popSounds(self):
+        """
+        Returns: the sound effects played since the last call, in order
+
+        The list of sound effects is emptied by this call.
+        """
+        result = self._sounds
+        self._sounds = []
+        return result
+
+    # INITIALIZER TO CREATE THE FROG AND LANES
+    def __init__(self,json,object):
+        """
+        Initializes the frog, the lanes, and the lives counter.
+
+        Parameter json: level that is currently being played
+        Precondition: json is a dictionary for a valid level JSON
+
+        Parameter object: JSON file that contains additional information about
+        image files
+        Precondition: object is a dictionary (not for a level file)
+        """
+        self._width = json['size'][0]
+        self._height = json['size'][1]
+        self._exit = False
+        self._lives = FROG_LIVES
+        self._tweens = TweenGroup()
+        self._sounds = []
+        self._start = (json['start'][0],json['start'][1])
+        self._object = object
+        self.resetFrog()
+
+        self._grid = SpatialHash()
+        self._lanes = []
+        for i in range(len(json['lanes'])):
+            name = json['lanes'][i]['type']
+            if name == 'grass':
+                lane = SimGrass(json,i,self._width,object,self._grid)
+            elif name == 'road':
+                lane = SimRoad(json,i,self._width,object,self._grid)
+            elif name == 'water':
+                lane = SimWater(json,i,self._width,object,self._grid)
+            elif name == 'hedge':
+                lane = SimHedge(json,i,self._width,object,self._grid)
+            self._lanes.append(lane)
+
+    # UPDATE METHOD TO MOVE THE FROG AND UPDATE ALL OF THE LANES
+    def update(self,input,dt):
+        """
+        Updates the frog, the individual lanes, and the lives counter.
+
+        Parameter input: the keyboard input
+        Precondition: input is a GInput or SimInput object
+
+        Parameter dt: The time in seconds since last update
+        Precondition: dt is a number (int or float)
+        """
+        self._frogWater(dt)
+
+        if self._tweens.isBusy():
+            self._tweens.update(dt)
+        elif self._frog is None:
+            pass
+        elif input.is_key_down('up'):
+            self._moveUp()
+        elif input.is_key_down('down'):
+            self._moveDown()
+        elif input.is_key_down('left'):
+            self._moveLeft()
+        elif input.is_key_down('right'):
+            self._moveRight()
+
+        self._blueFrog()
+
+        self._frogWin()
+
+        for lane in self._lanes:
+            # grass and hedges dont have obstacles that move
+            if not isinstance(lane,SimGrass) and not isinstance(lane,SimHedge):
+                lane.update(dt)
+
+        if self._checkRoad():
+            self._killFrog()
+
+        if self._checkWater() == False and not self._tweens.isBusy():
+            self._killFrog()
+
+    def detectLives(self):
+        """
+        Returns: True if the frog has no lives left
+        """
+        return self._lives == 0
+
+    # HELPER METHODS
+    def _killFrog(self):
+        """
+        Removes the frog from play and takes away a life.
+        """
+        self._lives -= 1
+        self._frog = None
+        self._sounds.append(SPLAT_SOUND)
+
+    def _frogWater(self,dt):
+        """
+        Moves the frog with the log it is sitting on.
+
+        The frog dies if the log carries its center offscreen.
+
+        Parameter dt: The time in seconds since last update
+        Precondition: dt is a number (int or float)
+        """
+        if self._checkWater() and not self._tweens.isBusy():
+            lane = self._findLane(SimWater)
+            spos = self._frog.x+lane.getSpeed()*dt
+            self._frog.setX(spos)
+            if spos<=0 or spos>=self._width*GRID_SIZE:
+                self._killFrog()
+
+    def _blueFrog(self):
+        """
+        Occupies the exit that the frog has reached (if it is free).
+        """
+        if self._checkHedge() and self._checkTaken() == False:
+            self._findLane(SimHedge).update(self._frog)
+            self._sounds.append(TRILL_SOUND)
+            self._frog = None
+
+    def _frogWin(self):
+        """
+        Checks if all exits are occupied.
+        """
+        win = []
+        for lane in self._lanes:
+            if isinstance(lane,SimHedge):
+                win.append(lane.all_used())
+        if False not in win:
+            self._exit = True
+
+    def _moveUp(self):
+        """
+        Moves the frog upwards.
+
+        The frog cannot move outside the window, into hedge tiles or into occupied
+        exits.
+        """
+        currentY = self._frog.y
+
+        self._frog.setAngle(FROG_NORTH)
+        if currentY + GRID_SIZE <= self._height*GRID_SIZE:
+            self._frog.setY(currentY+GRID_SIZE)
+            hedge = self._checkHedge()
+            taken = self._checkTaken()
+            self._frog.setY(currentY)
+            if hedge == False or taken == True:
+                return
+            elif hedge and taken == False:
+                self._sounds.append(TRILL_SOUND)
+            else:
+                self._sounds.append(CROAK_SOUND)
+            self._tweens.add(self._frog.hop('up'))
+
+    def _moveDown(self):
+        """
+        Moves the frog downwards.
+
+        The frog cannot move outside the window, and can only move through hedges
+        at an opening.
+        """
+        currentY = self._frog.y
+
+        self._frog.setAngle(FROG_SOUTH)
+        if currentY - GRID_SIZE >= 0:
+            self._frog.setY(currentY-GRID_SIZE)
+            opening = self._checkOpening()
+            self._frog.setY(currentY)
+            if opening != False:
+                self._sounds.append(CROAK_SOUND)
+                self._tweens.add(self._frog.hop('down'))
+
+    def _moveLeft(self):
+        """
+        Moves frog to the left.
+
+        The frog cannot move outside the window, and can only move through hedges
+        at an opening.
+        """
+        currentX = self._frog.x
+
+        self._frog.setAngle(FROG_WEST)
+        if currentX - GRID_SIZE >= 0:
+            self._frog.setX(currentX-GRID_SIZE)
+            opening = self._checkOpening()
+            self._frog.setX(currentX)
+            if opening != False:
+                self._sounds.append(CROAK_SOUND)
+                self._tweens.add(self._frog.hop('left'))
+
+    def _moveRight(self):
+        """
+        Moves frog to the right.
+
+        The frog cannot move outside the window, and can only move through hedges
+        at an opening.
+        """
+        currentX = self._frog.x
+
+        self._frog.setAngle(FROG_EAST)
+        if currentX + GRID_SIZE <= self._width*GRID_SIZE:
+            self._frog.setX(currentX+GRID_SIZE)
+            opening = self._checkOpening()
+            self._frog.setX(currentX)
+            if opening != False:
+                self._sounds.append(CROAK_SOUND)
+                self._tweens.add(self._frog.hop('right'))
+
+    def _findLane(self,kind):
+        """
+        Returns: The lane of the given type that contains the frog's center, or None
+        if there is no such lane (or no frog)
+
+        Lanes are stacked GRID_SIZE high from the bottom of the level, so the lane
+        under the frog comes straight from its row.  A center exactly on the boundary
+        between two rows is in both lanes; in that case the lower lane is preferred.
+
+        Parameter kind: the lane class to look for
+        Precondition: kind is a subclass of SimLane
+        """
+        if self._frog == None:
+            return None
+
+        x = self._frog.x
+        y = self._frog.y
+        if x < 0 or x > self._width*GRID_SIZE:
+            return None
+
+        row = int(y // GRID_SIZE)
+        if y == row*GRID_SIZE:
+            rows = (row-1,row)
+        else:
+            rows = (row,)
+
+        for row in rows:
+            if 0 <= row < len(self._lanes) and isinstance(self._lanes[row],kind):
+                return self._lanes[row]
+        return None
+
+    def _checkHedge(self):
+        """
+        Returns: True if the frog is contained within an exit or opening, False if it
+        is in a hedge but not in an exit, and None if it is not in a hedge.
+        """
+        lane = self._findLane(SimHedge)
+        if lane != None and lane.collision(self._frog):
+            return lane.containment(self._frog)
+        return None
+
+    def _checkRoad(self):
+        """
+        Returns: True if the frog has collided with a car, False if it is on a road
+        and safe, and None if it is not on a road.
+        """
+        lane = self._findLane(SimRoad)
+        if lane != None:
+            return lane.squash(self._frog)
+        return None
+
+    def _checkWater(self):
+        """
+        Returns: True if the frog is on a log, False if it is in the water, and None
+        if it is not in a water lane.
+        """
+        lane = self._findLane(SimWater)
+        if lane != None:
+            return lane.safe(self._frog)
+        return None
+
+    def _checkOpening(self):
+        """
+        Returns: True if an opening contains the frog, False if the frog is in a hedge
+        but not in an opening, and None if it is not in a hedge.
+        """
+        lane = self._findLane(SimHedge)
+        if lane != None:
+            return lane.opening(self._frog)
+        return None
+
+    def _checkTaken(self):
+        """
+        Returns: True if the frog is in a taken exit, False if it is in a free exit,
+        and None if it is not in an exit.
+        """
+        lane = self._findLane(SimHedge)
+        if lane != None:
+            return lane.block(self._frog)
+        return None
+
+
+class VecLevel(object):
+    """
+    This class simulates many copies of the same Froggit level at once.
+
+    Every copy has its own frog, lives, exits and obstacle positions, but the state of
+    all of them is kept in NumPy arrays with one entry per copy, and the method step
+    updates every copy in one call.  The rules are those of SimLevel.update applied to
+    whole arrays: the same lane movement and wrapping, the same road, water and hedge
+    checks, and the same hopping animation.  A copy that is given the same actions as
+    a SimLevel stays in exactly the same state.
+
+    A SimLevel waits for the player to continue after the frog dies or reaches an exit.
+    A copy instead gets a new frog at the start of the next step.  A copy is done once
+    it has no lives left or every exit is taken, and is not updated again until it is
+    reset.
+
+    Actions are indices into VEC_ACTIONS: 0 presses no key, and 1 to 4 press 'up',
+    'down', 'left' and 'right'.  This class requires NumPy.
+    """
+    # LIST ALL HIDDEN ATTRIBUTES HERE
+    # Attribute _count: the number of copies of the level
+    # Invariant: _count is an int > 0
+    #
+    # Attribute _width: Width of the level in grid squares
+    # Invariant: _width is an int or float > 0
+    #
+    # Attribute _height: Height of the level in grid squares
+    # Invariant: _height is an int or float > 0
+    #
+    # Attribute _buffer: distance in grids that the obstacles are allowed to go offscreen
+    # Invariant: _buffer is a number (int or float)
+    #
+    # Attribute _random: the random generator for the starting positions of the lanes
+    # Invariant: _random is a NumPy Generator, or None if every copy starts the same
+    #
+    # Attribute _start: the center of a new frog
+    # Invariant: _start is an (x,y) tuple of floats
+    #
+    # Attribute _size: the width and height of the frog
+    # Invariant: _size is a (width,height) tuple of numbers > 0
+    #
+    # Attribute _hitboxes: the hitbox of the frog for each animation frame
+    # Invariant: _hitboxes is a NumPy array of shape (frames,4)
+    #
+    # Attribute _kinds: the type of each lane, by row
+    # Invariant: _kinds is an int array with an index into LANE_TYPES for each lane
+    #
+    # Attribute _speeds: the speed of each lane, by row
+    # Invariant: _speeds is a float array with one speed for each lane
+    #
+    # Attribute _tiles: the bounding box (l,t,r,b) of the background of each lane
+    # Invariant: _tiles is a float array of shape (lanes,4)
+    #
+    # Attributes _orows, _ospeed, _oleft, _oright, _ohalf, _otop, _obottom, _oopen:
+    # the row, speed, hitbox offsets toward the left and right edges, half width,
+    # top edge, bottom edge and opening flag of every obstacle in the level
+    # Invariant: each is an array with one entry per obstacle (in lane order)
+    #
+    # Attributes _road, _water, _hedge, _moving, _exits: the obstacles on roads, in
+    # water, in hedges, in moving lanes (roads and water), and the exits
+    # Invariant: each is an int array of indices into the obstacle arrays
+    #
+    # Attribute _hedgeExits: the exits in each hedge lane
+    # Invariant: _hedgeExits is a list of int arrays of indices into _exits
+    #
+    # Attribute _xs0: the starting position of every obstacle
+    # Invariant: _xs0 is a float array with one entry per obstacle
+    #
+    # Attribute _xs: the position of every obstacle in every copy
+    # Invariant: _xs is a float array of shape (_count,obstacles)
+    #
+    # Attributes _fx, _fy, _fangle, _fframe: the center, angle and animation frame of
+    # the frog in every copy
+    # Invariant: each is an array of length _count (the frame is an int array)
+    #
+    # Attribute _alive: whether each copy has a frog in play
+    # Invariant: _alive is a bool array of length _count
+    #
+    # Attributes _anim, _apos, _astart, _aend, _asteps: the hop in progress in every
+    # copy.  _anim is 0 if there is no hop, 1 for a vertical hop and 2 for a horizontal
+    # one.  The others are the position, start, end and speed of the hop.
+    # Invariant: each is an array of length _count
+    #
+    # Attribute _alive_anim: whether the hop in progress moves the frog in play (a hop
+    # keeps going after its frog dies, as in SimLevel, but moves nothing)
+    # Invariant: _alive_anim is a bool array of length _count
+    #
+    # Attribute _lives: the number of lives left in every copy
+    # Invariant: _lives is an int array with values in 0..FROG_LIVES
+    #
+    # Attribute _taken: whether each exit is taken in every copy
+    # Invariant: _taken is a bool array of shape (_count,exits)
+    #
+    # Attribute _exit: whether all exits are taken in every copy
+    # Invariant: _exit is a bool array of length _count
+    #
+    # Attribute _deaths: the number of deaths by each cause in every copy
+    # Invariant: _deaths is an int array of shape (_count,3), indexed by DEATH_ROAD,
+    # DEATH_WATER and DEATH_OFFSCREEN
+    #
+    # Attribute _saves: the number of frogs that reached an exit in every copy
+    # Invariant: _saves is an int array of length _count
+    #
+    # Attribute _time: the time in seconds that every copy has been played
+    # Invariant: _time is a float array of length _count
+
+    # GETTERS AND SETTERS
+    def getCount(self):
+        """
+        Returns: the number of copies of the level.
+        """
+        return self._count
+
+    def getWidth(self):
+        """
+        Returns: the width of the level in grid squares.
+        """
+        return self._width
+
+    def getHeight(self):
+        """
+        Returns: the height of the level in grid squares.
+        """
+        return self._height
+
+    def getFrogs(self):
+        """
+        Returns: an array of shape (count,2) with the center of the frog in each copy
+
+        The center is meaningless for a copy without a frog in play (see getAlive).
+        """
+        return numpy.stack((self._fx,self._fy),axis=1)
+
+    def getAlive(self):
+        """
+        Returns: a bool array that is True for each copy with a frog in play.
+        """
+        return self._alive.copy()
+
+    def getIdle(self):
+        """
+        Returns: a bool array that is True for each copy with a frog that can move
+        (a frog in play that is not hopping).
+        """
+        return self._alive & (self._anim == 0)
+
+    def getLives(self):
+        """
+        Returns: an int array with the number of lives left in each copy.
+        """
+        return self._lives.copy()
+
+    def getExits(self):
+        """
+        Returns: a bool array that is True for each copy with every exit occupied.
+        """
+        return self._exit.copy()
+
+    def getTaken(self):
+        """
+        Returns: a bool array of shape (count,exits) that is True for each taken exit.
+        """
+        return self._taken.copy()
+
+    def getObstacles(self):
+        """
+        Returns: an array of shape (count,obstacles) with the x coordinate of every
+        obstacle of the level in each copy (in the order of the level file).
+        """
+        return self._xs.copy()
+
+    def getDeaths(self):
+        """
+        Returns: an int array of shape (count,3) with the number of deaths by each
+        cause in each copy, indexed by DEATH_ROAD, DEATH_WATER and DEATH_OFFSCREEN.
+        """
+        return self._deaths.copy()
+
+    def getSaves(self):
+        """
+        Returns: an int array with the number of frogs that reached an exit in each copy.
+        """
+        return self._saves.copy()
+
+    def getTime(self):
+        """
+        Returns: a float array with the time in seconds that each copy has been played.
+        """
+        return self._time.copy()
+
+    def getDone(self):
+        """
+        Returns: a bool array that is True for each copy that is lost or won.
+        """
+        return (self._lives == 0) | (self._exit & ~self._alive)
+
+    def getWins(self):
+        """
+        Returns: a bool array that is True for each copy that is won.
+        """
+        return (self._lives > 0) & self._exit & ~self._alive
+
+    def getStates(self,precision=None):
+        """
+        Returns: an array of shape (count,n) with the state of the frog in each copy
+
+        A row has the center of the frog, the position, start and end of the hop in
+        progress, the angle and frame of the frog, whether it is in play, the kind and
+        speed of the hop, whether the hop moves the frog, whether every exit is taken
+        and the taken exits.  Two copies with the same row and the same
+        obstacle positions play on exactly the same way, even if their lives, deaths,
+        saves or times differ.
+
+        The values that cannot change how a copy plays on are 0 in its row, so that
+        more copies have the same row.  These are the frog without a frog in play, the
+        hop without a hop in progress, and the angle of a frog that is not hopping and
+        not on a road (only a road checks the angle, and a move sets it first).
+
+        If precision is not None, the positions (of the frog and of the hop) are
+        rounded to the nearest multiple of precision.  Copies with the same row then
+        only play on in about the same way.
+
+        Parameter precision: the precision of the positions in pixels
+        Precondition: precision is None or a number > 0
+        """
+        alive = self._alive
+        hop = self._anim != 0
+        road = self._findRows(self._fx,self._fy,alive,'road') >= 0
+        facing = alive & (hop | road)
+        points = numpy.column_stack((numpy.where(alive,self._fx,0),numpy.where(alive,self._fy,0),
+                                     numpy.where(hop,self._apos,0),numpy.where(hop,self._astart,0),
+                                     numpy.where(hop,self._aend,0)))
+        if not precision is None:
+            points = numpy.rint(points/precision)*precision
+        return numpy.column_stack((points,numpy.where(facing,self._fangle,0),
+                                   numpy.where(alive,self._fframe,0),alive,self._anim,
+                                   numpy.where(hop,self._asteps,0),hop & self._alive_anim,
+                                   self._exit,self._taken)).astype(float)
+
+    def select(self,index):
+        """
+        Returns: a new VecLevel with the given copies of this level
+
+        The new level has one copy for each entry of index, in the same state as the
+        copy of this level that it names.  A copy can be named more than once, so this
+        method can also duplicate copies (e.g. to try every action from the same state).
+
+        Parameter index: the copies to keep
+        Precondition: index is a non-empty sequence of ints in 0..count-1
+        """
+        index = numpy.asarray(index,dtype=int)
+        assert index.ndim == 1 and len(index) > 0, '%s is not a list of copies' % repr(index)
+        result = copy.copy(self)
+        result._count = len(index)
+        for name in ('_xs','_fx','_fy','_fangle','_fframe','_alive','_anim','_apos',
+                     '_astart','_aend','_asteps','_alive_anim','_lives','_taken','_exit',
+                     '_deaths','_saves','_time'):
+            setattr(result,name,getattr(self,name)[index])
+        return result
+
+    # INITIALIZER TO CREATE THE COPIES OF THE LEVEL
+    def __init__(self,json,object,count,seed=None):
+        """
+        Initializes count copies of a level.
+
+        If seed is None, every copy starts exactly like a SimLevel.  Otherwise, the
+        lanes of each copy are first run for a random time of up to VEC_WARMUP
+        seconds, so that the copies start with different obstacle positions.
+
+        Parameter json: level that is currently being played
+        Precondition: json is a dictionary for a valid level JSON
+
+        Parameter object: JSON file that contains additional information about
+        image files
+        Precondition: object is a dictionary (not for a level file)
+
+        Parameter count: the number of copies
+        Precondition: count is an int > 0
+
+        Parameter seed: the seed for the starting positions of the lanes
+        Precondition: seed is None or an int >= 0
+        """
+        assert numpy is not None, 'VecLevel requires NumPy'
+        assert type(count) == int and count > 0, '%s is not a positive int' % repr(count)
+        level = SimLevel(json,object)
+        self._count = count
+        self._width = level.getWidth()
+        self._height = level.getHeight()
+        self._buffer = json['offscreen']
+        self._random = None if seed is None else numpy.random.default_rng(seed)
+
+        frog = level.getFrog()
+        self._start = (frog.x,frog.y)
+        self._size = (frog.width,frog.height)
+        self._hitboxes = numpy.array(object['sprites']['frog']['hitboxes'])
+
+        lanes = level.getLanes()
+        self._kinds = numpy.array([LANE_TYPES.index(lane.getType()) for lane in lanes])
+        self._speeds = numpy.array([lane.getSpeed() for lane in lanes],dtype=float)
+        self._tiles = numpy.array([lane.getTile().bbox() for lane in lanes],dtype=float)
+
+        # The obstacles face left or right, so only the hitbox offsets along x differ
+        obstacles = []
+        for lane in lanes:
+            for obs in lane.getObstacles():
+                hit = obs.hitbox
+                (l,t,r,b) = obs.bbox()
+                if obs.angle % 360 == 180:
+                    offsets = (hit[2],hit[0])
+                else:
+                    offsets = (hit[0],hit[2])
+                obstacles.append((lane.getRow(),obs.x,lane.getSpeed(),offsets[0],offsets[1],
+                                  obs.width/2,t,b,obs.source == 'open.png'))
+        data = list(zip(*obstacles)) if obstacles else [()]*9
+        self._orows = numpy.array(data[0],dtype=int)
+        self._xs0 = numpy.array(data[1],dtype=float)
+        self._ospeed = numpy.array(data[2],dtype=float)
+        self._oleft = numpy.array(data[3],dtype=float)
+        self._oright = numpy.array(data[4],dtype=float)
+        self._ohalf = numpy.array(data[5],dtype=float)
+        self._otop = numpy.array(data[6],dtype=float)
+        self._obottom = numpy.array(data[7],dtype=float)
+        self._oopen = numpy.array(data[8],dtype=bool)
+
+        kinds = self._kinds[self._orows]
+        self._road = numpy.flatnonzero(kinds == LANE_TYPES.index('road'))
+        self._water = numpy.flatnonzero(kinds == LANE_TYPES.index('water'))
+        self._hedge = numpy.flatnonzero(kinds == LANE_TYPES.index('hedge'))
+        self._moving = numpy.union1d(self._road,self._water)
+        self._exits = self._hedge[~self._oopen[self._hedge]]
+        self._hedgeExits = []
+        for row in numpy.flatnonzero(self._kinds == LANE_TYPES.index('hedge')):
+            self._hedgeExits.append(numpy.flatnonzero(self._orows[self._exits] == row))
+
+        size = (count,)
+        self._xs = numpy.empty((count,len(self._xs0)))
+        self._fx = numpy.empty(size)
+        self._fy = numpy.empty(size)
+        self._fangle = numpy.empty(size)
+        self._fframe = numpy.empty(size,dtype=int)
+        self._alive = numpy.empty(size,dtype=bool)
+        self._anim = numpy.empty(size,dtype=int)
+        self._apos = numpy.empty(size)
+        self._astart = numpy.empty(size)
+        self._aend = numpy.empty(size)
+        self._asteps = numpy.empty(size)
+        self._alive_anim = numpy.empty(size,dtype=bool)
+        self._lives = numpy.empty(size,dtype=int)
+        self._taken = numpy.empty((count,len(self._exits)),dtype=bool)
+        self._exit = numpy.empty(size,dtype=bool)
+        self._deaths = numpy.empty((count,3),dtype=int)
+        self._saves = numpy.empty(size,dtype=int)
+        self._time = numpy.empty(size)
+        self.reset()
+
+    # METHODS TO RESET AND STEP THE COPIES
+    def reset(self,mask=None):
+        """
+        Restarts the given copies of the level.
+
+        Parameter mask: the copies to restart (None to restart every copy)
+        Precondition: mask is None or a bool array of length count
+        """
+        if mask is None:
+            mask = numpy.ones(self._count,dtype=bool)
+        mask = numpy.asarray(mask,dtype=bool)
+        assert mask.shape == (self._count,), '%s is not a mask of %s copies' % (repr(mask),self._count)
+
+        self._xs[mask] = self._xs0
+        self._fx[mask] = self._start[0]
+        self._fy[mask] = self._start[1]
+        self._fangle[mask] = FROG_NORTH
+        self._fframe[mask] = 0
+        self._alive[mask] = True
+        self._anim[mask] = 0
+        self._apos[mask] = 0
+        self._astart[mask] = 0
+        self._aend[mask] = GRID_SIZE
+        self._asteps[mask] = 0
+        self._alive_anim[mask] = False
+        self._lives[mask] = FROG_LIVES
+        self._taken[mask] = False
+        self._exit[mask] = False
+        self._deaths[mask] = 0
+        self._saves[mask] = 0
+        self._time[mask] = 0
+
+        if not self._random is None:
+            limit = int(VEC_WARMUP/SIMULATION_STEP)
+            steps = numpy.where(mask,self._random.integers(0,limit+1,size=self._count),0)
+            for step in range(steps.max()):
+                self._moveLanes(steps > step,SIMULATION_STEP)
+
+    def step(self,actions,dt):
+        """
+        Updates every copy of the level that is not done.
+
+        This is the vector form of SimLevel.update.  Each copy without a frog (and
+        that is not done) first gets a new frog at the start of the level.
+
+        Parameter actions: the action of each copy
+        Precondition: actions is a sequence of count ints, each an index into VEC_ACTIONS
+
+        Parameter dt: The time in seconds since last update
+        Precondition: dt is a number (int or float)
+        """
+        actions = numpy.asarray(actions)
+        assert actions.shape == (self._count,), '%s is not %s actions' % (repr(actions),self._count)
+        self._respawn()
+        active = ~self.getDone()
+
+        # Move the frogs with the logs that they are sitting on
+        (rows,safe) = self._checkWater(self._fx,self._fy,self._alive)
+        carry = active & (rows >= 0) & safe & (self._anim == 0)
+        spos = self._fx+self._speeds[rows]*dt
+        self._fx = numpy.where(carry,spos,self._fx)
+        self._killFrog(carry & ((spos <= 0) | (spos >= self._width*GRID_SIZE)),DEATH_OFFSCREEN)
+
+        # Continue the hops in progress, or start new ones
+        running = active & (self._anim != 0)
+        self._hop(running,dt)
+        self._move(active & ~running & self._alive,actions)
+
+        self._blueFrog(active)
+        self._frogWin(active)
+        self._moveLanes(active,dt)
+
+        (rows,squash) = self._checkRoad(self._fx,self._fy,self._fangle,self._fframe,self._alive)
+        self._killFrog(active & (rows >= 0) & squash,DEATH_ROAD)
+
+        (rows,safe) = self._checkWater(self._fx,self._fy,self._alive)
+        self._killFrog(active & (rows >= 0) & ~safe & (self._anim == 0),DEATH_WATER)
+
+        self._time = numpy.where(active,self._time+dt,self._time)
+
+    # HELPER METHODS
+    def _respawn(self):
+        """
+        Places a new frog at the start of every copy without one that is not done.
+        """
+        new = ~self._alive & ~self.getDone()
+        self._fx[new] = self._start[0]
+        self._fy[new] = self._start[1]
+        self._fangle[new] = FROG_NORTH
+        self._fframe[new] = 0
+        self._alive |= new
+
+    def _killFrog(self,mask,cause):
+        """
+        Removes the frog from play and takes away a life in the given copies.
+
+        Parameter mask: the copies whose frog dies
+        Precondition: mask is a bool array of length count
+
+        Parameter cause: the cause of death
+        Precondition: cause is one of DEATH_ROAD, DEATH_WATER or DEATH_OFFSCREEN
+        """
+        self._lives -= mask
+        self._alive &= ~mask
+        self._alive_anim &= ~mask
+        self._deaths[:,cause] += mask
+
+    def _hop(self,mask,dt):
+        """
+        Advances the hops in progress in the given copies.
+
+        This is the vector form of the tween from SimFrog.hop.
+
+        Parameter mask: the copies with a hop in progress
+        Precondition: mask is a bool array of length count
+
+        Parameter dt: The time in seconds since last update
+        Precondition: dt is a number (int or float)
+        """
+        pos = self._apos+self._asteps*dt
+        done = numpy.abs(pos-self._astart) >= GRID_SIZE
+        pos = numpy.where(done,self._aend,pos)
+        frac = (pos-self._astart)/(self._aend-self._astart)
+        size = len(FROG_HOP_FRAMES)
+        frame = numpy.array(FROG_HOP_FRAMES)[numpy.minimum((frac*size).astype(int),size-1)]
+
+        live = mask & self._alive_anim
+        self._fy = numpy.where(live & (self._anim == 1),pos,self._fy)
+        self._fx = numpy.where(live & (self._anim == 2),pos,self._fx)
+        self._fframe = numpy.where(live,frame.astype(int),self._fframe)
+        self._apos = numpy.where(mask,pos,self._apos)
+        self._anim = numpy.where(mask & done,0,self._anim)
+
+    def _move(self,mask,actions):
+        """
+        Turns the frogs in the given copies and starts their hops.
+
+        This is the vector form of the methods _moveUp, _moveDown, _moveLeft and
+        _moveRight in SimLevel.
+
+        Parameter mask: the copies with a frog that can move
+        Precondition: mask is a bool array of length count
+
+        Parameter actions: the action of each copy
+        Precondition: actions is an int array of length count
+        """
+        x = self._fx
+        y = self._fy
+        up = mask & (actions == 1)
+        down = mask & (actions == 2)
+        left = mask & (actions == 3)
+        right = mask & (actions == 4)
+        self._fangle = numpy.select([up,down,left,right],
+                                    [FROG_NORTH,FROG_SOUTH,FROG_WEST,FROG_EAST],self._fangle)
+
+        # The frog cannot hop into a hedge (except at a free exit) or a taken exit
+        up &= y+GRID_SIZE <= self._height*GRID_SIZE
+        (hedge,contain) = self._checkHedge(x,y+GRID_SIZE,self._fangle,self._fframe,self._alive)
+        (exits,taken,cells) = self._checkTaken(x,y+GRID_SIZE,self._alive)
+        up &= ~(hedge & ~contain) & ~(exits & taken)
+
+        # The frog can only hop through a hedge at an opening
+        down &= y-GRID_SIZE >= 0
+        (rows,opening) = self._checkOpening(x,y-GRID_SIZE,self._alive)
+        down &= (rows < 0) | opening
+        left &= x-GRID_SIZE >= 0
+        (rows,opening) = self._checkOpening(x-GRID_SIZE,y,self._alive)
+        left &= (rows < 0) | opening
+        right &= x+GRID_SIZE <= self._width*GRID_SIZE
+        (rows,opening) = self._checkOpening(x+GRID_SIZE,y,self._alive)
+        right &= (rows < 0) | opening
+
+        vertical = up | down
+        start = numpy.where(vertical,y,x)
+        end = numpy.select([up,down,left],[y+GRID_SIZE,y-GRID_SIZE,x-GRID_SIZE],x+GRID_SIZE)
+        hop = vertical | left | right
+        self._anim = numpy.where(hop,numpy.where(vertical,1,2),self._anim)
+        self._apos = numpy.where(hop,start,self._apos)
+        self._astart = numpy.where(hop,start,self._astart)
+        self._aend = numpy.where(hop,end,self._aend)
+        self._asteps = numpy.where(hop,(end-start)/FROG_SPEED,self._asteps)
+        self._alive_anim |= hop
+
+    def _blueFrog(self,mask):
+        """
+        Occupies the exits that the frogs have reached (if they are free).
+
+        Parameter mask: the copies to update
+        Precondition: mask is a bool array of length count
+        """
+        (hedge,contain) = self._checkHedge(self._fx,self._fy,self._fangle,self._fframe,self._alive)
+        (exits,taken,cells) = self._checkTaken(self._fx,self._fy,self._alive)
+        saved = mask & hedge & contain & exits & ~taken
+        self._taken |= cells & saved[:,None]
+        self._alive &= ~saved
+        self._alive_anim &= ~saved
+        self._saves += saved
+
+    def _frogWin(self,mask):
+        """
+        Checks if all exits are occupied in the given copies.
+
+        Parameter mask: the copies to update
+        Precondition: mask is a bool array of length count
+        """
+        win = numpy.ones(self._count,dtype=bool)
+        for exits in self._hedgeExits:
+            win &= self._taken[:,exits].all(axis=1)
+        self._exit |= mask & win
+
+    def _moveLanes(self,mask,dt):
+        """
+        Moves and wraps the obstacles of the roads and water in the given copies.
+
+        This is the same computation as SimLane.update.
+
+        Parameter mask: the copies to update
+        Precondition: mask is a bool array of length count
+
+        Parameter dt: The time in seconds since last update
+        Precondition: dt is a number (int or float)
+        """
+        width = self._width*GRID_SIZE
+        buffer_right = width + (self._buffer*GRID_SIZE)
+        buffer_left = 0 - (self._buffer*GRID_SIZE)
+
+        cols = self._moving
+        speed = self._ospeed[cols]*dt
+        xs = self._xs[:,cols]+speed
+        xs = numpy.where((speed > 0) & (xs >= buffer_right),buffer_left + (buffer_right-xs),xs)
+        xs = numpy.where((speed < 0) & (xs <= buffer_left),buffer_right - (xs-buffer_left),xs)
+        self._xs[:,cols] = numpy.where(mask[:,None],xs,self._xs[:,cols])
+
+    def _findRows(self,x,y,alive,kind):
+        """
+        Returns: an int array with the row of the lane of the given type that contains
+        each point, or -1 where there is no such lane (or no frog)
+
+        This is the vector form of SimLevel._findLane.
+
+        Parameter x: the x coordinate of each point
+        Precondition: x is a float array of length count
+
+        Parameter y: the y coordinate of each point
+        Precondition: y is a float array of length count
+
+        Parameter alive: whether each copy has a frog in play
+        Precondition: alive is a bool array of length count
+
+        Parameter kind: the lane type
+        Precondition: kind is one of the strings in LANE_TYPES
+        """
+        code = LANE_TYPES.index(kind)
+        size = len(self._kinds)
+        row = (y // GRID_SIZE).astype(int)
+        below = row-1
+        lower = (y == row*GRID_SIZE) & (below >= 0) & (below < size)
+        lower &= self._kinds[numpy.clip(below,0,size-1)] == code
+        here = (row >= 0) & (row < size) & (self._kinds[numpy.clip(row,0,size-1)] == code)
+        inside = alive & (x >= 0) & (x <= self._width*GRID_SIZE)
+        return numpy.where(inside,numpy.where(lower,below,numpy.where(here,row,-1)),-1)
+
+    def _contains(self,cols,rows,x,y):
+        """
+        Returns: a bool array of shape (count,len(cols)) that is True where an obstacle
+        in the given row contains the point of that copy
+
+        Parameter cols: the obstacles to check
+        Precondition: cols is an int array of obstacle indices
+
+        Parameter rows: the row of each copy
+        Precondition: rows is an int array of length count
+
+        Parameter x: the x coordinate of each point
+        Precondition: x is a float array of length count
+
+        Parameter y: the y coordinate of each point
+        Precondition: y is a float array of length count
+        """
+        xs = self._xs[:,cols]
+        l = xs+self._oleft[cols]-self._ohalf[cols]
+        r = xs-self._oright[cols]+self._ohalf[cols]
+        px = x[:,None]
+        py = y[:,None]
+        inside = (l <= px) & (px <= r) & (self._obottom[cols] <= py) & (py <= self._otop[cols])
+        return inside & (self._orows[cols] == rows[:,None])
+
+    def _frogBox(self,x,y,angle,frame):
+        """
+        Returns: the bounding box (l,t,r,b) of the frogs, as four float arrays
+
+        This is the same computation as SimObject.bbox.
+
+        Parameter x: the x coordinate of each frog
+        Precondition: x is a float array of length count
+
+        Parameter y: the y coordinate of each frog
+        Precondition: y is a float array of length count
+
+        Parameter angle: the angle of each frog
+        Precondition: angle is a float array of multiples of 90
+
+        Parameter frame: the animation frame of each frog
+        Precondition: frame is an int array of length count
+        """
+        (h0,h1,h2,h3) = self._hitboxes[frame].T
+        w = self._size[0]/2
+        h = self._size[1]/2
+        oangle = numpy.mod(angle,360)
+        turns = [oangle == 0,oangle == 90,oangle == 180]
+        l = numpy.select(turns,[x + h0 - w,x + h1 - h,x + h2 - w],x + h3 - h)
+        r = numpy.select(turns,[x - h2 + w,x - h3 + h,x - h0 + w],x - h1 + h)
+        t = numpy.select(turns,[y - h1 + h,y + h2 - w,y - h3 + h],y + h0 - w)
+        b = numpy.select(turns,[y + h3 - h,y - h0 + w,y + h1 - h],y - h2 + w)
+        return (l,t,r,b)
+
+    def _checkRoad(self,x,y,angle,frame,alive):
+        """
+        Returns: a pair (rows,squash) of arrays.  The first has the row of the road
+        under each frog (or -1) and the second is True where a car hits the frog.
+
+        Parameter x, y, angle, frame: the frogs, as in _frogBox
+        Precondition: these are arrays of length count
+
+        Parameter alive: whether each copy has a frog in play
+        Precondition: alive is a bool array of length count
+        """
+        rows = self._findRows(x,y,alive,'road')
+        cols = self._road
+        (l0,t0,r0,b0) = [value[:,None] for value in self._frogBox(x,y,angle,frame)]
+        xs = self._xs[:,cols]
+        l1 = xs+self._oleft[cols]-self._ohalf[cols]
+        r1 = xs-self._oright[cols]+self._ohalf[cols]
+        t1 = self._otop[cols]
+        b1 = self._obottom[cols]
+        isx = ((l1 <= l0) & (l0 <= r1)) | ((l0 <= l1) & (l1 <= r0))
+        isy = ((b1 <= b0) & (b0 <= t1)) | ((b0 <= b1) & (b1 <= t0))
+        squash = (isx & isy & (self._orows[cols] == rows[:,None])).any(axis=1)
+        return (rows,squash)
+
+    def _checkWater(self,x,y,alive):
+        """
+        Returns: a pair (rows,safe) of arrays.  The first has the row of the water under
+        each frog (or -1) and the second is True where the frog is on a log.
+
+        Parameter x, y: the center of each frog
+        Precondition: these are float arrays of length count
+
+        Parameter alive: whether each copy has a frog in play
+        Precondition: alive is a bool array of length count
+        """
+        rows = self._findRows(x,y,alive,'water')
+        return (rows,self._contains(self._water,rows,x,y).any(axis=1))
+
+    def _checkHedge(self,x,y,angle,frame,alive):
+        """
+        Returns: a pair (hedge,contain) of bool arrays.  The first is True where the
+        frog overlaps a hedge, and the second is True where its center is also in an
+        exit or opening.
+
+        Parameter x, y, angle, frame: the frogs, as in _frogBox
+        Precondition: these are arrays of length count
+
+        Parameter alive: whether each copy has a frog in play
+        Precondition: alive is a bool array of length count
+        """
+        rows = self._findRows(x,y,alive,'hedge')
+        (l0,t0,r0,b0) = self._frogBox(x,y,angle,frame)
+        (l1,t1,r1,b1) = self._tiles[numpy.maximum(rows,0)].T
+        isx = ((l1 <= l0) & (l0 <= r1)) | ((l0 <= l1) & (l1 <= r0))
+        isy = ((b1 <= b0) & (b0 <= t1)) | ((b0 <= b1) & (b1 <= t0))
+        hedge = (rows >= 0) & isx & isy
+        return (hedge,self._contains(self._hedge,rows,x,y).any(axis=1))
+
+    def _checkTaken(self,x,y,alive):
+        """
+        Returns: a triple (exits,taken,cells) of bool arrays.  The first is True where
+        the frog is in an exit, the second is True where that exit is taken, and the
+        third (of shape (count,exits)) is True for every exit containing the frog.
+
+        Parameter x, y: the center of each frog
+        Precondition: these are float arrays of length count
+
+        Parameter alive: whether each copy has a frog in play
+        Precondition: alive is a bool array of length count
+        """
+        rows = self._findRows(x,y,alive,'hedge')
+        cells = self._contains(self._exits,rows,x,y)
+        exits = cells.any(axis=1)
+        if len(self._exits) == 0:
+            return (exits,exits,cells)
+        first = numpy.argmax(cells,axis=1)
+        taken = exits & self._taken[numpy.arange(self._count),first]
+        return (exits,taken,cells)
+
+    def _checkOpening(self,x,y,alive):
+        """
+        Returns: a pair (rows,opening) of arrays.  The first has the row of the hedge
+        under each frog (or -1) and the second is True where an opening contains it.
+
+        Parameter x, y: the center of each frog
+        Precondition: these are float arrays of length count
+
+        Parameter alive: whether each copy has a frog in play
+        Precondition: alive is a bool array of length count
+        """
+        rows = self._findRows(x,y,alive,'hedge')
+        cells = self._contains(self._hedge,rows,x,y)
+        return (rows,(cells & self._oopen[self._hedge]).any(axis=1))
@@ -0,0 +1,578 @@
+"""
+Level solver for Froggit
+
+This module searches a level for the fastest way to fill every exit, or shows that
+there is none.  It is meant for checking levels (e.g. generated ones) before they
+ship, so that a level that cannot be won is rejected without anyone playing it.
+
+The search is over the state of the frog (its place, heading and hop in progress, and
+the exits taken) and the time.  The lanes do not depend on what the frog does, so every
+state reached at the same time sees the same obstacles.  Each lane moves at a constant
+speed, and comes back to where it started every time its obstacles cross the lane and
+the offscreen buffers.  So the obstacles of the whole level repeat with a period that is
+the least common multiple of the lane periods (see levelPeriod).  A state reached again
+at the same point of the period can do nothing new, and once no new states are left the
+level has been shown to have no solution.
+
+The states are the copies of a VecLevel (see simulation.py), so the search uses the
+rules of the game itself.  A frog tries every action as soon as it can move, and then
+again every tick (SOLVER_TICK seconds) while it waits.  Copies with their frogs within
+SOLVER_PRECISION pixels of each other (and otherwise in the same state) are merged, and
+frogs that die are dropped.  The first copy to fill every exit has the fastest solution,
+which is played again on a SimLevel to check it.  A solution is therefore exact, but it
+is only the fastest one up to the tick and the precision.  A level that needs a move at
+a more exact time or place can be searched with a smaller tick (down to SIMULATION_STEP)
+or precision (down to None), which is slower.
+
+The search is limited to solutions within a horizon (in seconds of game time).  A state
+is dropped once the time it has taken plus the least time it still needs to win (see
+_Search.leastTime) is over the horizon.  The function solveLevel searches again with a
+longer horizon until it finds a solution, or a search drops no states for the horizon.
+
+A proof that there is no solution assumes that the lanes repeat exactly, which is only
+true to within a few pixels (a lane wraps an obstacle as far past the buffer edge as it
+overshot, see SimLane.predict).  It also only covers the moves on the ticks, and one of
+each group of merged frogs.
+
+To solve levels from the command line, run
+
+    python solver.py JSON/easy1.json JSON/easy2.json
+
+Use the option --help to see the other options.
+
+# Michelle Ren Zhang [mr897]
+# 12.21.20
+"""
+from consts import *
+from simulation import *
+from levelfile import readLevel
+from schema import *
+import argparse
+import fractions
+import json
+import math
+import os.path
+import sys
+import time
+
+# The results of solveLevel
+SOLVER_WIN     = 'win'
+SOLVER_NONE    = 'none'
+SOLVER_TIMEOUT = 'timeout'
+
+# The precision (in units per pixel) of the frog states that are merged
+_STATE_SCALE = 1000
+
+# The factor by which solveLevel grows the horizon of each search
+_HORIZON_GROWTH = 1.1
+
+# The multiplier for the hash of a frog state (from 64-bit FNV)
+_HASH_PRIME = numpy.uint64(0x100000001b3) if numpy is not None else None
+
+
+def lanePeriod(json,i):
+    """
+    Returns: the time in seconds for the obstacles of a lane to come back to where they
+    started, as a Fraction
+
+    An obstacle travels the width of the level and both offscreen buffers before it
+    is where it started.  The result is 0 for a lane that does not move.
+
+    Parameter json: the level
+    Precondition: json is a dictionary for a valid level JSON
+
+    Parameter i: the index of the lane in the level file
+    Precondition: i is an int>=0
+    """
+    speed = json['lanes'][i].get('speed',0)
+    if speed == 0:
+        return fractions.Fraction(0)
+    span = (json['size'][0]+2*json['offscreen'])*GRID_SIZE
+    return fractions.Fraction(span).limit_denominator()/abs(fractions.Fraction(speed).limit_denominator())
+
+
+def levelPeriod(json):
+    """
+    Returns: the number of simulation steps before every lane of a level is back where
+    it started
+
+    This is the least common multiple of the lane periods (see lanePeriod), counted in
+    steps of SIMULATION_STEP.  The result is 1 if no lane moves.
+
+    Parameter json: the level
+    Precondition: json is a dictionary for a valid level JSON
+    """
+    step = fractions.Fraction(SIMULATION_STEP).limit_denominator()
+    result = 1
+    for i in range(len(json['lanes'])):
+        period = lanePeriod(json,i)
+        if period != 0:
+            # The lane repeats after every whole number of steps that is a multiple of it
+            steps = (period/step).numerator
+            result = result*steps//math.gcd(result,steps)
+    return result
+
+
+def solveLevel(json,object,budget=SOLVER_BUDGET,horizon=None,tick=SOLVER_TICK,
+               precision=SOLVER_PRECISION):
+    """
+    Returns: a dictionary with the fastest solution of a level
+
+    The dictionary has the keys 'result', 'time', 'actions', 'states', 'period' and
+    'search'.  The result is SOLVER_WIN if the level has a solution, SOLVER_NONE if it
+    has none (within the horizon, if there is one) and SOLVER_TIMEOUT if the search ran
+    out of time first.  For a win, time is the game time of the solution in seconds and
+    actions is the action (an index into VEC_ACTIONS) of every step of the solution.
+    Otherwise time is None and actions is empty.  The solution loses no lives.
+
+    The value of states is the number of states searched, period is the number of steps
+    after which the lanes repeat (see levelPeriod) and search is the wall clock time of
+    the search in seconds.
+
+    Without a horizon, the level is first searched with a horizon of the least time
+    that it could take.  The horizon grows by a tenth for each new search, until
+    there is a solution, or a search drops no states for the horizon (so there is no
+    solution at all).  A search with a short horizon drops most states early, so the
+    searches that fail cost much less than the last one.
+
+    Parameter json: the level to solve
+    Precondition: json is a dictionary for a valid level JSON
+
+    Parameter object: JSON file that contains additional information about
+    image files
+    Precondition: object is a dictionary (not for a level file)
+
+    Parameter budget: the longest time (in seconds of wall clock) to search
+    Precondition: budget is a number > 0
+
+    Parameter horizon: the longest game time (in seconds) of a solution
+    Precondition: horizon is None (no limit) or a number > 0
+
+    Parameter tick: the time (in seconds) between the moves that are tried
+    Precondition: tick is a number > 0 (rounded to a whole number of steps)
+
+    Parameter precision: the distance (in pixels) within which frogs are merged
+    Precondition: precision is None (only merge frogs in the same place) or a number > 0
+    """
+    assert numpy is not None, 'the solver requires NumPy'
+    clock = time.perf_counter()
+    search = _Search(json,object,round(tick/SIMULATION_STEP),precision,clock+budget)
+    if horizon is None:
+        limit = max(float(search.leastTime(search.getStart())[0]),FROG_SPEED)
+    else:
+        limit = horizon
+
+    states = 0
+    while True:
+        result = search.run(limit)
+        states += result['states']
+        if result['result'] != SOLVER_NONE or horizon is not None or result['pruned'] == 0:
+            break
+        limit *= _HORIZON_GROWTH
+
+    result['states'] = states
+    result['period'] = search.getPeriod()
+    result['search'] = time.perf_counter()-clock
+    del result['pruned']
+    return result
+
+
+def replayLevel(json,object,actions):
+    """
+    Returns: True if a list of actions wins a level without losing a life
+
+    The actions are played on a SimLevel, one per step of SIMULATION_STEP.  As in a
+    VecLevel, a new frog is placed at the start of the level as soon as the last one
+    is gone.
+
+    Parameter json: the level to play
+    Precondition: json is a dictionary for a valid level JSON
+
+    Parameter object: JSON file that contains additional information about
+    image files
+    Precondition: object is a dictionary (not for a level file)
+
+    Parameter actions: the action of every step
+    Precondition: actions is a list of ints, each an index into VEC_ACTIONS
+    """
+    level = SimLevel(json,object)
+    for action in actions:
+        if level.getFrog() is None and not level.getExit():
+            level.resetFrog()
+        keys = () if action == 0 else (VEC_ACTIONS[action],)
+        level.update(SimInput(keys),SIMULATION_STEP)
+    return level.getExit() and level.getLives() == FROG_LIVES
+
+
+def planMoves(actions):
+    """
+    Returns: the moves of a solution as a list of (seconds,move) pairs
+
+    The seconds are the game time at which each move is made, and the move is one of
+    'up', 'down', 'left' or 'right'.  The steps without a move are left out.
+
+    Parameter actions: the action of every step
+    Precondition: actions is a list of ints, each an index into VEC_ACTIONS
+    """
+    result = []
+    for pos in range(len(actions)):
+        if actions[pos] != 0:
+            result.append((pos*SIMULATION_STEP,VEC_ACTIONS[actions[pos]]))
+    return result
+
+
+# HELPER FUNCTIONS
+class _Search(object):
+    """
+    A class to search a level for its fastest solution.
+
+    A search keeps the level, the period of its lanes and the time that the search
+    must stop, and the method run searches up to a horizon.  The frontier of a search
+    is a VecLevel with one copy for each state reached at the current step.
+
+    A frog that is not hopping on a grass or hedge lane can wait there for as long as it
+    likes.  So a state of such a frog is only searched from the first time it is
+    reached (and for one period of the lanes after that, while the frog waits).  Any
+    later copy in the state could have waited there instead.  Every other state is
+    searched once for each phase of the lanes.
+    """
+    # Attribute _level: the level with one copy, before it is played
+    # Invariant: _level is a VecLevel with count 1
+    #
+    # Attribute _ticks: the number of steps between the moves that are tried
+    # Invariant: _ticks is an int > 0
+    #
+    # Attribute _period: the number of steps after which the lanes repeat
+    # Invariant: _period is an int > 0
+    #
+    # Attribute _precision: the distance (in pixels) within which frogs are merged
+    # Invariant: _precision is None or a number > 0
+    #
+    # Attribute _deadline: the wall clock time at which the search stops
+    # Invariant: _deadline is a number from time.perf_counter
+    #
+    # Attribute _exits: the hitbox of each exit
+    # Invariant: _exits is a float array of shape (exits,4) with the bounding box
+    # (l,t,r,b) of each exit, in the order of VecLevel.getTaken
+    #
+    # Attribute _start: the center of a new frog
+    # Invariant: _start is an (x,y) tuple of floats
+    #
+    # Attribute _across: the fastest that a frog can move across the level (in pixels
+    # per second), by hopping or on a log
+    # Invariant: _across is a number > 0
+    #
+    # Attribute _rest: whether a frog can wait in each lane
+    # Invariant: _rest is a bool array with one entry for each lane, by row
+
+    def getStart(self):
+        """
+        Returns: a VecLevel with one copy of the level before it is played.
+        """
+        return self._level.select([0])
+
+    def getPeriod(self):
+        """
+        Returns: the number of steps after which the lanes repeat.
+        """
+        return self._period
+
+    def __init__(self,json,object,ticks,precision,deadline):
+        """
+        Initializes a search of a level.
+
+        Parameter json: the level to solve
+        Precondition: json is a dictionary for a valid level JSON
+
+        Parameter object: JSON file that contains additional information about
+        image files
+        Precondition: object is a dictionary (not for a level file)
+
+        Parameter ticks: the number of steps between the moves that are tried
+        Precondition: ticks is an int (values below 1 are taken as 1)
+
+        Parameter precision: the distance (in pixels) within which frogs are merged
+        Precondition: precision is None or a number > 0
+
+        Parameter deadline: the wall clock time at which the search stops
+        Precondition: deadline is a number from time.perf_counter
+        """
+        self._level = VecLevel(json,object,1)
+        self._ticks = max(1,ticks)
+        self._precision = precision
+        self._period = levelPeriod(json)
+        self._deadline = deadline
+
+        level = SimLevel(json,object)
+        exits = []
+        self._across = GRID_SIZE/FROG_SPEED
+        for lane in level.getLanes():
+            if lane.getType() == 'hedge':
+                for obs in lane.getObstacles():
+                    if obs.source != 'open.png':
+                        exits.append(obs.bbox())
+            elif lane.getType() == 'water':
+                self._across = max(self._across,abs(lane.getSpeed()))
+        self._exits = numpy.array(exits,dtype=float).reshape(-1,4)
+        self._start = (level.getFrog().x,level.getFrog().y)
+        self._rest = numpy.array([data['type'] in ('grass','hedge') for data in json['lanes']])
+
+    def run(self,horizon):
+        """
+        Returns: a dictionary with the fastest solution within a horizon
+
+        The dictionary has the keys 'result', 'time', 'actions' and 'states' of
+        solveLevel, and 'pruned', the number of states dropped for the horizon.
+
+        Parameter horizon: the longest game time (in seconds) of a solution
+        Precondition: horizon is a number > 0
+        """
+        level = self.getStart()
+        hashes = self._hashes(level)
+        since = numpy.zeros(1,dtype=int)
+        resting = numpy.zeros(0,dtype=numpy.uint64)
+        seen = {}
+        parents = []
+        moves = []
+        states = 0
+        pruned = 0
+        step = 0
+        while time.perf_counter() < self._deadline:
+            (index,actions) = self._branch(level,step,since)
+            still = level.getIdle()[index] & (actions == 0)
+            level = level.select(index)
+            level.step(actions,SIMULATION_STEP)
+            step += 1
+
+            alive = level.getLives() == FROG_LIVES
+            wins = numpy.flatnonzero(alive & level.getWins())
+            if len(wins) > 0:
+                parents.append(index)
+                moves.append(actions)
+                return {'result':SOLVER_WIN,'time':step*SIMULATION_STEP,
+                        'actions':self._backtrack(parents,moves,int(wins[0])),
+                        'states':states,'pruned':pruned}
+
+            # A resting frog that waited keeps its place for up to a period
+            rest = self._resting(level)
+            parent = hashes[index]
+            hashes = self._hashes(level)
+            waited = rest & (hashes == parent)
+            since = numpy.where(still,since[index],step)
+            phase = seen.get(step % self._period,numpy.zeros(0,dtype=numpy.uint64))
+            new = numpy.where(rest,~numpy.isin(hashes,resting),~numpy.isin(hashes,phase))
+            keep = alive & (new | (waited & (step-since < self._period)))
+
+            # Merge the copies in the same state, preferring the ones that waited
+            keep = numpy.flatnonzero(keep)
+            keep = keep[numpy.argsort(~waited[keep],kind='stable')]
+            keep = numpy.sort(keep[numpy.unique(hashes[keep],return_index=True)[1]])
+            resting = numpy.union1d(resting,hashes[keep[rest[keep]]])
+            seen[step % self._period] = numpy.union1d(phase,hashes[keep[~rest[keep]]])
+
+            late = step*SIMULATION_STEP+self.leastTime(level)[keep] > horizon
+            pruned += int(late.sum())
+            keep = keep[~late]
+            if len(keep) == 0:
+                return {'result':SOLVER_NONE,'time':None,'actions':[],'states':states,
+                        'pruned':pruned}
+
+            states += len(keep)
+            parents.append(index[keep])
+            moves.append(actions[keep])
+            level = level.select(keep)
+            hashes = hashes[keep]
+            since = since[keep]
+
+        return {'result':SOLVER_TIMEOUT,'time':None,'actions':[],'states':states,
+                'pruned':pruned}
+
+    def leastTime(self,level):
+        """
+        Returns: a float array with the least game time that each copy needs to win
+
+        A frog reaches an exit once its center is in the hitbox of the exit.  It can
+        only move up or down by hopping, GRID_SIZE every FROG_SPEED seconds.  It moves
+        across by hopping or on a log, but never both at once and never while it hops
+        up or down.  Each free exit needs a frog, and every frog after the current one
+        comes from the start.
+
+        Parameter level: the copies being searched
+        Precondition: level is a VecLevel of this level
+        """
+        free = ~level.getTaken()
+        frogs = numpy.where(level.getAlive()[:,None],level.getFrogs(),self._start)
+        now = self._reach(frogs)
+        later = self._reach(numpy.array([self._start]))
+
+        # The current frog takes one free exit, and new frogs take the others
+        total = numpy.where(free,later,0).sum(axis=1)
+        gain = numpy.where(free,now-later,numpy.inf).min(axis=1,initial=numpy.inf)
+        return numpy.where(free.any(axis=1),total+gain,0)
+
+    # HELPER METHODS
+    def _reach(self,points):
+        """
+        Returns: an array of shape (points,exits) with the least time for a frog at each
+        point to reach each exit
+
+        Parameter points: the centers of the frogs
+        Precondition: points is a float array of shape (points,2)
+        """
+        x = points[:,0:1]
+        y = points[:,1:2]
+        (l,t,r,b) = self._exits.T
+        across = numpy.maximum(numpy.maximum(l-x,x-r),0)
+        up = numpy.maximum(numpy.maximum(b-y,y-t),0)
+        return up/(GRID_SIZE/FROG_SPEED)+across/self._across
+
+    def _branch(self,level,step,since):
+        """
+        Returns: the pair (index,actions) of the copies to play in the next step
+
+        Every frog that can move (or that is about to start) tries every action as
+        soon as it can, and then once every tick while it waits.  A resting frog that
+        has waited for a tick only tries the moves out of the grass and hedge lanes.  Any other move would only
+        reach a resting state later than it reached it before.  The copies are the
+        copies of level, repeated once for each action that they try.
+
+        Parameter level: the copies being searched
+        Precondition: level is a VecLevel of this level
+
+        Parameter step: the number of steps played
+        Precondition: step is an int >= 0
+
+        Parameter since: the step that the frog of each copy last moved (or started)
+        Precondition: since is an int array with one entry for each copy
+        """
+        tries = numpy.zeros((level.getCount(),len(VEC_ACTIONS)),dtype=bool)
+        tries[:,0] = True
+        ready = (level.getIdle() | ~level.getAlive()) & ((step-since) % self._ticks == 0)
+        tries[:,1:] = ready[:,None]
+
+        rows = (level.getFrogs()[:,1]//GRID_SIZE).astype(int)
+        rest = numpy.append(self._rest,False)
+        old = self._resting(level) & (step-since >= self._ticks)
+        tries[:,1] &= ~(old & rest[numpy.clip(rows+1,0,len(rest)-1)])
+        tries[:,2] &= ~(old & rest[numpy.clip(rows-1,-1,len(rest)-1)])
+        tries[:,3] &= ~old
+        tries[:,4] &= ~old
+        return numpy.nonzero(tries)
+
+    def _resting(self,level):
+        """
+        Returns: a bool array that is True for each copy with a frog that can wait
+
+        Parameter level: the copies being searched
+        Precondition: level is a VecLevel of this level
+        """
+        rows = (level.getFrogs()[:,1]//GRID_SIZE).astype(int)
+        rows = numpy.clip(rows,0,len(self._rest)-1)
+        return level.getIdle() & self._rest[rows]
+
+    def _hashes(self,level):
+        """
+        Returns: a uint64 array with a hash of the state of each copy
+
+        The positions in the states (see VecLevel.getStates) are rounded to the
+        precision of the search, and everything to 1/_STATE_SCALE of a pixel.
+
+        Parameter level: the copies being searched
+        Precondition: level is a VecLevel of this level
+        """
+        codes = numpy.rint(level.getStates(self._precision)*_STATE_SCALE).astype(numpy.int64).view(numpy.uint64)
+        result = numpy.zeros(len(codes),dtype=numpy.uint64)
+        for column in codes.T:
+            result = (result*_HASH_PRIME) ^ column
+        return result
+
+    def _backtrack(self,parents,moves,pos):
+        """
+        Returns: the actions that lead to a copy, from the first step
+
+        Parameter parents: the copy of the previous step that each copy came from, for
+        every step
+        Precondition: parents is a list of int arrays
+
+        Parameter moves: the action that made each copy, for every step
+        Precondition: moves is a list of int arrays (the same shapes as parents)
+
+        Parameter pos: the copy in the last step
+        Precondition: pos is an int index into parents[-1]
+        """
+        result = []
+        for step in range(len(parents)-1,-1,-1):
+            result.append(int(moves[step][pos]))
+            pos = int(parents[step][pos])
+        result.reverse()
+        return result
+
+
+def main():
+    """
+    Solves the levels named on the command line and prints the results.
+
+    The exit status is 0 if every level has a solution, and 1 otherwise (a level that
+    is invalid, has no solution or timed out).  A solution only counts if replaying its
+    actions in a SimLevel also wins the level, so a solution that is not reproduced
+    also gives the exit status 1.
+    """
+    parser = argparse.ArgumentParser(description='Finds the fastest solution of Froggit levels.')
+    parser.add_argument('levels',nargs='+',help='the level files (JSON or compiled)')
+    parser.add_argument('--budget',type=float,default=SOLVER_BUDGET,
+                        help='the longest time (in seconds) to search each level')
+    parser.add_argument('--horizon',type=float,default=None,
+                        help='the longest game time (in seconds) of a solution')
+    parser.add_argument('--tick',type=float,default=SOLVER_TICK,
+                        help='the time (in seconds) between the moves that are tried')
+    parser.add_argument('--precision',type=float,default=SOLVER_PRECISION,
+                        help='the distance (in pixels) within which frogs are merged')
+    parser.add_argument('--plan',action='store_true',help='print the moves of each solution')
+    args = parser.parse_args()
+
+    status = 0
+    for name in args.levels:
+        if name.lower().endswith(LEVEL_SUFFIX):
+            (level,object) = readLevel(name)
+        else:
+            with open(os.path.join(os.path.dirname(name),OBJECT_DATA)) as file:
+                object = json.load(file)
+            with open(name) as file:
+                level = json.load(file)
+            problems = checkObjects(object)
+            problems.extend(checkLevel(level,object if not problems else None))
+            if problems:
+                print('%s is not a valid level:' % name)
+                for problem in problems:
+                    print('    '+problem)
+                status = 1
+                continue
+
+        result = solveLevel(level,object,args.budget,args.horizon,args.tick,
+                            args.precision)
+        period = result['period']*SIMULATION_STEP
+        if result['result'] == SOLVER_WIN:
+            if replayLevel(level,object,result['actions']):
+                check = 'checked'
+            else:
+                check = 'NOT REPRODUCED'
+                status = 1
+            print('%s: won in %.2f seconds (%s, %d states, %.1f second period, searched in %.1f seconds)' %
+                  (name,result['time'],check,result['states'],period,result['search']))
+            if args.plan:
+                for (seconds,move) in planMoves(result['actions']):
+                    print('    %7.3f %s' % (seconds,move))
+        elif result['result'] == SOLVER_NONE:
+            print('%s: NO SOLUTION (%d states, %.1f second period, searched in %.1f seconds)' %
+                  (name,result['states'],period,result['search']))
+            status = 1
+        else:
+            print('%s: timed out after %.1f seconds (%d states)' %
+                  (name,result['search'],result['states']))
+            status = 1
+    sys.exit(status)
+
+
+# Application code
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Shared helpers for the Froggit unit tests
+
+Importing this module puts the main folder of the game on the module path, so the test
+modules can import the game modules (consts, simulation, ...) directly.
+
+# Michelle Ren Zhang [mr897]
+# 12.21.20
+"""
+import os.path
+import sys
+
+# The main folder of the game, which has the modules to test
+GAME_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if not GAME_FOLDER in sys.path:
+    sys.path.insert(0,GAME_FOLDER)
+
+from consts import *
+from schema import validateLevel
+import json
+
+# The folder with the levels
+JSON_FOLDER = os.path.join(GAME_FOLDER,'JSON')
+
+
+def loadObjects():
+    """
+    Returns: the dictionary in objects.json in the JSON folder
+    """
+    with open(os.path.join(JSON_FOLDER,OBJECT_DATA)) as file:
+        return json.load(file)
+
+
+def loadLevels():
+    """
+    Returns: the pair (levels,object) for the levels in the JSON folder
+
+    The value levels is a list of (name,json) pairs, sorted by name.  Files that are
+    not valid levels (such as the error*.json examples) are skipped.
+    """
+    object = loadObjects()
+    levels = []
+    for name in sorted(os.listdir(JSON_FOLDER)):
+        if name.endswith('.json') and name != OBJECT_DATA:
+            try:
+                with open(os.path.join(JSON_FOLDER,name)) as file:
+                    data = json.load(file)
+                validateLevel(data,object)
+                levels.append((name,data))
+            except ValueError:
+                pass # Not a valid level
+    return (levels,object)
@@ -0,0 +1,121 @@
+"""
+Unit tests for the compiled level files of Froggit
+
+These tests compile every level in the JSON folder, read the compiled file back, and
+check that readLevel returns the checked level JSON (and the parts of objects.json it
+uses), plus the occupancy grid of every hedge.
+
+Run these tests from the main folder with
+
+    python -m unittest discover tests
+
+# Michelle Ren Zhang [mr897]
+# 12.21.20
+"""
+from support import *
+from consts import *
+from simulation import *
+from levelfile import *
+import os.path
+import tempfile
+import unittest
+
+
+def expectedLevel(data,object):
+    """
+    Returns: the pair (json,object) that readLevel should return for a level
+
+    Parameter data: the level
+    Precondition: data is a dictionary for a valid level JSON
+
+    Parameter object: JSON file that contains additional information about
+    image files
+    Precondition: object is a dictionary (not for a level file)
+    """
+    level = {'version':data.get('version',1.0),'size':data['size'],'start':data['start'],
+             'offscreen':data['offscreen'],'lanes':[]}
+    images = {}
+    for i in range(len(data['lanes'])):
+        lane = {'type':data['lanes'][i]['type']}
+        if 'speed' in data['lanes'][i]:
+            lane['speed'] = data['lanes'][i]['speed']
+        items = data['lanes'][i].get('objects',[])
+        if items:
+            lane['objects'] = [{'type':item['type'],'position':item['position']} for item in items]
+        for item in items:
+            images[item['type']] = {'hitbox':object['images'][item['type']]['hitbox']}
+        if lane['type'] == 'hedge':
+            hedge = SimHedge(data,i,data['size'][0],object)
+            obstacles = hedge.getObstacles()
+            lane['cells'] = [[obstacles.index(obs) for obs in cell] for cell in hedge.getCells()]
+        level['lanes'].append(lane)
+
+    sprites = {}
+    for name in object['sprites']:
+        sprite = {'format':object['sprites'][name]['format']}
+        if 'hitboxes' in object['sprites'][name]:
+            sprite['hitboxes'] = object['sprites'][name]['hitboxes']
+        sprites[name] = sprite
+    return (level,{'images':images,'sprites':sprites})
+
+
+class LevelFileTest(unittest.TestCase):
+    """
+    Tests that a compiled level reads back as the level it was compiled from.
+    """
+
+    def setUp(self):
+        """
+        Loads the levels and makes a folder for the compiled files.
+        """
+        (self.levels,self.object) = loadLevels()
+        self.folder = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """
+        Deletes the compiled files.
+        """
+        self.folder.cleanup()
+
+    def test_roundtrip(self):
+        """
+        Tests that readLevel returns the level, objects and hedge cells of every level.
+        """
+        self.assertTrue(self.levels)
+        for (name,data) in self.levels:
+            with self.subTest(level=name):
+                path = os.path.join(self.folder.name,os.path.splitext(name)[0]+LEVEL_SUFFIX)
+                writeLevel(path,data,self.object)
+                (level,object) = readLevel(path)
+                (json,expected) = expectedLevel(data,self.object)
+                self.assertEqual(level,json)
+                self.assertEqual(object,expected)
+
+    def test_cells(self):
+        """
+        Tests that the hedges of a compiled level use the cells that were read.
+        """
+        for (name,data) in self.levels:
+            with self.subTest(level=name):
+                path = os.path.join(self.folder.name,os.path.splitext(name)[0]+LEVEL_SUFFIX)
+                writeLevel(path,data,self.object)
+                (level,object) = readLevel(path)
+                for i in range(len(level['lanes'])):
+                    if level['lanes'][i]['type'] == 'hedge':
+                        hedge = SimHedge(level,i,level['size'][0],object)
+                        obstacles = hedge.getObstacles()
+                        cells = [[obstacles.index(obs) for obs in cell] for cell in hedge.getCells()]
+                        self.assertEqual(cells,level['lanes'][i]['cells'])
+
+    def test_invalid(self):
+        """
+        Tests that readLevel rejects a file that is not a compiled level.
+        """
+        path = os.path.join(self.folder.name,'bad'+LEVEL_SUFFIX)
+        with open(path,'wb') as file:
+            file.write(b'NOPE'+bytes(16))
+        self.assertRaises(ValueError,readLevel,path)
+
+
+if __name__ == '__main__':
+    unittest.main()
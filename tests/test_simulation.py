@@ -0,0 +1,271 @@
+"""
+Unit tests for the headless simulation of Froggit
+
+The lanes predict where their obstacles will be without stepping.  These tests check
+the predictions of every lane against the lane after it is stepped.
+
+VecLevel is a second, vectorized copy of the rules of SimLevel.  These tests play every
+level in the JSON folder with both, giving each copy of a VecLevel the same actions as
+its own SimLevel, and check that they agree after every step: the frogs, the lives (and
+so the deaths), the exits and the obstacles.  The actions come from a seeded player that
+mostly avoids dying, so that the frogs also cross the water and reach the exits.
+
+Run these tests from the main folder with
+
+    python -m unittest discover tests
+
+# Michelle Ren Zhang [mr897]
+# 12.21.20
+"""
+from support import *
+from consts import *
+from simulation import *
+import copy
+import random
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# The number of copies of each level to play
+PARITY_COPIES = 2
+
+# The number of steps to play each level
+PARITY_STEPS = 3000
+
+# The chance that a copy presses a random key, even if it is not safe
+PARITY_RANDOM = 0.1
+
+# The time (in seconds) a key must keep the frog alive to be safe
+PARITY_LOOKAHEAD = 0.4
+
+# The numbers of updates after which the predictions of the lanes are checked
+PREDICT_UPDATES = (1,60,600,3000)
+
+
+def isSafe(level,key,dt):
+    """
+    Returns: True if the frog of level survives PARITY_LOOKAHEAD seconds after key
+
+    The level itself is not changed, as a copy of it is played instead.
+
+    Parameter level: the level to check
+    Precondition: level is a SimLevel with a frog
+
+    Parameter key: the key to press
+    Precondition: key is None or one of 'up', 'down', 'left' and 'right'
+
+    Parameter dt: the time step
+    Precondition: dt is a number > 0
+    """
+    level = copy.deepcopy(level)
+    input = SimInput([key] if key else [])
+    lives = level.getLives()
+    for step in range(int(PARITY_LOOKAHEAD/dt)+1):
+        level.update(input,dt)
+        input.press()
+        if level.getLives() < lives:
+            return False
+        if level.getFrog() is None:
+            return True
+    return True
+
+
+def chooseKey(level,rng,dt):
+    """
+    Returns: the key to press in level (or None), chosen with rng
+
+    The key is usually the first safe one of 'up', no key, 'left', 'right' and 'down',
+    so that the frog gets across roads and water to the exits.  Sometimes it is random,
+    so that the frog also dies in every way.
+
+    Parameter level: the level to play
+    Precondition: level is a SimLevel with a frog
+
+    Parameter rng: the random generator
+    Precondition: rng is a random.Random
+
+    Parameter dt: the time step
+    Precondition: dt is a number > 0
+    """
+    if level.isBusy():
+        return None
+    if rng.random() < PARITY_RANDOM:
+        return rng.choice(VEC_ACTIONS)
+    keys = ['up',None,'left','right','down']
+    if rng.random() < 0.5:
+        keys[2:4] = ['right','left']
+    for key in keys:
+        if isSafe(level,key,dt):
+            return key
+    return None
+
+
+def takenExits(level):
+    """
+    Returns: the number of exits taken in a SimLevel
+
+    Parameter level: the level to check
+    Precondition: level is a SimLevel
+    """
+    return sum(len(lane.getTaken()) for lane in level.getLanes() if lane.getType() == 'hedge')
+
+
+class PredictTest(unittest.TestCase):
+    """
+    Tests that the predictions of a lane match the lane after it is stepped.
+    """
+
+    def setUp(self):
+        """
+        Loads the levels to check.
+        """
+        (self.levels,self.object) = loadLevels()
+
+    def test_predict(self):
+        """
+        Tests predict and occupants against stepping the lanes of every level.
+        """
+        self.assertTrue(self.levels)
+        for (name,data) in self.levels:
+            with self.subTest(level=name):
+                level = SimLevel(data,self.object)
+                predicted = {}
+                for updates in PREDICT_UPDATES:
+                    time = updates*SIMULATION_STEP
+                    predicted[updates] = ([lane.predict(time) for lane in level.getLanes()],
+                                          [[level.getOccupants(column,row,time)
+                                            for column in range(level.getWidth())]
+                                           for row in range(level.getHeight())])
+                done = 0
+                for updates in PREDICT_UPDATES:
+                    for step in range(updates-done):
+                        for lane in level.getLanes():
+                            if lane.getType() in ('road','water'):
+                                lane.update(SIMULATION_STEP)
+                    done = updates
+                    self._compare(level,predicted[updates],'%s, %d updates' % (name,updates))
+
+    def _compare(self,level,predicted,where):
+        """
+        Checks that the predictions for a level match the level.
+
+        Parameter level: the level after stepping its lanes
+        Precondition: level is a SimLevel
+
+        Parameter predicted: the pair (xs,occupants) predicted for the level, with the
+        positions of the obstacles of each lane and the occupants of each square
+        Precondition: predicted is a pair of lists, indexed by row
+
+        Parameter where: the level and updates, for the failure message
+        Precondition: where is a string
+        """
+        (xs,occupants) = predicted
+        for row in range(level.getHeight()):
+            lane = level.getLanes()[row]
+            actual = [obs.x for obs in lane.getObstacles()]
+            for pos in range(len(actual)):
+                self.assertEqual(xs[row][pos],actual[pos],
+                                 '%s, row %d, obstacle %d' % (where,row,pos))
+            for column in range(level.getWidth()):
+                self.assertEqual(set(map(id,occupants[row][column])),
+                                 set(map(id,level.getOccupants(column,row))),
+                                 '%s, square (%d,%d)' % (where,column,row))
+
+
+@unittest.skipIf(numpy is None,'VecLevel requires NumPy')
+class ParityTest(unittest.TestCase):
+    """
+    Tests that VecLevel stays in the same state as SimLevel for the same actions.
+    """
+
+    def setUp(self):
+        """
+        Loads the levels to play.
+        """
+        (self.levels,self.object) = loadLevels()
+
+    def test_levels(self):
+        """
+        Tests every level with seeded random actions and time steps.
+        """
+        self.assertTrue(self.levels)
+        deaths = 0
+        saves = 0
+        for (name,data) in self.levels:
+            with self.subTest(level=name):
+                vec = self._play(name,data)
+                deaths += int(vec.getDeaths().sum())
+                saves += int(vec.getSaves().sum())
+        self.assertGreater(deaths,0)
+        self.assertGreater(saves,0)
+
+    def _play(self,name,data):
+        """
+        Returns: the VecLevel after playing a level with both classes
+
+        Parameter name: the file name of the level (the seed of the actions)
+        Precondition: name is a string
+
+        Parameter data: the level to play
+        Precondition: data is a dictionary for a valid level JSON
+        """
+        rng = random.Random(name)
+        vec = VecLevel(data,self.object,PARITY_COPIES)
+        sims = [SimLevel(data,self.object) for pos in range(PARITY_COPIES)]
+        for step in range(PARITY_STEPS):
+            dt = rng.choice((1/120,1/60,1/30))
+            done = vec.getDone()
+            actions = [0]*PARITY_COPIES
+            for pos in range(PARITY_COPIES):
+                if done[pos]:
+                    continue
+                level = sims[pos]
+                if level.getFrog() is None:
+                    level.resetFrog()
+                key = chooseKey(level,rng,dt)
+                actions[pos] = VEC_ACTIONS.index(key)
+                level.update(SimInput([key] if key else []),dt)
+            vec.step(actions,dt)
+            self._compare(vec,sims,'%s, step %d' % (name,step))
+            if vec.getDone().all():
+                break
+        return vec
+
+    def _compare(self,vec,sims,where):
+        """
+        Checks that every copy of vec is in the same state as its SimLevel.
+
+        Parameter vec: the vectorized level
+        Precondition: vec is a VecLevel
+
+        Parameter sims: the levels that match the copies of vec
+        Precondition: sims is a list of SimLevel, one for each copy of vec
+
+        Parameter where: the level and step, for the failure message
+        Precondition: where is a string
+        """
+        frogs = vec.getFrogs()
+        alive = vec.getAlive()
+        lives = vec.getLives()
+        exits = vec.getExits()
+        taken = vec.getTaken()
+        obstacles = vec.getObstacles()
+        for pos in range(len(sims)):
+            level = sims[pos]
+            message = '%s, copy %d' % (where,pos)
+            frog = level.getFrog()
+            self.assertEqual(bool(alive[pos]),frog is not None,message)
+            if frog is not None:
+                self.assertEqual((frogs[pos,0],frogs[pos,1]),(frog.x,frog.y),message)
+            self.assertEqual(lives[pos],level.getLives(),message)
+            self.assertEqual(bool(exits[pos]),level.getExit(),message)
+            self.assertEqual(int(taken[pos].sum()),takenExits(level),message)
+            xs = [obs.x for lane in level.getLanes() for obs in lane.getObstacles()]
+            self.assertEqual(list(obstacles[pos]),xs,message)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+Unit tests for the Froggit level solver
+
+These tests check the lane periods against the lane predictions, and solve easy1.json:
+the solution must be won again by replayLevel, and the same level with its first road
+blocked by parked cars must have no solution.
+
+Run these tests from the main folder with
+
+    python -m unittest discover tests
+
+# Michelle Ren Zhang [mr897]
+# 12.21.20
+"""
+from support import *
+from consts import *
+from simulation import *
+from solver import *
+import copy
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# The level to solve
+SOLVER_LEVEL = 'easy1.json'
+
+# The horizon (in seconds) for the level that cannot be won (easy1.json is won in less)
+BLOCKED_HORIZON = 10
+
+
+def aroundLane(distance,span):
+    """
+    Returns: how far an obstacle has gone around a lane to move a distance
+
+    An obstacle at one buffer edge of a lane is at the same place in its cycle as at
+    the other edge, so the result is the distance modulo the span, made closer to 0
+    than to the span if it only differs from 0 by rounding.
+
+    Parameter distance: the distance moved
+    Precondition: distance is a number
+
+    Parameter span: the width of the lane plus both offscreen buffers
+    Precondition: span is a number > 0
+    """
+    result = distance % span
+    return 0 if abs(result-span) < 1e-6 else result
+
+
+def blockedLevel(data):
+    """
+    Returns: a copy of a level with its first road blocked by parked cars
+
+    The road does not move, and has a car in every column, so no frog can cross it.
+
+    Parameter data: the level
+    Precondition: data is a dictionary for a valid level JSON with a road
+    """
+    result = copy.deepcopy(data)
+    row = [lane['type'] for lane in result['lanes']].index('road')
+    cars = [{'type':'car1','position':column} for column in range(result['size'][0])]
+    result['lanes'][row] = {'type':'road','objects':cars}
+    return result
+
+
+class PeriodTest(unittest.TestCase):
+    """
+    Tests that the lanes are back where they started after the level period.
+
+    The lanes only repeat exactly if they move continuously, since a lane that is
+    stepped wraps an obstacle as far back from the buffer edge as it overshot.  So the
+    positions after the period come from SimLane.predict with no time step.
+    """
+
+    def setUp(self):
+        """
+        Loads the levels to check.
+        """
+        (self.levels,self.object) = loadLevels()
+
+    def test_period(self):
+        """
+        Tests levelPeriod against the continuous positions of every lane.
+        """
+        self.assertTrue(self.levels)
+        for (name,data) in self.levels:
+            with self.subTest(level=name):
+                level = SimLevel(data,self.object)
+                span = (data['size'][0]+2*data['offscreen'])*GRID_SIZE
+                time = levelPeriod(data)*SIMULATION_STEP
+                for row in range(len(level.getLanes())):
+                    lane = level.getLanes()[row]
+                    start = [obs.x for obs in lane.getObstacles()]
+                    for (x,first) in zip(lane.predict(time,None),start):
+                        self.assertAlmostEqual(aroundLane(x-first,span),0,6)
+
+                    # Each obstacle is half way around the lane after half its period
+                    period = float(lanePeriod(data,row))
+                    for (x,first) in zip(lane.predict(period,None),start):
+                        self.assertAlmostEqual(aroundLane(x-first,span),0,6)
+                    if period != 0:
+                        for (x,first) in zip(lane.predict(period/2,None),start):
+                            self.assertAlmostEqual(aroundLane(x-first,span),span/2,6)
+
+
+@unittest.skipIf(numpy is None,'the solver requires NumPy')
+class SolverTest(unittest.TestCase):
+    """
+    Tests the solutions of easy1.json, with and without a blocked road.
+    """
+
+    def setUp(self):
+        """
+        Loads the level to solve.
+        """
+        (levels,self.object) = loadLevels()
+        self.level = dict(levels)[SOLVER_LEVEL]
+
+    def test_win(self):
+        """
+        Tests that the level is won, and that the solution is won again by replaying it.
+        """
+        result = solveLevel(self.level,self.object)
+        self.assertEqual(result['result'],SOLVER_WIN)
+        self.assertLessEqual(result['time'],BLOCKED_HORIZON)
+        self.assertTrue(replayLevel(self.level,self.object,result['actions']))
+        self.assertFalse(replayLevel(self.level,self.object,result['actions'][:-1]))
+
+    def test_blocked(self):
+        """
+        Tests that the level with a blocked road has no solution.
+        """
+        data = blockedLevel(self.level)
+        validateLevel(data,self.object)
+        result = solveLevel(data,self.object,horizon=BLOCKED_HORIZON)
+        self.assertEqual(result['result'],SOLVER_NONE)
+        self.assertIsNone(result['time'])
+        self.assertEqual(result['actions'],[])
+
+
+if __name__ == '__main__':
+    unittest.main()